@@ -0,0 +1,2 @@
+# Performance benchmarks. Run them from the repository root, e.g.
+#   python -m benchmarks.suite --sizes 10000 100000
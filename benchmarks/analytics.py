@@ -0,0 +1,66 @@
+# analytics.py
+# Load, refresh and compute times of database/analytics.py (the Insights
+# view) on synthetic histories. The target is under a second for every metric
+# over 1M sessions once they are loaded.
+#
+#   python -m benchmarks.analytics --sizes 100000 1000000
+import argparse
+import json
+import os
+import tempfile
+
+from benchmarks.suite import database_for, timed
+from database import analytics
+from database.db_manager import DatabaseManager
+
+
+def measure(path, repeat):
+    db = DatabaseManager(path, day_cache_size=0)
+    # As at app startup; open rows left behind would be re-read on every refresh
+    db.recover_orphans()
+    load = timed(lambda: analytics.SessionArrays.load(db), max(1, repeat // 5))
+    arrays = analytics.SessionArrays.load(db)
+
+    # What reopening the view costs after a session ended
+    session_id = db.start_session('focus', 25 * 60)
+    db.end_session(session_id, True)
+    refresh = timed(lambda: arrays.refresh(db), repeat)
+    db.close()
+
+    results = {'sessions': len(arrays), 'load': load, 'refresh': refresh}
+    for name, metric in (
+        ('streaks', analytics.streaks),
+        ('heatmap', analytics.heatmap),
+        ('rolling_averages', analytics.rolling_averages),
+        ('completion_rates', analytics.completion_rates),
+        ('break_focus_ratio', analytics.break_focus_ratio),
+        ('summarize', analytics.summarize),
+    ):
+        results[name] = timed(lambda: metric(arrays), repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the NumPy session analytics')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'pomodoro-bench'))
+    parser.add_argument('--output', help="write the JSON results here")
+    args = parser.parse_args()
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    results = {}
+    for size in args.sizes:
+        result = measure(database_for(size, args.data_dir), args.repeat)
+        results[str(size)] = result
+        print(f"{size:>8} sessions: load {result['load']['median_ms']:.0f} ms, "
+              f"refresh {result['refresh']['median_ms']:.1f} ms, "
+              f"all metrics {result['summarize']['median_ms']:.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as stream:
+            json.dump(results, stream, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# chart_backends.py
+# Startup and memory cost of the native QPainter chart versus the optional
+# matplotlib one. Each backend runs in a fresh interpreter so imports and RSS
+# are not shared between them.
+#
+#   python -m benchmarks.chart_backends
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+def _rss_mb():
+    # Resident set size of this process, from /proc where available
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        import resource
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss / 2**20 if sys.platform == 'darwin' else maxrss / 2**10
+
+
+def measure(backend):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.environ['POMO_CHART_BACKEND'] = backend
+
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    baseline = _rss_mb()
+
+    started = time.perf_counter()
+    from components.bar_chart import create_bar_chart
+    chart = create_bar_chart(ylabel='Focus Time (minutes)', grid=True)
+    chart.resize(800, 500)
+    chart.setBars([f"Oct {day}\nMon" for day in range(12, 19)], [0, 25, 130, 60, 0, 250, 45])
+    chart.grab()
+    first_render = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for frame in range(20):
+        chart.setBars([f"Oct {day}\nMon" for day in range(12, 19)], [frame, 25, 130, 60, 0, 250, 45])
+        chart.grab()
+    refresh = (time.perf_counter() - started) / 20
+
+    result = {
+        'backend': backend,
+        'first_render_ms': first_render * 1000,
+        'refresh_ms': refresh * 1000,
+        'rss_added_mb': _rss_mb() - baseline,
+    }
+    app.quit()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare chart backends')
+    parser.add_argument('--backend', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.backend:
+        print(json.dumps(measure(args.backend)))
+        return
+
+    for backend in ('native', 'matplotlib'):
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.chart_backends', '--backend', backend],
+            capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        result = json.loads(output)
+        print(f"{backend:>10}: first render {result['first_render_ms']:.0f} ms, "
+              f"refresh {result['refresh_ms']:.1f} ms, "
+              f"+{result['rss_added_mb']:.1f} MB RSS")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# chart_refresh.py
+# Refresh latency of the matplotlib stats chart: rebuilding the figure on every
+# update (the old updateStats) versus updating the existing artists in place.
+#
+#   python -m benchmarks.chart_refresh
+import argparse
+import os
+import sys
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time matplotlib chart refreshes')
+    parser.add_argument('--updates', type=int, default=50)
+    parser.add_argument('--bars', type=int, default=7)
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt6.QtWidgets import QApplication
+    from components.matplotlib_chart import MatplotlibBarChart
+
+    app = QApplication(sys.argv)
+    labels = [f"Day {index}" for index in range(args.bars)]
+
+    def values(update):
+        # Today's bar grows by a session at a time, like after each completed pomodoro
+        return [25 * (index + 1) for index in range(args.bars - 1)] + [25 * (update % 8)]
+
+    def run(full_rebuild):
+        chart = MatplotlibBarChart(ylabel='Minutes', grid=True)
+        chart.resize(800, 500)
+        chart.show()
+        chart.setBars(labels, values(0))
+        app.processEvents()
+
+        started = time.perf_counter()
+        for update in range(1, args.updates + 1):
+            if full_rebuild:
+                chart._build(labels, values(update))
+                chart.draw()
+            else:
+                chart.setBars(labels, values(update))
+            app.processEvents()
+        elapsed = (time.perf_counter() - started) / args.updates
+        chart.close()
+        return elapsed * 1000
+
+    before = run(full_rebuild=True)
+    after = run(full_rebuild=False)
+    print(f"{args.updates} updates of {args.bars} bars")
+    print(f"  full rebuild: {before:.1f} ms/update")
+    print(f"  in place:     {after:.1f} ms/update ({after / before:.0%} of a full redraw)")
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
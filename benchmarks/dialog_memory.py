@@ -0,0 +1,69 @@
+# dialog_memory.py
+# Opens the weekly stats dialog hundreds of times and reports how much RSS grows,
+# to check that the dialog and its chart are reused rather than accumulated.
+#
+#   POMO_CHART_BACKEND=matplotlib python -m benchmarks.dialog_memory --opens 300
+import argparse
+import gc
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+from benchmarks.chart_backends import _rss_mb
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure RSS while reopening the weekly stats dialog')
+    parser.add_argument('--opens', type=int, default=300)
+    parser.add_argument('--max-growth-mb', type=float, default=10.0)
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt6.QtWidgets import QApplication
+    from components.stats_widget import StatsWidget
+    from database.db_manager import DatabaseManager
+
+    app = QApplication(sys.argv)
+    repo_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        db = DatabaseManager()
+        stats = StatsWidget(db)
+
+        today = date.today()
+
+        def open_weekly():
+            # What show_weekly_stats does, minus the blocking exec()
+            dialog = stats.updateRangeDialog(
+                "Weekly Focus Time", today - timedelta(days=6), today, 'day',
+                lambda day: f"{day.strftime('%b %d')}\n{day.strftime('%a')}"
+            )
+            dialog.show()
+            app.processEvents()
+            dialog.hide()
+            app.processEvents()
+
+        # Warm up so caches, fonts and the first figure are allocated
+        for _ in range(10):
+            open_weekly()
+        gc.collect()
+        baseline = _rss_mb()
+
+        for _ in range(args.opens):
+            open_weekly()
+        gc.collect()
+        growth = _rss_mb() - baseline
+
+        db.close()
+        os.chdir(repo_dir)
+
+    backend = os.environ.get('POMO_CHART_BACKEND', 'native')
+    print(f"{backend}: {args.opens} opens, RSS grew {growth:.1f} MB")
+    app.quit()
+    if growth > args.max_growth_mb:
+        sys.exit(f"RSS grew more than {args.max_growth_mb} MB")
+
+
+if __name__ == '__main__':
+    main()
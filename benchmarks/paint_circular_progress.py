@@ -0,0 +1,57 @@
+# paint_circular_progress.py
+# Per-frame paint cost of CircularProgressBar with its background cache warm
+# versus rebuilt on every frame (the old behaviour), at several sizes.
+#
+#   python -m benchmarks.paint_circular_progress --scale 2
+import argparse
+import os
+import sys
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time CircularProgressBar frames')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[300, 800, 1600])
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--scale', default='1', help='device pixel ratio to emulate (QT_SCALE_FACTOR)')
+    args = parser.parse_args()
+
+    # Must be set before Qt is initialised
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.environ['QT_SCALE_FACTOR'] = args.scale
+
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtGui import QImage
+    from components.circular_progress import CircularProgressBar
+
+    app = QApplication(sys.argv)
+
+    def run(size, cached):
+        widget = CircularProgressBar()
+        widget.resize(size, size)
+        widget.setGoalText("Finish the chapter draft")
+        dpr = widget.devicePixelRatioF()
+        image = QImage(round(size * dpr), round(size * dpr), QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+
+        started = time.perf_counter()
+        for frame in range(args.frames):
+            remaining = args.frames - frame
+            widget.setProgress(frame / args.frames)
+            widget.setTimerText(f"{remaining // 60:02d}:{remaining % 60:02d}")
+            if not cached:
+                widget.invalidateCache()
+            widget.render(image)
+        return (time.perf_counter() - started) / args.frames * 1000
+
+    print(f"scale {args.scale}, {args.frames} frames")
+    for size in args.sizes:
+        uncached = run(size, cached=False)
+        cached = run(size, cached=True)
+        print(f"  {size}px: uncached {uncached:.2f} ms/frame, cached {cached:.2f} ms/frame "
+              f"({uncached / cached:.1f}x)")
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
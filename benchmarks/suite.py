@@ -0,0 +1,195 @@
+# suite.py
+# Times the app's hot paths against synthetic histories of several sizes and
+# emits the results as JSON, so runs on different commits can be compared.
+#
+#   python -m benchmarks.suite --sizes 10000 100000 1000000 --output before.json
+#   python -m benchmarks.suite --baseline before.json
+#
+# Generated databases are kept in --data-dir and reused by later runs; each
+# run works on a copy, so they stay the same size.
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from benchmarks.synthetic_history import generate
+from database.db_manager import DatabaseManager
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def timed(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        'median_ms': statistics.median(samples),
+        'min_ms': min(samples),
+        'max_ms': max(samples),
+        'runs': repeat,
+    }
+
+
+def database_for(size, data_dir):
+    path = os.path.join(data_dir, f'history-{size}.db')
+    if not os.path.exists(path):
+        started = time.perf_counter()
+        generate(path, size)
+        print(f"Generated {size} sessions in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return path
+
+
+def copy_database(path, directory):
+    # The benchmarks write (end_session, orphan recovery at startup), so they
+    # run on a copy; the backup API copies it consistently, WAL and all
+    copy = os.path.join(directory, os.path.basename(path))
+    source, target = sqlite3.connect(path), sqlite3.connect(copy)
+    try:
+        source.backup(target)
+    finally:
+        source.close()
+        target.close()
+    return copy
+
+
+def bench_reads(db, repeat, suffix=''):
+    past_day = date.today() - timedelta(days=100)
+    return {
+        f'get_today_stats{suffix}': timed(db.get_today_stats, repeat),
+        f'get_historical_data{suffix}': timed(db.get_historical_data, repeat),
+        f'get_stats_for_date{suffix}': timed(lambda: db.get_stats_for_date(past_day), repeat),
+    }
+
+
+def bench_database(path, repeat):
+    # The *_warm reads are answered from the day cache; the plain ones go to
+    # SQLite every time, so they catch query regressions
+    warm = DatabaseManager(path)
+    results = bench_reads(warm, repeat, '_warm')
+    warm.close()
+
+    db = DatabaseManager(path, day_cache_size=0)
+    results.update(bench_reads(db, repeat))
+
+    # end_session only queues the write; end_session_commit waits for it to land
+    session_ids = iter([db.start_session('focus', 1500) for _ in range(2 * repeat)])
+    db.flush()
+    results['end_session'] = timed(lambda: db.end_session(next(session_ids), True), repeat)
+    db.flush()
+
+    def end_and_commit():
+        db.end_session(next(session_ids), True)
+        db.flush()
+    results['end_session_commit'] = timed(end_and_commit, repeat)
+    db.close()
+    return results
+
+
+def bench_stats_widget(app, path, repeat):
+    from components.stats_widget import StatsWidget
+    db = DatabaseManager(path)
+    stats = StatsWidget(db)
+    stats.resize(800, 600)
+
+    def update_and_render():
+        stats.updateStats()
+        stats.grab()
+    update_and_render()
+    result = timed(update_and_render, repeat)
+    stats.deleteLater()
+    app.processEvents()
+    db.close()
+    return result
+
+
+def bench_cold_start(path, repeat):
+    # Wall time of `main.py --startup-time` in a fresh interpreter, which
+    # includes imports and exits once the window is up
+    env = dict(os.environ, POMO_DB_PATH=path)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    command = [sys.executable, os.path.join(REPO_DIR, 'main.py'), '--startup-time']
+    try:
+        return timed(lambda: subprocess.run(
+            command, cwd=REPO_DIR, env=env, capture_output=True, check=True, timeout=60
+        ), repeat)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        lines = (e.stderr or b'').decode(errors='replace').strip().splitlines()
+        return {'error': lines[-1] if lines else str(e)}
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    for size, benchmarks in results['sizes'].items():
+        for name, result in benchmarks.items():
+            before = baseline.get('sizes', {}).get(size, {}).get(name, {})
+            if 'median_ms' not in result or 'median_ms' not in before:
+                continue
+            change = result['median_ms'] / before['median_ms'] - 1 if before['median_ms'] else 0
+            print(f"{size:>8} {name:<22} {before['median_ms']:9.3f} -> "
+                  f"{result['median_ms']:9.3f} ms ({change:+.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the pomodoro hot paths')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--startup-repeat', type=int, default=3)
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'pomodoro-bench'))
+    parser.add_argument('--output', help="write the JSON results here instead of stdout")
+    parser.add_argument('--baseline', help="JSON results of an earlier run to compare against")
+    parser.add_argument('--skip-startup', action='store_true')
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    results = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': {},
+    }
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory(dir=args.data_dir) as scratch:
+            path = copy_database(database_for(size, args.data_dir), scratch)
+            benchmarks = bench_database(path, args.repeat)
+            benchmarks['StatsWidget.updateStats'] = bench_stats_widget(app, path, args.repeat)
+            if not args.skip_startup:
+                benchmarks['main.py cold start'] = bench_cold_start(path, args.startup_repeat)
+        results['sizes'][str(size)] = benchmarks
+    app.quit()
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as stream:
+            stream.write(output + '\n')
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as stream:
+            compare(results, json.load(stream))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# synthetic_history.py
+# Builds a realistic pomodoro.db of any size: alternating focus sessions and
+# breaks spread over several years of days, some abandoned early, and a few
+# orphans (started, never ended) like the ones a crash leaves behind.
+#
+#   python -m benchmarks.synthetic_history history.db --sessions 100000
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+from database.connection import connect
+from database.db_manager import DatabaseManager
+
+INSERT_BATCH = 10000
+
+
+def iter_sessions(sessions, days, orphan_rate=0.002, completion_rate=0.8, seed=1):
+    # Yields session rows (without session_id) oldest first, ending today, so the
+    # today/historical readers have something to find
+    rng = random.Random(seed)
+    per_day, extra = divmod(sessions, days)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    for day_index in range(days):
+        count = per_day + (1 if day_index < extra else 0)
+        if not count:
+            continue
+        day = today - timedelta(days=days - 1 - day_index)
+        day_text = day.strftime('%Y-%m-%d')
+        # Sessions start between 06:00 and 23:00, evenly spaced with some jitter
+        spacing = 17 * 3600 // count
+        start = int(day.timestamp()) + 6 * 3600
+        for index in range(count):
+            session_type = 'focus' if index % 2 == 0 else 'break'
+            duration = (25 if session_type == 'focus' else 5) * 60
+            start_time = start + index * spacing + rng.randrange(max(1, spacing // 4))
+            if rng.random() < orphan_rate:
+                heartbeat = start_time + rng.randrange(duration)
+                yield (start_time, None, duration, session_type, None, day_text, heartbeat)
+                continue
+            completed = rng.random() < completion_rate
+            length = duration if completed else rng.randrange(60, duration)
+            end_time = start_time + length
+            yield (start_time, end_time, duration, session_type, int(completed), day_text, end_time)
+
+
+def generate(path, sessions, days=3 * 365, seed=1):
+    # Creates the schema through DatabaseManager, bulk-inserts the sessions and
+    # rebuilds the daily_focus rollup. Returns the number of rows written.
+    if os.path.exists(path):
+        raise FileExistsError(f"{path} already exists")
+    DatabaseManager(path).close()
+    conn = connect(path)
+    cursor = conn.cursor()
+    rows = iter_sessions(sessions, days, seed=seed)
+    written = 0
+    while True:
+        batch = [row for _, row in zip(range(INSERT_BATCH), rows)]
+        if not batch:
+            break
+        cursor.executemany('''
+            INSERT INTO sessions
+                (start_time, end_time, duration, session_type, completed_status, day, heartbeat)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', batch)
+        written += len(batch)
+    DatabaseManager._write_rebuild_daily_focus(cursor)
+    conn.commit()
+    cursor.execute('ANALYZE')
+    conn.close()
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic session history database')
+    parser.add_argument('path')
+    parser.add_argument('--sessions', type=int, default=100000)
+    parser.add_argument('--days', type=int, default=3 * 365)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    written = generate(args.path, args.sessions, args.days, args.seed)
+    print(f"Wrote {written} sessions over {args.days} days to {args.path} "
+          f"in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+# theme_resize.py
+# Resize, page switch and re-polish cost of the main window themed by the
+# palette + PomodoroStyle (components/theme.py) versus the universal `*`
+# stylesheet it replaced. Qt styles are application-wide, so each theme is
+# measured in its own process.
+#
+#   python -m benchmarks.theme_resize --repeat 200
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.suite import REPO_DIR, timed
+
+# PomodoroTimer.getStyleSheet() and the StatsWidget stylesheet, as they were
+LEGACY_WINDOW_STYLESHEET = """
+    * { font-family: 'SF Compact Display Regular'; }
+    QMainWindow { background-color: #000000; }
+    QWidget { background-color: #000000; color: #E0E0E0; }
+    QPushButton {
+        font-family: 'SF Compact Display Light'; background-color: #1E1E1E;
+        border: 1px solid #E0E0E0; padding: 5px; min-width: 70px; font-size: 13px;
+    }
+    QPushButton:hover { background-color: #2E2E2E; }
+    QPushButton#presetButton {
+        font-family: 'SF Pro Display', Arial; background-color: #2E2E2E;
+        border: 2px solid #4CAF50; border-radius: 15px; padding: 10px;
+        min-width: 100px; font-weight: bold; font-size: 14px;
+    }
+    QPushButton#controlButton {
+        border-radius: 15px; padding: 8px; min-width: 80px; font-weight: bold; font-size: 13px;
+    }
+    QPushButton#controlButton[buttonType="start"] { background-color: #2E2E2E; border: 2px solid #4CAF50; color: #4CAF50; }
+    QPushButton#controlButton[buttonType="start"]:hover { background-color: #4CAF50; color: white; }
+    QPushButton#controlButton[buttonType="pause"] { background-color: #2E2E2E; border: 2px solid #FFA500; color: #FFA500; }
+    QPushButton#controlButton[buttonType="pause"]:hover { background-color: #FFA500; color: white; }
+    QPushButton#controlButton[buttonType="stop"] { background-color: #2E2E2E; border: 2px solid #FF4444; color: #FF4444; }
+    QPushButton#controlButton[buttonType="stop"]:hover { background-color: #FF4444; color: white; }
+    QPushButton#controlButton:pressed { padding: 10px; }
+    QSlider::groove:horizontal {
+        border: 1px solid #4CAF50; background: #2E2E2E; height: 10px; border-radius: 5px; margin: 2px 0;
+    }
+    QSlider::handle:horizontal {
+        background: #4CAF50; border: none; width: 18px; height: 18px; margin: -6px 0; border-radius: 9px;
+    }
+    QSlider::handle:horizontal:hover { background: #45a049; }
+    QSlider::sub-page:horizontal { background: #4CAF50; border-radius: 5px; }
+    QSlider::add-page:horizontal { background: #2E2E2E; border-radius: 5px; }
+    QLabel { color: #E0E0E0; font-size: 13px; padding: 0 5px; }
+"""
+LEGACY_STATS_STYLESHEET = """
+    QWidget { background-color: #1E1E1E; }
+    QLabel { color: #E0E0E0; font-size: 16px; padding: 10px; }
+    QLabel#headerLabel { font-size: 24px; font-weight: bold; padding: 20px 10px; }
+    QLabel#statsLabel {
+        font-size: 18px; background-color: #2E2E2E; border-radius: 10px; padding: 15px; margin: 5px 10px;
+    }
+"""
+
+SIZES = [(347, 749), (420, 800), (600, 900), (347, 600)]
+
+
+def measure(mode, repeat):
+    from PyQt6.QtWidgets import QApplication, QWidget
+    from components import theme
+    app = QApplication(sys.argv)
+    if mode == 'stylesheet':
+        theme.apply = lambda app=None: None
+    from pomodoro_app import PomodoroTimer
+
+    window = PomodoroTimer()
+    stats = window.ensureStatsPage()
+    if mode == 'stylesheet':
+        window.setStyleSheet(LEGACY_WINDOW_STYLESHEET)
+        stats.setStyleSheet(LEGACY_STATS_STYLESHEET)
+    window.show()
+    app.processEvents()
+
+    sizes = iter(SIZES * repeat)
+
+    def resize():
+        window.resize(*next(sizes))
+        app.processEvents()
+        window.repaint()
+
+    pages = iter([0, 1] * repeat)
+
+    def switch_page():
+        window.stacked_widget.setCurrentIndex(next(pages))
+        app.processEvents()
+        window.repaint()
+
+    widgets = [window] + window.findChildren(QWidget)
+
+    def repolish():
+        for widget in widgets:
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+        app.processEvents()
+        window.repaint()
+
+    results = {
+        'resize': timed(resize, repeat),
+        'switch_page': timed(switch_page, repeat),
+        'repolish': timed(repolish, max(1, repeat // 10)),
+        'widgets': len(widgets),
+    }
+    window.quitApp()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time resizes and re-polishes of the themed window')
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--output', help="write the JSON results here")
+    parser.add_argument('--mode', choices=['theme', 'stylesheet'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    if args.mode:
+        # A child run: one theme, results as JSON on stdout
+        print(json.dumps(measure(args.mode, args.repeat)))
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, POMO_DB_PATH=os.path.join(tmp, 'theme.db'))
+        for mode in ('stylesheet', 'theme'):
+            completed = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.theme_resize', '--mode', mode,
+                 '--repeat', str(args.repeat)],
+                cwd=REPO_DIR, env=env, capture_output=True, text=True, check=True
+            )
+            results[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    for name in ('resize', 'switch_page', 'repolish'):
+        before = results['stylesheet'][name]['median_ms']
+        after = results['theme'][name]['median_ms']
+        print(f"{name:<12} stylesheet {before:8.2f} ms   theme {after:8.2f} ms "
+              f"({after / before:.0%})")
+
+    if args.output:
+        with open(args.output, 'w') as stream:
+            json.dump(results, stream, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# timestamp_format.py
+# Compares the old datetime-text sessions format with the epoch-seconds + day
+# column format on a large synthetic database.
+#
+#   python benchmarks/timestamp_format.py --sessions 500000
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+TEXT_SCHEMA = '''
+    CREATE TABLE sessions (
+        session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        start_time TIMESTAMP,
+        end_time TIMESTAMP,
+        duration INTEGER,
+        session_type TEXT,
+        completed_status BOOLEAN
+    )
+'''
+
+EPOCH_SCHEMA = '''
+    CREATE TABLE sessions (
+        session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        start_time INTEGER,
+        end_time INTEGER,
+        duration INTEGER,
+        session_type TEXT,
+        completed_status BOOLEAN,
+        day TEXT
+    )
+'''
+
+# The per-day aggregate each format needs to answer "focus minutes per day"
+TEXT_QUERY = '''
+    SELECT date(start_time), COUNT(*),
+        SUM(CAST((strftime('%s', end_time) - strftime('%s', start_time))/60 AS INTEGER))
+    FROM sessions
+    WHERE completed_status = 1 AND session_type = 'focus' AND end_time IS NOT NULL
+    GROUP BY date(start_time)
+'''
+
+EPOCH_QUERY = '''
+    SELECT day, COUNT(*), SUM((end_time - start_time) / 60)
+    FROM sessions
+    WHERE completed_status = 1 AND session_type = 'focus' AND end_time IS NOT NULL
+    GROUP BY day
+'''
+
+
+def generate_sessions(count, seed=0):
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(minutes=40 * count)
+    for _ in range(count):
+        start += timedelta(minutes=rng.randint(5, 75))
+        minutes = rng.choice((5, 25, 50))
+        end = start + timedelta(minutes=minutes, seconds=rng.randint(0, 59))
+        yield start, end, minutes * 60, rng.choice(('focus', 'focus', 'break')), 1
+
+
+def build(path, schema, rows):
+    conn = sqlite3.connect(path)
+    conn.execute(schema)
+    conn.executemany(
+        'INSERT INTO sessions (start_time, end_time, duration, session_type, completed_status'
+        + (', day) VALUES (?, ?, ?, ?, ?, ?)' if 'day TEXT' in schema else ') VALUES (?, ?, ?, ?, ?)'),
+        rows
+    )
+    conn.commit()
+    conn.execute('VACUUM')
+    return conn
+
+
+def best_of(conn, query, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(query).fetchall()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare datetime-text and epoch-seconds session storage'
+    )
+    parser.add_argument('--sessions', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    sessions = list(generate_sessions(args.sessions))
+    text_rows = [(str(s), str(e), d, t, c) for s, e, d, t, c in sessions]
+    epoch_rows = [
+        (int(s.timestamp()), int(e.timestamp()), d, t, c, s.strftime('%Y-%m-%d'))
+        for s, e, d, t, c in sessions
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, 'text.db')
+        epoch_path = os.path.join(tmp, 'epoch.db')
+        text_conn = build(text_path, TEXT_SCHEMA, text_rows)
+        epoch_conn = build(epoch_path, EPOCH_SCHEMA, epoch_rows)
+
+        # Same days and session counts (minutes can differ only across DST changes)
+        text_days = [row[:2] for row in text_conn.execute(TEXT_QUERY)]
+        epoch_days = [row[:2] for row in epoch_conn.execute(EPOCH_QUERY)]
+        assert text_days == epoch_days
+
+        text_time = best_of(text_conn, TEXT_QUERY, args.repeat)
+        epoch_time = best_of(epoch_conn, EPOCH_QUERY, args.repeat)
+        text_size = os.path.getsize(text_path)
+        epoch_size = os.path.getsize(epoch_path)
+        text_conn.close()
+        epoch_conn.close()
+
+    print(f"{args.sessions} sessions")
+    print(f"  per-day aggregate: text {text_time * 1000:.1f} ms, "
+          f"epoch {epoch_time * 1000:.1f} ms ({text_time / epoch_time:.1f}x)")
+    print(f"  file size:         text {text_size / 1024:.0f} KiB, "
+          f"epoch {epoch_size / 1024:.0f} KiB ({epoch_size / text_size:.0%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QRectF, QPointF, QSize
+from PyQt6.QtGui import QPainter, QColor, QPen, QFontMetricsF
+import math
+import os
+import instrumentation
+
+BACKGROUND_COLOR = QColor("#1E1E1E")
+PLOT_COLOR = QColor("#2E2E2E")
+TEXT_COLOR = QColor("#E0E0E0")
+BAR_COLOR = QColor(76, 175, 80, 178)  # #4CAF50 at 70% opacity
+GRID_COLOR = QColor(224, 224, 224, 51)
+
+
+def create_bar_chart(title="", ylabel="", grid=False, value_format=str, parent=None):
+    # The native chart is the default; POMO_CHART_BACKEND=matplotlib switches to
+    # the optional matplotlib renderer when it is installed
+    if os.environ.get('POMO_CHART_BACKEND', 'native') == 'matplotlib':
+        try:
+            from components.matplotlib_chart import MatplotlibBarChart
+            return MatplotlibBarChart(title, ylabel, grid, value_format, parent)
+        except ImportError:
+            print("matplotlib is not installed, using the native chart")
+    return BarChart(title, ylabel, grid, value_format, parent)
+
+
+class BarChart(QWidget):
+    # Lightweight bar chart drawn with QPainter: bars, value labels above them,
+    # multi-line category labels, a y axis with round ticks and an optional grid
+    def __init__(self, title="", ylabel="", grid=False, value_format=str, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.ylabel = ylabel
+        self.grid = grid
+        self.value_format = value_format
+        self.labels = []
+        self.values = []
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def sizeHint(self):
+        return QSize(400, 300)
+
+    def setBars(self, labels, values):
+        labels = list(labels)
+        values = list(values)
+        if labels == self.labels and values == self.values:
+            return
+        self.labels = labels
+        self.values = values
+        self.update()
+
+    @staticmethod
+    def _niceTicks(maximum, count=5):
+        # Round tick step (1, 2 or 5 x 10^n) covering 0..maximum
+        if maximum <= 0:
+            return [0, 1]
+        raw_step = maximum / count
+        magnitude = 10 ** math.floor(math.log10(raw_step))
+        step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw_step)
+        top = math.ceil(maximum / step) * step
+        return [i * step for i in range(int(round(top / step)) + 1)]
+
+    @instrumentation.timed('paint: BarChart')
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), BACKGROUND_COLOR)
+
+        font = self.font()
+        metrics = QFontMetricsF(font)
+        line_height = metrics.height()
+        title_font = self.font()
+        title_font.setPointSizeF(font.pointSizeF() * 1.4)
+        title_metrics = QFontMetricsF(title_font)
+
+        # A little headroom so the tallest bar's value label stays inside the plot
+        ticks = self._niceTicks(max(self.values, default=0) * 1.05)
+        tick_width = max(metrics.horizontalAdvance(f"{tick:g}") for tick in ticks)
+        label_lines = max((label.count("\n") + 1 for label in self.labels), default=1)
+
+        # Plot area, leaving room for the title, axis label, ticks and category labels
+        left = 10 + (line_height + 6 if self.ylabel else 0) + tick_width + 8
+        top = 10 + (title_metrics.height() + 12 if self.title else 0) + line_height
+        right = self.width() - 10
+        bottom = self.height() - 10 - label_lines * line_height - 6
+        plot = QRectF(left, top, max(1.0, right - left), max(1.0, bottom - top))
+        painter.fillRect(plot, PLOT_COLOR)
+
+        if self.title:
+            painter.setFont(title_font)
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(QRectF(0, 10, self.width(), title_metrics.height()),
+                             Qt.AlignmentFlag.AlignCenter, self.title)
+            painter.setFont(font)
+
+        if self.ylabel:
+            painter.save()
+            painter.setPen(TEXT_COLOR)
+            painter.translate(10, plot.center().y())
+            painter.rotate(-90)
+            painter.drawText(QRectF(-plot.height() / 2, 0, plot.height(), line_height),
+                             Qt.AlignmentFlag.AlignCenter, self.ylabel)
+            painter.restore()
+
+        # Y ticks and optional dashed grid
+        top_value = ticks[-1]
+        def y_for(value):
+            return plot.bottom() - plot.height() * value / top_value
+
+        for tick in ticks:
+            y = y_for(tick)
+            if self.grid:
+                grid_pen = QPen(GRID_COLOR)
+                grid_pen.setStyle(Qt.PenStyle.DashLine)
+                painter.setPen(grid_pen)
+                painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(TEXT_COLOR)
+            painter.drawLine(QPointF(plot.left() - 4, y), QPointF(plot.left(), y))
+            painter.drawText(QRectF(0, y - line_height / 2, plot.left() - 8, line_height),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             f"{tick:g}")
+
+        # Bars, value labels and category labels
+        if self.values:
+            slot = plot.width() / len(self.values)
+            bar_width = slot * 0.8
+            for index, (label, value) in enumerate(zip(self.labels, self.values)):
+                center = plot.left() + slot * (index + 0.5)
+                bar_top = y_for(value)
+                painter.fillRect(QRectF(center - bar_width / 2, bar_top,
+                                        bar_width, plot.bottom() - bar_top), BAR_COLOR)
+                painter.setPen(TEXT_COLOR)
+                painter.drawText(QRectF(center - slot / 2, bar_top - line_height, slot, line_height),
+                                 Qt.AlignmentFlag.AlignCenter, self.value_format(value))
+                painter.drawText(QRectF(center - slot / 2, plot.bottom() + 6,
+                                        slot, label_lines * line_height),
+                                 Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, label)
+
+        # Left and bottom axis lines
+        painter.setPen(TEXT_COLOR)
+        painter.drawLine(plot.bottomLeft(), plot.topLeft())
+        painter.drawLine(plot.bottomLeft(), plot.bottomRight())
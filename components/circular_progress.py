@@ -1,9 +1,13 @@
 from PyQt6.QtWidgets import QWidget, QSizePolicy
 from PyQt6.QtCore import Qt, QRect, QSize
-from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QFontDatabase
+from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QFontMetrics, QPixmap, QRegion
 import os
+import instrumentation
 
 class CircularProgressBar(QWidget):
+    MARGIN = 10
+    RING_WIDTH = 5
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.progress = 0
@@ -18,6 +22,14 @@ class CircularProgressBar(QWidget):
         )
         self.ny_font_family = os.environ.get('POMO_NY_FONT_FAMILY', 'Arial')
 
+        # The background ring and goal text only change on resize or goal change,
+        # so they are rendered once into a pixmap; fonts and metrics are cached
+        # per widget size alongside it
+        self._cache = None
+        self._cache_key = None
+        self._timer_font = None
+        self._timer_text_rect = QRect()
+
     def hasHeightForWidth(self):
         return True
 
@@ -37,58 +49,114 @@ class CircularProgressBar(QWidget):
             side,
             side
         )
+        self.invalidateCache()
         super().resizeEvent(event)
 
     def setProgress(self, value):
+        if value == self.progress:
+            return
         self.progress = value
-        self.update()
+        # Only the ring band can change
+        self.update(self._ringRegion())
 
     def setTimerText(self, text):
+        if text == self.timer_text:
+            return
         self.timer_text = text
-        self.update()
+        self._ensureCache()
+        self.update(self._timer_text_rect)
 
     def setGoalText(self, text):
+        if text == self.goal_text:
+            return
         self.goal_text = text
+        self.invalidateCache()
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def invalidateCache(self):
+        self._cache = None
+        self._cache_key = None
 
-        # Draw circle
-        pen = QPen(QColor("#454545"))
-        pen.setWidth(5)
-        painter.setPen(pen)
+    def _circleRect(self):
+        margin = self.MARGIN
+        return QRect(margin, margin, self.width() - 2*margin, self.height() - 2*margin)
+
+    def _ringRegion(self):
+        # Band around the circle, wide enough for the pen and antialiasing
+        pad = self.RING_WIDTH
+        rect = self._circleRect()
+        outer = QRegion(rect.adjusted(-pad, -pad, pad, pad), QRegion.RegionType.Ellipse)
+        inner = QRegion(rect.adjusted(pad, pad, -pad, -pad), QRegion.RegionType.Ellipse)
+        return outer.subtracted(inner)
+
+    def _ensureCache(self):
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if self._cache is not None and self._cache_key == key:
+            return
 
         width = self.width()
         height = self.height()
-        margin = 10
-        rect = QRect(margin, margin, width - 2*margin, height - 2*margin)
-        
+        rect = self._circleRect()
+
+        # Timer text with font
+        self._timer_font = QFont(self.font())
+        self._timer_font.setFamily("SF Compact Display Regular")
+        self._timer_font.setPointSize(max(1, min(width, height) // 7))
+        self._timer_font.setBold(False)
+        metrics = QFontMetrics(self._timer_font)
+        text_height = metrics.height()
+        self._timer_text_rect = QRect(
+            rect.x(), rect.center().y() - text_height // 2 - 1, rect.width(), text_height + 2
+        )
+
+        pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
         # Background circle
+        pen = QPen(QColor("#454545"))
+        pen.setWidth(self.RING_WIDTH)
+        painter.setPen(pen)
         painter.drawEllipse(rect)
 
+        # Draw goal text below timer with New York font
+        if self.goal_text:
+            goal_font = QFont(self.ny_font_family)
+            goal_font.setPointSize(max(1, min(width, height) // 14))
+            painter.setFont(goal_font)
+            painter.setPen(QColor("#E0E0E0"))
+            goal_rect = QRect(rect.x(), rect.y() + rect.height()//2, rect.width(), rect.height()//2)
+            painter.drawText(goal_rect, Qt.AlignmentFlag.AlignCenter, self.goal_text)
+        painter.end()
+
+        self._cache = pixmap
+        self._cache_key = key
+
+    @instrumentation.timed('paint: CircularProgressBar')
+    def paintEvent(self, event):
+        self._ensureCache()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Static ring and goal text
+        painter.drawPixmap(0, 0, self._cache)
+
+        rect = self._circleRect()
+
         # Progress arc
         if self.progress > 0:
-            pen.setColor(QColor("#4CAF50"))
-            pen.setWidth(5)
+            pen = QPen(QColor("#4CAF50"))
+            pen.setWidth(self.RING_WIDTH)
             painter.setPen(pen)
             span = int(-360 * self.progress * 16)
             painter.drawArc(rect, 90 * 16, span)
 
-        # Timer text with font
-        font = painter.font()
-        font.setFamily("SF Compact Display Regular")
-        font.setPointSize(min(width, height) // 7)
-        font.setBold(False)
-        painter.setFont(font)
-        painter.setPen(QColor("#E0E0E0"))
-        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.timer_text)
-        
-        # Draw goal text below timer with New York font
-        if self.goal_text:
-            goal_font = QFont(self.ny_font_family)
-            goal_font.setPointSize(min(width, height) // 14)
-            painter.setFont(goal_font)
-            goal_rect = QRect(rect.x(), rect.y() + rect.height()//2, rect.width(), rect.height()//2)
-            painter.drawText(goal_rect, Qt.AlignmentFlag.AlignCenter, self.goal_text)
\ No newline at end of file
+        # Timer text
+        if event.region().intersects(self._timer_text_rect):
+            painter.setFont(self._timer_font)
+            painter.setPen(QColor("#E0E0E0"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.timer_text)
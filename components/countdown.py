@@ -0,0 +1,86 @@
+import math
+import sys
+import time
+
+
+def suspend_aware_clock():
+    # time.monotonic stops counting while the machine sleeps on Linux and macOS,
+    # which would make a session outlive its wall-clock length after a suspend
+    if hasattr(time, 'CLOCK_BOOTTIME'):  # Linux
+        return lambda: time.clock_gettime(time.CLOCK_BOOTTIME)
+    if sys.platform == 'darwin':  # macOS CLOCK_MONOTONIC keeps running during sleep
+        return lambda: time.clock_gettime(time.CLOCK_MONOTONIC)
+    return time.monotonic  # Windows: already includes sleep time
+
+
+# Countdown driven by a monotonic deadline instead of counting ticks. Remaining
+# time is always computed from the clock, so late or missed ticks (load, system
+# sleep) never make a session run long. `clock` is any callable returning
+# seconds and can be swapped for a fake one.
+class Countdown:
+    # Wake slightly after the second boundary so the display has already flipped
+    TICK_SLACK_MS = 5
+
+    def __init__(self, clock=None):
+        self.clock = clock or suspend_aware_clock()
+        self.total_time = 0
+        self._deadline = None  # Clock value the countdown reaches zero at, while running
+        self._remaining = 0.0  # Exact remaining seconds, while paused/stopped
+
+    @property
+    def is_running(self):
+        return self._deadline is not None
+
+    @property
+    def deadline(self):
+        # Clock value the countdown reaches zero at, or None while paused/stopped
+        return self._deadline
+
+    def start(self, seconds):
+        # Also valid while running or finished: the old deadline is dropped
+        self.total_time = seconds
+        self._remaining = float(seconds)
+        self._deadline = None
+        self.resume()
+
+    def resume(self):
+        if self._deadline is None:
+            self._deadline = self.clock() + self._remaining
+
+    def pause(self):
+        if self._deadline is not None:
+            self._remaining = self.remaining()
+            self._deadline = None
+
+    def reset(self):
+        self.total_time = 0
+        self._remaining = 0.0
+        self._deadline = None
+
+    def remaining(self):
+        if self._deadline is None:
+            return self._remaining
+        return max(0.0, self._deadline - self.clock())
+
+    def remaining_seconds(self):
+        # Whole seconds to display: 25:00 until a full second has passed, 00:00 only at the end
+        return math.ceil(self.remaining())
+
+    def elapsed(self):
+        return self.total_time - self.remaining()
+
+    def progress(self):
+        if not self.total_time:
+            return 0
+        return 1 - self.remaining() / self.total_time
+
+    def is_finished(self):
+        return self.total_time > 0 and self.remaining() <= 0
+
+    def ms_until_next_tick(self):
+        # Time until the displayed second changes, so ticks stay aligned to
+        # second boundaries however late the previous one fired
+        fraction = self.remaining() % 1.0
+        if fraction == 0:
+            fraction = 1.0
+        return int(fraction * 1000) + self.TICK_SLACK_MS
@@ -0,0 +1,44 @@
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QFontDatabase
+import instrumentation
+
+
+class DebugPanel(QDialog):
+    # Live view of the instrumentation histograms (Ctrl+Shift+D with POMO_PROFILE=1)
+    REFRESH_MS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Timings")
+        self.resize(820, 420)
+
+        layout = QVBoxLayout(self)
+        self.report = QPlainTextEdit()
+        self.report.setReadOnly(True)
+        self.report.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.report.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        layout.addWidget(self.report)
+
+        buttons = QHBoxLayout()
+        dump_button = QPushButton(f"Save to {instrumentation.DUMP_PATH}")
+        dump_button.clicked.connect(lambda: instrumentation.dump())
+        buttons.addStretch()
+        buttons.addWidget(dump_button)
+        layout.addLayout(buttons)
+
+        # Only refreshes while visible, so a hidden panel costs nothing
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def refresh(self):
+        self.report.setPlainText(instrumentation.report())
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start(self.REFRESH_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
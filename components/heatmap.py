@@ -0,0 +1,115 @@
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QRectF, QSize
+from PyQt6.QtGui import QPainter, QColor, QFontMetricsF
+import instrumentation
+from components.bar_chart import BACKGROUND_COLOR, PLOT_COLOR, TEXT_COLOR
+
+HOT_COLOR = QColor("#4CAF50")
+
+
+class HeatmapChart(QWidget):
+    # Grid of cells drawn with QPainter, shaded from the plot color (0) to
+    # green (the largest value), with row labels on the left and every
+    # `column_label_step`th column label underneath
+    def __init__(self, title="", value_format=str, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.value_format = value_format
+        self.rows = []
+        self.row_labels = []
+        self.column_labels = []
+        self.column_label_step = 3
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setMouseTracking(True)
+
+    def sizeHint(self):
+        return QSize(600, 260)
+
+    def setCells(self, rows, row_labels, column_labels):
+        # rows: one list of values per row, all as long as column_labels
+        self.rows = [list(row) for row in rows]
+        self.row_labels = list(row_labels)
+        self.column_labels = list(column_labels)
+        self.update()
+
+    def _layout(self, metrics, title_height):
+        label_width = max((metrics.horizontalAdvance(label) for label in self.row_labels), default=0)
+        left = 10 + label_width + 8
+        top = 10 + (title_height + 12 if self.title else 0)
+        columns = len(self.column_labels) or 1
+        rows = len(self.rows) or 1
+        width = max(1.0, self.width() - 10 - left)
+        height = max(1.0, self.height() - 10 - metrics.height() - 6 - top)
+        return QRectF(left, top, width, height), width / columns, height / rows
+
+    def _cellAt(self, position):
+        metrics = QFontMetricsF(self.font())
+        plot, cell_width, cell_height = self._layout(metrics, QFontMetricsF(self._titleFont()).height())
+        if not self.rows or not plot.contains(position):
+            return None
+        row = int((position.y() - plot.top()) // cell_height)
+        column = int((position.x() - plot.left()) // cell_width)
+        if 0 <= row < len(self.rows) and 0 <= column < len(self.column_labels):
+            return row, column
+        return None
+
+    def _titleFont(self):
+        title_font = self.font()
+        title_font.setPointSizeF(self.font().pointSizeF() * 1.4)
+        return title_font
+
+    def mouseMoveEvent(self, event):
+        cell = self._cellAt(event.position())
+        if cell is None:
+            self.setToolTip("")
+        else:
+            row, column = cell
+            self.setToolTip(f"{self.row_labels[row]} {self.column_labels[column]}: "
+                            f"{self.value_format(self.rows[row][column])}")
+        super().mouseMoveEvent(event)
+
+    @staticmethod
+    def _shade(fraction):
+        return QColor(
+            round(PLOT_COLOR.red() + (HOT_COLOR.red() - PLOT_COLOR.red()) * fraction),
+            round(PLOT_COLOR.green() + (HOT_COLOR.green() - PLOT_COLOR.green()) * fraction),
+            round(PLOT_COLOR.blue() + (HOT_COLOR.blue() - PLOT_COLOR.blue()) * fraction),
+        )
+
+    @instrumentation.timed('paint: HeatmapChart')
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), BACKGROUND_COLOR)
+
+        font = self.font()
+        metrics = QFontMetricsF(font)
+        title_font = self._titleFont()
+        title_metrics = QFontMetricsF(title_font)
+        plot, cell_width, cell_height = self._layout(metrics, title_metrics.height())
+
+        if self.title:
+            painter.setFont(title_font)
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(QRectF(0, 10, self.width(), title_metrics.height()),
+                             Qt.AlignmentFlag.AlignCenter, self.title)
+            painter.setFont(font)
+
+        maximum = max((max(row, default=0) for row in self.rows), default=0)
+        for row_index, row in enumerate(self.rows):
+            y = plot.top() + row_index * cell_height
+            for column_index, value in enumerate(row):
+                cell = QRectF(plot.left() + column_index * cell_width, y, cell_width, cell_height)
+                painter.fillRect(cell.adjusted(1, 1, -1, -1),
+                                 self._shade(value / maximum if maximum else 0))
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(QRectF(0, y, plot.left() - 8, cell_height),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             self.row_labels[row_index])
+
+        painter.setPen(TEXT_COLOR)
+        for column_index in range(0, len(self.column_labels), self.column_label_step):
+            x = plot.left() + column_index * cell_width
+            painter.drawText(QRectF(x, plot.bottom() + 6, cell_width * self.column_label_step,
+                                    metrics.height()),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                             self.column_labels[column_index])
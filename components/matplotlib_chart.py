@@ -0,0 +1,121 @@
+import matplotlib.style
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+from components.bar_chart import BarChart
+
+
+class MatplotlibBarChart(FigureCanvas):
+    # Optional matplotlib renderer with the same interface as BarChart
+    # (select it with POMO_CHART_BACKEND=matplotlib).
+    #
+    # The axes, bars and value labels are built once per set of categories and
+    # then updated in place. Bars and labels are "animated" artists: a full draw
+    # renders everything else, which is kept as a background so value changes
+    # only need to blit the bars back on top of it.
+    #
+    # pyplot is never used: the Figure belongs to this canvas alone, so it is
+    # freed with the widget instead of living on in pyplot's figure manager,
+    # and the dark style is applied locally instead of mutating global rcParams.
+    def __init__(self, title="", ylabel="", grid=False, value_format=str, parent=None):
+        super().__init__(Figure(figsize=(8, 5), facecolor='#1E1E1E'))
+        self.setParent(parent)
+        self.title = title
+        self.ylabel = ylabel
+        self.grid = grid
+        self.value_format = value_format
+
+        self._ax = None
+        self._labels = None
+        self._values = None
+        self._bars = []
+        self._value_texts = []
+        self._background = None
+        self.mpl_connect('draw_event', self._onDraw)
+
+    def setBars(self, labels, values):
+        labels = list(labels)
+        values = list(values)
+        if labels != self._labels:
+            # New categories: rebuild the artists and do one full draw
+            self._build(labels, values)
+            self.draw_idle()
+        elif values != self._values:
+            self._update(values)
+
+    @staticmethod
+    def _yTop(values):
+        # Stepped y limit (same round ticks as the native chart), so most value
+        # changes keep the axes as they are and can be blitted
+        return BarChart._niceTicks(max(values, default=0) * 1.05)[-1]
+
+    def _build(self, labels, values):
+        with matplotlib.style.context('dark_background'):
+            self._buildArtists(labels, values)
+        self.figure.tight_layout()
+
+    def _buildArtists(self, labels, values):
+        self._labels = labels
+        self._values = values
+        self._background = None
+
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        ax.set_facecolor('#2E2E2E')
+        self._ax = ax
+
+        bars = ax.bar(labels, values, color='#4CAF50', alpha=0.7, animated=True)
+        ax.set_ylim(0, self._yTop(values))
+
+        # Customize the plot
+        if self.title:
+            ax.set_title(self.title, color='#E0E0E0', pad=20, fontsize=14)
+        ax.set_ylabel(self.ylabel, color='#E0E0E0', labelpad=10)
+
+        # Style the grid
+        if self.grid:
+            ax.grid(True, linestyle='--', alpha=0.2, color='white')
+        ax.spines['bottom'].set_color('#E0E0E0')
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_color('#E0E0E0')
+
+        ax.tick_params(colors='#E0E0E0', which='both')
+        for tick_label in ax.get_xticklabels():
+            tick_label.set_rotation(0)
+            tick_label.set_horizontalalignment('center')
+
+        # Add value label on the bar
+        self._bars = list(bars)
+        self._value_texts = [
+            ax.text(bar.get_x() + bar.get_width()/2., bar.get_height(),
+                    self.value_format(bar.get_height()),
+                    ha='center', va='bottom', color='#E0E0E0', animated=True)
+            for bar in self._bars
+        ]
+
+    def _update(self, values):
+        self._values = values
+        for bar, text, value in zip(self._bars, self._value_texts, values):
+            bar.set_height(value)
+            text.set_y(value)
+            text.set_text(self.value_format(value))
+
+        y_top = self._yTop(values)
+        if self._background is None or self._ax.get_ylim()[1] != y_top:
+            # Axis range changed: ticks and grid need a real redraw
+            self._ax.set_ylim(0, y_top)
+            self.draw_idle()
+            return
+
+        self.restore_region(self._background)
+        self._drawDynamic()
+        self.blit(self.figure.bbox)
+
+    def _onDraw(self, event):
+        # A full draw just rendered everything except the animated artists
+        self._background = self.copy_from_bbox(self.figure.bbox)
+        self._drawDynamic()
+
+    def _drawDynamic(self):
+        for artist in self._bars + self._value_texts:
+            self._ax.draw_artist(artist)
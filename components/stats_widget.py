@@ -1,9 +1,28 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame, QPushButton, QDialog
-from PyQt6.QtCore import Qt
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, FigureCanvasQTAgg as FigureCanvas
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QPushButton, QDialog, QMessageBox, QApplication
+from PyQt6.QtCore import QThread, pyqtSignal
 from datetime import datetime, timedelta
-from matplotlib.figure import Figure
+import sqlite3
+from components.bar_chart import create_bar_chart
+from components import theme
+import instrumentation
+
+class SessionLoader(QThread):
+    # Reads the whole session history for the Insights view off the GUI thread
+    # (a few seconds for a million sessions). DatabaseManager gives this thread
+    # its own connection; Qt queues the signals onto the main thread.
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db = db_manager
+
+    def run(self):
+        from database import analytics
+        try:
+            self.loaded.emit(analytics.SessionArrays.load(self.db))
+        except sqlite3.Error as e:
+            self.failed.emit(str(e))
 
 class StatsWidget(QWidget):
     def __init__(self, db_manager, parent=None):
@@ -11,30 +30,16 @@ class StatsWidget(QWidget):
         self.db = db_manager
         self.today_label = None
         self.pomodoros_label = None
-        self.canvas = None
+        self.chart = None
+        self.range_dialog = None
+        self.range_chart = None
+        self.insights_dialog = None
+        self.insights_label = None
+        self.heatmap = None
+        self.trend_chart = None
+        self.session_arrays = None
+        self.session_loader = None
         self.initUI()
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1E1E1E;
-            }
-            QLabel {
-                color: #E0E0E0;
-                font-size: 16px;
-                padding: 10px;
-            }
-            QLabel#headerLabel {
-                font-size: 24px;
-                font-weight: bold;
-                padding: 20px 10px;
-            }
-            QLabel#statsLabel {
-                font-size: 18px;
-                background-color: #2E2E2E;
-                border-radius: 10px;
-                padding: 15px;
-                margin: 5px 10px;
-            }
-        """)
 
     def initUI(self):
         layout = QVBoxLayout(self)
@@ -44,6 +49,12 @@ class StatsWidget(QWidget):
         # Header
         header = QLabel("Statistics")
         header.setObjectName("headerLabel")
+        header_font = header.font()
+        header_font.setPixelSize(24)
+        header_font.setBold(True)
+        header.setFont(header_font)
+        theme.pad_label(header, 10, 20)
+        theme.fill_background(header, theme.STATS_BACKGROUND_COLOR)
         layout.addWidget(header)
         
         # Today's stats in a container
@@ -51,14 +62,13 @@ class StatsWidget(QWidget):
         stats_container.setObjectName("statsLabel")
         stats_layout = QVBoxLayout(stats_container)
         
-        today_stats = self.db.get_today_stats()
+        # Filled in by updateStats below
         self.today_label = QLabel("Today's Focus Time")
         self.today_label.setObjectName("statsLabel")
-        self.pomodoros_label = QLabel(
-            f"Completed Pomodoros: {today_stats['completed_sessions']}\n"
-            f"Total Focus Time: {today_stats['total_minutes']} minutes"
-        )
+        self.pomodoros_label = QLabel()
         self.pomodoros_label.setObjectName("statsLabel")
+        for card in (self.today_label, self.pomodoros_label):
+            card.setStyleSheet(theme.STATS_CARD_STYLE)
         
         layout.addWidget(self.today_label)
         layout.addWidget(self.pomodoros_label)
@@ -68,16 +78,31 @@ class StatsWidget(QWidget):
         weekly_stats_btn.clicked.connect(self.show_weekly_stats)
         layout.addWidget(weekly_stats_btn)
 
-        # Configure matplotlib style
-        plt.style.use('dark_background')
-        fig, ax = plt.subplots(facecolor='#1E1E1E')
-        ax.set_facecolor('#2E2E2E')
-        
-        self.canvas = FigureCanvas(fig)
-        layout.addWidget(self.canvas)
+        # Monthly (per week) and yearly (per month) views
+        range_layout = QHBoxLayout()
+        monthly_stats_btn = QPushButton("View Monthly Stats")
+        yearly_stats_btn = QPushButton("View Yearly Stats")
+        monthly_stats_btn.clicked.connect(self.show_monthly_stats)
+        yearly_stats_btn.clicked.connect(self.show_yearly_stats)
+        range_layout.addWidget(monthly_stats_btn)
+        range_layout.addWidget(yearly_stats_btn)
+        layout.addLayout(range_layout)
+
+        # Streaks, averages and the weekly heatmap over the whole history
+        insights_btn = QPushButton("View Insights")
+        insights_btn.clicked.connect(self.show_insights)
+        layout.addWidget(insights_btn)
+
+        # Today's chart (native QPainter unless POMO_CHART_BACKEND=matplotlib)
+        self.chart = create_bar_chart(
+            title="Today's Focus Time", ylabel='Minutes', grid=True,
+            value_format=self.format_duration
+        )
+        layout.addWidget(self.chart)
         
         self.updateStats()
 
+    @instrumentation.timed('StatsWidget.updateStats')
     def updateStats(self):
         today_stats = self.db.get_today_stats()
         self.today_label.setText("Today's Stats")
@@ -92,84 +117,152 @@ class StatsWidget(QWidget):
         data = [{'date': date_label, 
                  'total_minutes': today_stats['total_minutes']}]
         
-        self.canvas.figure.clear()
-        ax = self.canvas.figure.add_subplot(111)
-        
-        # Plot styling
-        dates = [d['date'] for d in data]
-        times = [d['total_minutes'] for d in data]
-        
-        bars = ax.bar(dates, times, color='#4CAF50', alpha=0.7)
-        
-        # Customize the plot
-        ax.set_title('Today\'s Focus Time', color='#E0E0E0', pad=20, fontsize=14)
-        # ax.set_xlabel('Date', color='#E0E0E0', labelpad=10)
-        ax.set_ylabel('Minutes', color='#E0E0E0', labelpad=10)
-        
-        # Style the grid
-        ax.grid(True, linestyle='--', alpha=0.2)
-        ax.spines['bottom'].set_color('#E0E0E0')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_color('#E0E0E0')
-        
-        ax.tick_params(colors='#E0E0E0', which='both')
-        plt.setp(ax.get_xticklabels(), rotation=0, ha='center')
-        
-        # Add value label on the bar
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   self.format_duration(height), 
-                   ha='center', va='bottom', color='#E0E0E0')
-        
-        plt.tight_layout()
-        self.canvas.draw()
+        self.chart.setBars(
+            [d['date'] for d in data],
+            [d['total_minutes'] for d in data]
+        )
 
     def show_weekly_stats(self):
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Weekly Focus Time")
-        dialog.setMinimumSize(600, 400)
-        dialog_layout = QVBoxLayout(dialog)
-        
-        # Get weekly stats
         today = datetime.now().date()
-        days = [(today - timedelta(days=i)) for i in range(6, -1, -1)]
-        stats = [self.db.get_stats_for_date(day) for day in days]
-        minutes = [stat['total_minutes'] if stat else 0 for stat in stats]
-        
-        # Modern date format
-        day_names = [f"{day.strftime('%b %d')}\n{day.strftime('%a')}" for day in days]
-        
-        # Create figure with dark theme
-        fig = Figure(figsize=(8, 5), facecolor='#1E1E1E')
-        canvas = FigureCanvas(fig)
-        ax = fig.add_subplot(111)
-        ax.set_facecolor('#2E2E2E')
-        
-        # Create styled bar chart
-        bars = ax.bar(day_names, minutes, color='#4CAF50', alpha=0.7)
-        ax.set_ylabel('Focus Time (minutes)', color='#E0E0E0')
-        
-        # Style the plot
-        ax.spines['bottom'].set_color('#E0E0E0')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_color('#E0E0E0')
-        ax.tick_params(colors='#E0E0E0')
-        
-        plt.setp(ax.get_xticklabels(), rotation=0, ha='center', color='#E0E0E0')
-        
-        # Add value labels using format_duration
-        for bar in bars:
-            minutes = bar.get_height()
-            label = self.format_duration(minutes)
-            ax.text(bar.get_x() + bar.get_width()/2., minutes,
-                   label, ha='center', va='bottom', color='#E0E0E0')
+        self.show_range_stats(
+            "Weekly Focus Time", today - timedelta(days=6), today, 'day',
+            lambda day: f"{day.strftime('%b %d')}\n{day.strftime('%a')}"
+        )
+
+    def show_monthly_stats(self):
+        # Last five weeks, one bar per week (labelled by its Monday)
+        today = datetime.now().date()
+        self.show_range_stats(
+            "Monthly Focus Time", today - timedelta(weeks=4), today, 'week',
+            lambda week: f"{week.strftime('%b %d')}\nweek"
+        )
+
+    def show_yearly_stats(self):
+        # Last twelve months, one bar per month
+        today = datetime.now().date()
+        start = today.replace(year=today.year - 1, day=1)
+        if start.month == 12:
+            start = start.replace(year=start.year + 1, month=1)
+        else:
+            start = start.replace(month=start.month + 1)
+        self.show_range_stats(
+            "Yearly Focus Time", start, today, 'month',
+            lambda month: f"{month.strftime('%b')}\n{month.strftime('%Y')}"
+        )
+
+    def show_range_stats(self, title, start, end, granularity, label_format):
+        self.updateRangeDialog(title, start, end, granularity, label_format).exec()
+
+    def updateRangeDialog(self, title, start, end, granularity, label_format):
+        # One dialog and chart serve every range view and are refilled on each
+        # open, so repeatedly opening them doesn't pile up figures and canvases
+        if self.range_dialog is None:
+            self.range_dialog = QDialog(self)
+            theme.fill_background(self.range_dialog, theme.STATS_BACKGROUND_COLOR)
+            self.range_dialog.setMinimumSize(600, 400)
+            self.range_dialog.resize(800, 500)
+            dialog_layout = QVBoxLayout(self.range_dialog)
+            self.range_chart = create_bar_chart(
+                ylabel='Focus Time (minutes)', value_format=self.format_duration
+            )
+            dialog_layout.addWidget(self.range_chart)
+
+        self.range_dialog.setWindowTitle(title)
         
-        plt.tight_layout()
-        dialog_layout.addWidget(canvas)
-        dialog.exec()
+        # One grouped query for the whole range, already zero-filled
+        stats = self.db.get_stats_range(start, end, granularity)
+        self.range_chart.setBars(
+            [label_format(stat['date']) for stat in stats],
+            [stat['total_minutes'] for stat in stats]
+        )
+        return self.range_dialog
+
+    def show_insights(self):
+        dialog = self.updateInsightsDialog()
+        if dialog is not None:
+            dialog.exec()
+
+    def updateInsightsDialog(self):
+        # The insights are computed with NumPy, which is optional
+        try:
+            from database import analytics
+        except ImportError:
+            QMessageBox.information(self, "Insights", "Insights need NumPy: pip install numpy")
+            return None
+
+        if self.insights_dialog is None:
+            from components.heatmap import HeatmapChart
+            self.insights_dialog = QDialog(self)
+            self.insights_dialog.setWindowTitle("Insights")
+            theme.fill_background(self.insights_dialog, theme.STATS_BACKGROUND_COLOR)
+            self.insights_dialog.setMinimumSize(600, 600)
+            self.insights_dialog.resize(800, 760)
+            dialog_layout = QVBoxLayout(self.insights_dialog)
+            self.insights_label = QLabel()
+            self.insights_label.setStyleSheet(theme.STATS_CARD_STYLE)
+            self.heatmap = HeatmapChart("Focus by Hour and Weekday", value_format=self.format_duration)
+            self.trend_chart = create_bar_chart(
+                title="7-Day Average, Last 2 Weeks", ylabel='Minutes per day',
+                value_format=self.format_duration
+            )
+            dialog_layout.addWidget(self.insights_label)
+            dialog_layout.addWidget(self.heatmap)
+            dialog_layout.addWidget(self.trend_chart)
+
+        # Sessions are read in full once, on a SessionLoader thread, and the
+        # dialog is filled in when they arrive; later opens only read what changed
+        if self.session_arrays is None:
+            self.loadSessions()
+        else:
+            self.session_arrays = self.session_arrays.refresh(self.db)
+            self.fillInsights()
+        return self.insights_dialog
+
+    def loadSessions(self):
+        if self.session_loader is None:
+            self.session_loader = SessionLoader(self.db, self)
+            self.session_loader.loaded.connect(self.onSessionsLoaded)
+            self.session_loader.failed.connect(self.onSessionsFailed)
+            # A QThread destroyed while it runs aborts the process
+            QApplication.instance().aboutToQuit.connect(self.session_loader.wait)
+        if not self.session_loader.isRunning():
+            self.insights_label.setText("Reading session history…")
+            self.session_loader.start()
+
+    def onSessionsLoaded(self, arrays):
+        # Picks up anything written while the loader was reading
+        self.session_arrays = arrays.refresh(self.db)
+        self.fillInsights()
+
+    def onSessionsFailed(self, message):
+        self.insights_label.setText(f"Couldn't read the session history: {message}")
+
+    def fillInsights(self):
+        from database import analytics
+        summary = analytics.summarize(self.session_arrays)
+
+        def percent(rate):
+            return "–" if rate is None else f"{rate:.0%}"
+
+        streaks = summary['streaks']
+        rolling = summary['rolling']
+        rates = summary['completion_rates']
+        ratio = summary['break_focus_ratio']
+        self.insights_label.setText(
+            f"🔥 Streak: {streaks['current']} days (longest {streaks['longest']})\n"
+            f"📈 Daily focus: {self.format_duration(rolling[7][-1])} over 7 days, "
+            f"{self.format_duration(rolling[30][-1])} over 30\n"
+            f"✅ Completed: {percent(rates['focus'])} of focus sessions, "
+            f"{percent(rates['break'])} of breaks\n"
+            f"☕ Break/focus ratio: {'–' if ratio is None else f'{ratio:.2f}'}"
+        )
+        self.heatmap.setCells(
+            summary['heatmap'].tolist(), analytics.WEEKDAYS, [f"{hour:02d}" for hour in range(24)]
+        )
+        self.trend_chart.setBars(
+            [f"{day.strftime('%d')}\n{day.strftime('%a')}" for day in rolling['days'][-14:]],
+            [round(minutes) for minutes in rolling[7][-14:]]
+        )
 
     def format_duration(self, minutes):
         if minutes == 0:
@@ -0,0 +1,257 @@
+from PyQt6.QtWidgets import QApplication, QProxyStyle, QStyle, QStyleFactory, QPushButton, QSlider, QLabel
+from PyQt6.QtCore import Qt, QPoint, QRect, QRectF, QSize
+from PyQt6.QtGui import QPalette, QColor, QPen, QFont, QPainter, QPixmap, QPixmapCache
+
+BACKGROUND_COLOR = QColor("#000000")
+TEXT_COLOR = QColor("#E0E0E0")
+BUTTON_COLOR = QColor("#1E1E1E")
+BUTTON_HOVER_COLOR = QColor("#2E2E2E")
+ACCENT_COLOR = QColor("#4CAF50")
+ACCENT_HOVER_COLOR = QColor("#45a049")
+STATS_BACKGROUND_COLOR = QColor("#1E1E1E")
+CONTROL_COLORS = {
+    'start': QColor("#4CAF50"),
+    'pause': QColor("#FFA500"),
+    'stop': QColor("#FF4444"),
+}
+
+FONT_FAMILY = 'SF Compact Display Regular'
+BUTTON_FONT_FAMILY = 'SF Compact Display Light'
+PRESET_FONT_FAMILIES = ['SF Pro Display', 'Arial']
+
+# Rounded stats cards are the one look left to a (per-label) stylesheet
+STATS_CARD_STYLE = """
+    font-size: 18px;
+    color: #E0E0E0;
+    background-color: #2E2E2E;
+    border-radius: 10px;
+    padding: 15px;
+    margin: 5px 10px;
+"""
+
+
+def pixel_font(families, pixel_size, bold=False):
+    font = QFont()
+    font.setFamilies(families)
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
+
+
+class ButtonLook:
+    # How PomodoroStyle draws one kind of push button
+    def __init__(self, fill, hover_fill, border, border_width, text, hover_text,
+                 radius=0, padding=5, min_width=70):
+        self.fill = fill
+        self.hover_fill = hover_fill
+        self.border = border
+        self.border_width = border_width
+        self.text = text
+        self.hover_text = hover_text
+        self.radius = radius
+        self.padding = padding
+        self.min_width = min_width
+
+
+DEFAULT_LOOK = ButtonLook(BUTTON_COLOR, BUTTON_HOVER_COLOR, TEXT_COLOR, 1, TEXT_COLOR, TEXT_COLOR)
+PRESET_LOOK = ButtonLook(BUTTON_HOVER_COLOR, BUTTON_HOVER_COLOR, ACCENT_COLOR, 2, TEXT_COLOR, TEXT_COLOR,
+                         radius=15, padding=10, min_width=100)
+# The goal button: a control button without a buttonType
+CONTROL_LOOK = ButtonLook(BUTTON_COLOR, BUTTON_HOVER_COLOR, TEXT_COLOR, 1, TEXT_COLOR, TEXT_COLOR,
+                          radius=15, padding=8, min_width=80)
+CONTROL_LOOKS = {
+    button_type: ButtonLook(BUTTON_HOVER_COLOR, color, color, 2, color, QColor("white"),
+                            radius=15, padding=8, min_width=80)
+    for button_type, color in CONTROL_COLORS.items()
+}
+
+
+def button_look(button):
+    # Buttons are themed by objectName (presetButton, controlButton) and the
+    # buttonType property, as the stylesheet used to select them
+    name = button.objectName()
+    if name == 'presetButton':
+        return PRESET_LOOK
+    if name == 'controlButton':
+        return CONTROL_LOOKS.get(button.property('buttonType'), CONTROL_LOOK)
+    return DEFAULT_LOOK
+
+
+class PomodoroStyle(QProxyStyle):
+    # Fusion with the app's dark buttons and slider drawn directly. Unlike a
+    # stylesheet, nothing here is re-resolved per widget on polish or resize.
+    SLIDER_THICKNESS = 15
+    SLIDER_GROOVE = 13
+    SLIDER_HANDLE = 18
+
+    def __init__(self):
+        super().__init__(QStyleFactory.create('Fusion'))
+
+    def polish(self, target):
+        if isinstance(target, QPushButton):
+            name = target.objectName()
+            if name == 'presetButton':
+                target.setFont(pixel_font(PRESET_FONT_FAMILIES, 14, bold=True))
+            elif name == 'controlButton':
+                target.setFont(pixel_font([BUTTON_FONT_FAMILY], 13, bold=True))
+            target.setAttribute(Qt.WidgetAttribute.WA_Hover)
+        elif isinstance(target, QSlider):
+            target.setAttribute(Qt.WidgetAttribute.WA_Hover)
+        elif isinstance(target, QLabel):
+            # 5px either side, unless the label's owner already chose margins
+            if not target.styleSheet() and target.contentsMargins().isNull():
+                pad_label(target, 5)
+        return super().polish(target)
+
+    # Push buttons
+
+    def sizeFromContents(self, contents_type, option, size, widget=None):
+        if contents_type == QStyle.ContentsType.CT_PushButton and isinstance(widget, QPushButton):
+            look = button_look(widget)
+            frame = look.padding + look.border_width
+            # min-width applies to the contents, as it did in the stylesheet
+            return QSize(max(size.width(), look.min_width) + 2 * frame, size.height() + 2 * frame)
+        return super().sizeFromContents(contents_type, option, size, widget)
+
+    def drawControl(self, element, option, painter, widget=None):
+        if element == QStyle.ControlElement.CE_PushButton and isinstance(widget, QPushButton):
+            look = button_look(widget)
+            hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+            ratio = painter.device().devicePixelRatioF()
+            # Faces are rendered once per look, size, state and text, then blitted
+            key = (f"pomodoro-button:{id(look)}:{hovered}:{option.rect.width()}x{option.rect.height()}"
+                   f"@{ratio}:{widget.font().key()}:{option.text}")
+            face = QPixmapCache.find(key)
+            if face is None:
+                face = self._buttonFace(look, hovered, option, widget.font(), ratio)
+                QPixmapCache.insert(key, face)
+            painter.drawPixmap(option.rect.topLeft(), face)
+            return
+        super().drawControl(element, option, painter, widget)
+
+    @staticmethod
+    def _buttonFace(look, hovered, option, font, ratio):
+        face = QPixmap(option.rect.size() * ratio)
+        face.setDevicePixelRatio(ratio)
+        face.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(face)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(0, 0, option.rect.width(), option.rect.height())
+        inset = look.border_width / 2
+        rect.adjust(inset, inset, -inset, -inset)
+        radius = min(look.radius, rect.height() / 2, rect.width() / 2)
+        painter.setPen(QPen(look.border, look.border_width))
+        painter.setBrush(look.hover_fill if hovered else look.fill)
+        painter.drawRoundedRect(rect, radius, radius)
+
+        painter.setFont(font)
+        painter.setPen(look.hover_text if hovered else look.text)
+        painter.drawText(QRect(QPoint(0, 0), option.rect.size()),
+                         Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextShowMnemonic, option.text)
+        painter.end()
+        return face
+
+    # Horizontal sliders: a rounded 13px track, green up to an 18px wide handle.
+    # This is what the stylesheet slider actually rendered: its handle was
+    # clipped to the groove and the groove's border never showed.
+
+    def pixelMetric(self, metric, option=None, widget=None):
+        if metric == QStyle.PixelMetric.PM_SliderLength:
+            return self.SLIDER_HANDLE
+        if metric in (QStyle.PixelMetric.PM_SliderThickness,
+                      QStyle.PixelMetric.PM_SliderControlThickness):
+            return self.SLIDER_THICKNESS
+        return super().pixelMetric(metric, option, widget)
+
+    def _isHorizontalSlider(self, control, option):
+        return (control == QStyle.ComplexControl.CC_Slider
+                and option.orientation == Qt.Orientation.Horizontal)
+
+    def subControlRect(self, control, option, sub_control, widget=None):
+        if self._isHorizontalSlider(control, option):
+            groove = QRect(option.rect.x(), option.rect.y() + (option.rect.height() - self.SLIDER_GROOVE) // 2,
+                           option.rect.width(), self.SLIDER_GROOVE)
+            if sub_control == QStyle.SubControl.SC_SliderGroove:
+                return groove
+            if sub_control == QStyle.SubControl.SC_SliderHandle:
+                offset = QStyle.sliderPositionFromValue(
+                    option.minimum, option.maximum, option.sliderPosition,
+                    groove.width() - self.SLIDER_HANDLE, option.upsideDown
+                )
+                return QRect(groove.x() + offset, groove.y(), self.SLIDER_HANDLE, groove.height())
+        return super().subControlRect(control, option, sub_control, widget)
+
+    def drawComplexControl(self, control, option, painter, widget=None):
+        if not self._isHorizontalSlider(control, option):
+            super().drawComplexControl(control, option, painter, widget)
+            return
+
+        groove = QRectF(self.subControlRect(control, option, QStyle.SubControl.SC_SliderGroove, widget))
+        handle = QRectF(self.subControlRect(control, option, QStyle.SubControl.SC_SliderHandle, widget))
+        hovered = (bool(option.state & QStyle.StateFlag.State_MouseOver)
+                   and bool(option.activeSubControls & QStyle.SubControl.SC_SliderHandle))
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(BUTTON_HOVER_COLOR)
+        painter.drawRoundedRect(groove, 5, 5)
+
+        filled = QRectF(groove)
+        filled.setRight(handle.center().x())
+        painter.setBrush(ACCENT_COLOR)
+        painter.drawRoundedRect(filled, 5, 5)
+
+        painter.setBrush(ACCENT_HOVER_COLOR if hovered else ACCENT_COLOR)
+        painter.drawRoundedRect(handle, 5, 5)
+        painter.restore()
+
+
+def dark_palette():
+    palette = QPalette()
+    for role, color in (
+        (QPalette.ColorRole.Window, BACKGROUND_COLOR),
+        (QPalette.ColorRole.WindowText, TEXT_COLOR),
+        (QPalette.ColorRole.Base, BACKGROUND_COLOR),
+        (QPalette.ColorRole.AlternateBase, BUTTON_COLOR),
+        (QPalette.ColorRole.Text, TEXT_COLOR),
+        (QPalette.ColorRole.Button, BUTTON_COLOR),
+        (QPalette.ColorRole.ButtonText, TEXT_COLOR),
+        (QPalette.ColorRole.ToolTipBase, BUTTON_COLOR),
+        (QPalette.ColorRole.ToolTipText, TEXT_COLOR),
+        (QPalette.ColorRole.Highlight, ACCENT_COLOR),
+        (QPalette.ColorRole.HighlightedText, QColor("white")),
+    ):
+        palette.setColor(role, color)
+    return palette
+
+
+def pad_label(label, horizontal, vertical=0):
+    # Margins matching a stylesheet padding: QLabel also indented styled text
+    # by half an 'x' either side
+    side = horizontal + label.fontMetrics().horizontalAdvance('x') // 2
+    label.setContentsMargins(side, vertical, side, vertical)
+
+
+def fill_background(widget, color):
+    # A solid background for one widget, which its children show through
+    palette = widget.palette()
+    palette.setColor(QPalette.ColorRole.Window, color)
+    widget.setPalette(palette)
+    widget.setAutoFillBackground(True)
+
+
+def apply(app=None):
+    # Installs the palette, fonts and PomodoroStyle application-wide; cheap to
+    # call again once they are in place
+    app = app or QApplication.instance()
+    if isinstance(app.style(), PomodoroStyle):
+        return
+    app.setStyle(PomodoroStyle())
+    app.setPalette(dark_palette())
+
+    font = QFont(app.font())
+    font.setFamily(FONT_FAMILY)
+    app.setFont(font)
+    app.setFont(pixel_font([BUTTON_FONT_FAMILY], 13), 'QPushButton')
+    app.setFont(pixel_font([FONT_FAMILY], 13), 'QLabel')
@@ -0,0 +1,150 @@
+import asyncio
+import heapq
+import itertools
+from components.countdown import Countdown, suspend_aware_clock
+from database.db_manager import DatabaseManager
+
+
+class Timer:
+    # One named session inside a TimerEngine
+    def __init__(self, name, session_type, countdown):
+        self.name = name
+        self.session_type = session_type
+        self.countdown = countdown
+        self.session_id = None  # Assigned when the engine persists the start
+
+
+# Runs any number of named sessions (e.g. one per team member) off a single
+# scheduler. Running timers sit in a heap keyed by their Countdown deadline, so
+# the engine only wakes for the next deadline (or heartbeat) instead of ticking
+# every timer every second. Pausing or resuming just pushes a new heap entry;
+# entries whose deadline no longer matches their timer are skipped when they
+# surface. Session starts, heartbeats and ends are collected and written
+# through DatabaseManager as one queued write per kind each time the engine wakes.
+#
+# Not thread-safe: call it from the thread (and asyncio loop) that runs it.
+class TimerEngine:
+    def __init__(self, db, clock=None, on_complete=None):
+        self.db = db
+        self.clock = clock or suspend_aware_clock()
+        self.on_complete = on_complete  # Called with each timer that runs to the end
+        self.timers = {}
+        self._heap = []  # (deadline, sequence, name)
+        self._sequence = itertools.count()
+        self._pending_starts = []
+        self._pending_ends = []  # (session_id, completed)
+        self._next_heartbeat = None
+        self._wake = None
+
+    def __len__(self):
+        return len(self.timers)
+
+    def start(self, name, seconds, session_type="focus"):
+        # Like PomodoroTimer.startTimer: a paused timer resumes, a new name opens a session
+        if name in self.timers:
+            self.resume(name)
+            return
+        countdown = Countdown(self.clock)
+        countdown.start(seconds)
+        timer = Timer(name, session_type, countdown)
+        self.timers[name] = timer
+        self._pending_starts.append(timer)
+        self._schedule(timer)
+        if self._next_heartbeat is None:
+            self._next_heartbeat = self.clock() + DatabaseManager.HEARTBEAT_SECONDS
+
+    def pause(self, name):
+        self.timers[name].countdown.pause()
+
+    def resume(self, name):
+        timer = self.timers[name]
+        if not timer.countdown.is_running:
+            timer.countdown.resume()
+            self._schedule(timer)
+
+    def stop(self, name, completed=False):
+        # Ends a session early, saved (completed) or discarded like the GUI's stop dialog
+        timer = self.timers.pop(name)
+        timer.countdown.pause()
+        self._end(timer, completed)
+        self.persist()
+
+    def remaining(self, name):
+        return self.timers[name].countdown.remaining()
+
+    def _schedule(self, timer):
+        heapq.heappush(self._heap, (timer.countdown.deadline, next(self._sequence), timer.name))
+        if self._wake is not None:
+            self._wake.set()
+
+    def _end(self, timer, completed):
+        if timer.session_id is None:
+            self.persist()  # Started since the last persist: needs its id first
+        self._pending_ends.append((timer.session_id, completed))
+
+    def _is_current(self, entry):
+        deadline, _, name = entry
+        timer = self.timers.get(name)
+        return timer is not None and timer.countdown.deadline == deadline
+
+    def next_wakeup(self):
+        # Clock value of the next deadline or heartbeat, None when nothing runs
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+        deadlines = [self._heap[0][0]] if self._heap else []
+        if self._next_heartbeat is not None and self.timers:
+            deadlines.append(self._next_heartbeat)
+        return min(deadlines, default=None)
+
+    def poll(self):
+        # Completes every timer whose deadline has passed, sends due heartbeats
+        # and persists the batch. Returns the completed timers.
+        now = self.clock()
+        completed = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_current(entry):
+                timer = self.timers.pop(entry[2])
+                self._end(timer, True)
+                completed.append(timer)
+
+        if self._next_heartbeat is not None and now >= self._next_heartbeat:
+            self.persist()
+            # Paused timers too, so another process's orphan recovery leaves them alone
+            self.db.heartbeat_sessions([timer.session_id for timer in self.timers.values()])
+            self._next_heartbeat = now + DatabaseManager.HEARTBEAT_SECONDS if self.timers else None
+
+        self.persist()
+        if self.on_complete is not None:
+            for timer in completed:
+                self.on_complete(timer)
+        return completed
+
+    def persist(self):
+        if self._pending_starts:
+            starts, self._pending_starts = self._pending_starts, []
+            session_ids = self.db.start_sessions(
+                [(timer.session_type, timer.countdown.total_time) for timer in starts]
+            )
+            for timer, session_id in zip(starts, session_ids):
+                timer.session_id = session_id
+        if self._pending_ends:
+            ends, self._pending_ends = self._pending_ends, []
+            self.db.end_sessions(ends)
+
+    async def run(self):
+        # Sleeps until the next deadline; start/resume wake it early
+        self._wake = asyncio.Event()
+        try:
+            while True:
+                self.poll()
+                wakeup = self.next_wakeup()
+                self._wake.clear()
+                timeout = None if wakeup is None else max(0.0, wakeup - self.clock())
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wake = None
+            self.persist()
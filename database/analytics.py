@@ -0,0 +1,222 @@
+# analytics.py
+# Long-range insights over the whole sessions table: focus streaks, an
+# hour-of-day x weekday heatmap, rolling 7/30-day averages, completion rates
+# and the break/focus ratio. The table is read once, in chunks, into NumPy
+# columns, and every metric is a handful of vectorized passes over them.
+#
+# NumPy is optional: only StatsWidget's Insights view imports this module.
+import itertools
+import numpy as np
+from datetime import date, datetime, time, timedelta
+
+EPOCH_DAY = date(1970, 1, 1)
+# Rows fetched and converted per step while loading
+CHUNK_SIZE = 100_000
+ROLLING_WINDOWS = (7, 30)
+WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+
+def day_number(day):
+    return (day - EPOCH_DAY).days
+
+
+def day_from_number(number):
+    return EPOCH_DAY + timedelta(days=int(number))
+
+
+class SessionArrays:
+    # The sessions table as parallel columns, one entry per session with a
+    # start time and day, in session_id order per file. day is days since 1970-01-01
+    # (of the local start date); minutes is what the session adds to
+    # daily_focus (0 unless completed).
+    #
+    # Sessions below the first one still open can't change any more, so
+    # refresh() only reads the rows from there on again. Archived sessions
+    # (database/archive.py) are read from their files too.
+    LOAD_QUERY = '''
+        SELECT
+            start_time,
+            CAST(julianday(day) - 2440587.5 AS INTEGER),
+            COALESCE(end_time - start_time, -1),
+            session_type IS 'focus',
+            session_type IS 'break',
+            COALESCE(completed_status, 0)
+        FROM {table}
+        WHERE session_id >= ?
+        AND session_id < ?
+        AND start_time IS NOT NULL
+        AND day IS NOT NULL
+        ORDER BY session_id
+    '''
+    EMPTY = np.empty((0, 6), dtype=np.int64)
+
+    def __init__(self, settled=EMPTY, pending=EMPTY, settled_below=0):
+        self._settled = settled  # Rows with session_id < settled_below
+        self._pending = pending  # Rows from there on, re-read by refresh()
+        self.settled_below = settled_below
+
+        table = np.concatenate((settled, pending)) if len(pending) else settled
+        self.start = table[:, 0]
+        self.day = table[:, 1].astype(np.int32)
+        elapsed = table[:, 2]
+        self.closed = elapsed >= 0
+        self.focus = table[:, 3].astype(bool)
+        self.is_break = table[:, 4].astype(bool)
+        self.completed = table[:, 5].astype(bool) & self.closed
+        self.minutes = np.where(self.completed, elapsed // 60, 0)
+
+    def __len__(self):
+        return len(self.start)
+
+    @classmethod
+    def load(cls, db, chunk_size=CHUNK_SIZE):
+        return cls().refresh(db, chunk_size)
+
+    def refresh(self, db, chunk_size=CHUNK_SIZE):
+        # New arrays that include every write made through db so far
+        db.flush()
+        cursor = db.conn.cursor()
+        cursor.execute('''
+            SELECT
+                (SELECT MIN(session_id) FROM sessions
+                 WHERE end_time IS NULL AND completed_status IS NULL),
+                -- Archived sessions can have larger ids than any left here,
+                -- but never larger than the id sequence
+                MAX(
+                    COALESCE((SELECT MAX(session_id) FROM sessions), 0),
+                    COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'sessions'), 0)
+                ) + 1
+        ''')
+        first_open, next_id = cursor.fetchone()
+        settled_below = max(self.settled_below, first_open if first_open is not None else next_id)
+
+        newly_settled = self._read(db, self.settled_below, settled_below, chunk_size)
+        if len(newly_settled):
+            settled = np.concatenate((self._settled, newly_settled))
+        else:
+            settled = self._settled
+        pending = self._read(db, settled_below, next_id, chunk_size)
+        return SessionArrays(settled, pending, settled_below)
+
+    def _read(self, db, first_id, end_id, chunk_size):
+        # Rows with first_id <= session_id < end_id, converted chunk by chunk,
+        # archived ones first
+        if first_id >= end_id:
+            return self.EMPTY
+        cursor = db.conn.cursor()
+        chunks = []
+        for table in itertools.chain(db.archived_tables(), ['main.sessions']):
+            cursor.execute(self.LOAD_QUERY.format(table=table), (first_id, end_id))
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                chunks.append(np.fromiter(itertools.chain.from_iterable(rows), dtype=np.int64,
+                                          count=len(rows) * 6).reshape(-1, 6))
+        return np.concatenate(chunks) if chunks else self.EMPTY
+
+    def hours(self):
+        # Local hour of day each session started in. Local midnight is looked
+        # up once per calendar day, so DST changes are handled by the OS.
+        if not len(self):
+            return np.empty(0, dtype=np.int64)
+        first = int(self.day.min())
+        midnights = np.array([
+            datetime.combine(day_from_number(number), time()).timestamp()
+            for number in range(first, int(self.day.max()) + 1)
+        ], dtype=np.int64)
+        return np.clip((self.start - midnights[self.day - first]) // 3600, 0, 23)
+
+
+def daily_focus(arrays, first, last):
+    # Completed focus minutes for each day number first..last, zero-filled
+    mask = arrays.completed & arrays.focus & (arrays.day >= first) & (arrays.day <= last)
+    return np.bincount(arrays.day[mask] - first, weights=arrays.minutes[mask],
+                       minlength=last - first + 1)
+
+
+def streaks(arrays, today=None):
+    # Runs of consecutive days with at least one completed focus session. The
+    # current streak still counts if today has no session yet but yesterday did.
+    today = day_number(today or date.today())
+    focus_days = arrays.day[arrays.completed & arrays.focus]
+    focus_days = focus_days[focus_days <= today]
+    if not len(focus_days):
+        return {'current': 0, 'longest': 0, 'longest_end': None}
+
+    first = int(focus_days.min())
+    active = np.zeros(today - first + 1, dtype=np.int8)
+    active[focus_days - first] = 1
+
+    # Run boundaries: +1 where a run starts, -1 just past where it ends
+    edges = np.diff(np.concatenate(([0], active, [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+    longest = int(lengths.argmax())
+
+    last_end = first + int(ends[-1]) - 1
+    current = int(lengths[-1]) if last_end >= today - 1 else 0
+    return {
+        'current': current,
+        'longest': int(lengths[longest]),
+        'longest_end': day_from_number(first + ends[longest] - 1),
+    }
+
+
+def heatmap(arrays):
+    # 7 x 24 completed focus minutes, rows Monday..Sunday, columns start hour
+    mask = arrays.completed & arrays.focus
+    weekdays = (arrays.day[mask].astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+    hours = arrays.hours()[mask]
+    cells = np.bincount(weekdays * 24 + hours, weights=arrays.minutes[mask], minlength=7 * 24)
+    return cells.reshape(7, 24)
+
+
+def rolling_averages(arrays, days=30, windows=ROLLING_WINDOWS, today=None):
+    # Mean daily focus minutes over each trailing window, for each of the last
+    # `days` days (oldest first). Days before the first session count as zero.
+    last = day_number(today or date.today())
+    first = last - days - max(windows) + 2
+    daily = daily_focus(arrays, first, last)
+    totals = np.concatenate(([0.0], np.cumsum(daily)))
+    ends = np.arange(len(daily) - days + 1, len(daily) + 1)
+    return {
+        'days': [day_from_number(last - days + 1 + offset) for offset in range(days)],
+        **{window: (totals[ends] - totals[ends - window]) / window for window in windows},
+    }
+
+
+def completion_rates(arrays):
+    # Share of closed sessions that were completed, by type and overall
+    # (None when there are none)
+    def rate(mask):
+        closed = np.count_nonzero(arrays.closed & mask)
+        return float(np.count_nonzero(arrays.completed & mask) / closed) if closed else None
+
+    everything = np.ones(len(arrays), dtype=bool)
+    return {
+        'focus': rate(arrays.focus),
+        'break': rate(arrays.is_break),
+        'overall': rate(everything),
+    }
+
+
+def break_focus_ratio(arrays):
+    # Minutes of completed breaks per minute of completed focus
+    focus_minutes = arrays.minutes[arrays.focus].sum()
+    if not focus_minutes:
+        return None
+    return float(arrays.minutes[arrays.is_break].sum() / focus_minutes)
+
+
+def summarize(arrays, today=None):
+    # Every metric at once, as shown by the Insights view
+    return {
+        'sessions': len(arrays),
+        'streaks': streaks(arrays, today),
+        'heatmap': heatmap(arrays),
+        'rolling': rolling_averages(arrays, today=today),
+        'completion_rates': completion_rates(arrays),
+        'break_focus_ratio': break_focus_ratio(arrays),
+    }
@@ -0,0 +1,132 @@
+# archive.py
+# Per-year archive databases for old history. Closed sessions older than the
+# horizon move out of pomodoro.db into pomodoro-2023.db, pomodoro-2024.db, ...
+# next to it, so the file the app works on stays small. The daily_focus rollup
+# keeps every day, so the stats never need the archives; queries over raw
+# sessions ATTACH the archives their date range overlaps, on demand.
+#
+#   python -m database.archive                # sessions older than 365 days
+#   python -m database.archive --days 90 --vacuum
+#
+# POMO_ARCHIVE_DAYS sets the default horizon. Archiving holds the write lock
+# for a while, so it is left to this command rather than the app.
+import argparse
+import os
+import sqlite3
+from urllib.parse import quote
+
+DEFAULT_DAYS = 365
+# SQLite's default limit on attached databases per connection
+ATTACH_LIMIT = 10
+
+# One row per archive file: the days it holds sessions for
+ARCHIVES_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS archives (
+        year INTEGER PRIMARY KEY,
+        first_day TEXT NOT NULL,
+        last_day TEXT NOT NULL,
+        sessions INTEGER NOT NULL DEFAULT 0
+    )
+'''
+
+
+def horizon_days(days=None):
+    # Explicit days, else $POMO_ARCHIVE_DAYS, else a year
+    if days is not None:
+        return days
+    return int(os.environ.get('POMO_ARCHIVE_DAYS', DEFAULT_DAYS))
+
+
+def archive_path(db_path, year):
+    root, extension = os.path.splitext(db_path)
+    return f"{root}-{year}{extension or '.db'}"
+
+
+def schema_name(year):
+    return f"archive_{year}"
+
+
+def archived_years(conn, start_day=None, end_day=None):
+    # Years whose archive holds sessions between start_day and end_day
+    # ('YYYY-MM-DD', inclusive, None for open-ended), oldest first
+    try:
+        rows = conn.execute('''
+            SELECT year FROM archives
+            WHERE last_day >= COALESCE(?, last_day)
+            AND first_day <= COALESCE(?, first_day)
+            ORDER BY year
+        ''', (start_day, end_day)).fetchall()
+    except sqlite3.OperationalError:
+        return []  # Written before archiving existed (read-only connections can't add the table)
+    return [year for year, in rows]
+
+
+def attach(conn, db_path, years, read_only=False, create=False):
+    # Attaches the archives for years to conn (they stay attached for later
+    # queries) and returns their schema names. Archive files that have gone
+    # missing are skipped, rather than attached as empty databases, unless
+    # create is set. Archives not in years are detached first if all of them
+    # wouldn't fit.
+    attached = {name for _, name, _ in conn.execute('PRAGMA database_list')
+                if name.startswith('archive_')}
+    paths = {schema_name(year): archive_path(db_path, year) for year in years}
+    wanted = [name for name, path in paths.items()
+              if name in attached or create or os.path.exists(path)]
+    missing = [name for name in wanted if name not in attached]
+    if len(attached) + len(missing) > ATTACH_LIMIT:
+        for name in attached - set(wanted):
+            conn.execute(f'DETACH DATABASE {name}')
+
+    for name in missing:
+        path = paths[name]
+        if read_only:
+            path = f"file:{quote(os.path.abspath(path))}?mode=ro"
+        conn.execute(f'ATTACH DATABASE ? AS {name}', (path,))
+    return wanted
+
+
+def sessions_source(conn, db_path, columns, start_day=None, end_day=None, read_only=False):
+    # FROM-clause source for sessions between start_day and end_day: just
+    # `sessions` when no archive overlaps the range, otherwise a UNION ALL of
+    # it and the (attached) archives. One query can't read more archives
+    # than can be attached at once.
+    years = archived_years(conn, start_day, end_day)
+    if not years:
+        return 'sessions'
+    if len(years) > ATTACH_LIMIT:
+        raise ValueError(f"{len(years)} archives overlap the range, "
+                         f"at most {ATTACH_LIMIT} can be read at once")
+    schemas = ['main', *attach(conn, db_path, years, read_only)]
+    if len(schemas) == 1:
+        return 'sessions'  # Every overlapping archive file is missing
+    selects = ' UNION ALL '.join(f"SELECT {', '.join(columns)} FROM {schema}.sessions" for schema in schemas)
+    return f"({selects}) AS sessions"
+
+
+def main(argv=None):
+    from database.db_manager import DatabaseManager
+
+    parser = argparse.ArgumentParser(description="Move old sessions into per-year archive databases")
+    parser.add_argument('--days', type=int,
+                        help=f"archive sessions older than this (default: $POMO_ARCHIVE_DAYS or {DEFAULT_DAYS})")
+    parser.add_argument('--db', help="database file (default: $POMO_DB_PATH or pomodoro.db)")
+    parser.add_argument('--vacuum', action='store_true',
+                        help="shrink the database file afterwards (close the app first)")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(args.db)
+    try:
+        moved = db.archive_sessions(args.days)
+        for year, first_day, last_day, sessions in db.conn.execute(
+            'SELECT year, first_day, last_day, sessions FROM archives ORDER BY year'
+        ):
+            print(f"{archive_path(db.path, year)}: {sessions} sessions, {first_day} to {last_day}")
+        print(f"Archived {moved} sessions")
+        if args.vacuum:
+            db.conn.execute('VACUUM')
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# connection.py
+import os
+import sqlite3
+import threading
+from urllib.parse import quote
+import instrumentation
+
+DEFAULT_PATH = 'pomodoro.db'
+
+# Applied to every connection. WAL lets readers (the stats page, view_db.py)
+# run while the writer thread commits; synchronous=NORMAL is durable enough
+# with WAL and avoids an fsync per commit.
+PRAGMAS = (
+    ('busy_timeout', 5000),
+    ('cache_size', -16000),        # KiB, i.e. 16 MB of page cache
+    ('mmap_size', 64 * 1024 * 1024),
+    ('temp_store', 'MEMORY'),
+)
+WRITE_PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+)
+
+def database_path(path=None):
+    # Explicit path, else $POMO_DB_PATH, else pomodoro.db in the working directory
+    return path or os.environ.get('POMO_DB_PATH', DEFAULT_PATH)
+
+def connect(path=None, read_only=False):
+    path = database_path(path)
+    # With POMO_PROFILE set, every statement is timed into a histogram
+    factory = instrumentation.TimedConnection if instrumentation.ENABLED else sqlite3.Connection
+    if read_only:
+        # Read-only URI connection: can never take a write lock, so tools using
+        # it never block the timer's writes
+        uri = f"file:{quote(os.path.abspath(path))}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, factory=factory)
+        pragmas = PRAGMAS
+    else:
+        conn = sqlite3.connect(path, check_same_thread=False, factory=factory)
+        pragmas = WRITE_PRAGMAS + PRAGMAS
+    for name, value in pragmas:
+        conn.execute(f'PRAGMA {name} = {value}')
+    return conn
+
+class ThreadConnections:
+    # One connection (and cursor) per thread, all closed together by close_all()
+    def __init__(self, path=None, read_only=False):
+        self.path = database_path(path)
+        self.read_only = read_only
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all = []
+
+    def get(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = connect(self.path, self.read_only)
+            self._local.conn = conn
+            self._local.cursor = conn.cursor()
+            with self._lock:
+                self._all.append(conn)
+        return conn
+
+    def cursor(self):
+        self.get()
+        return self._local.cursor
+
+    def close_all(self):
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+        self._local = threading.local()
@@ -1,93 +1,435 @@
 # db_manager.py
+import sys
+import queue
+import itertools
 import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from database.connection import ThreadConnections
+from database import archive
 
 class DatabaseManager:
-    def __init__(self):
-        self.conn = sqlite3.connect('pomodoro.db')
-        self.cursor = self.conn.cursor()
+    # Maps a daily_focus day to the first day of its bucket (weeks start on Monday)
+    BUCKET_EXPRESSIONS = {
+        'day': "day",
+        'week': "date(day, 'weekday 0', '-6 days')",
+        'month': "strftime('%Y-%m-01', day)",
+    }
+
+    # Upper bound on how many queued writes share one group commit
+    WRITE_BATCH_SIZE = 64
+    # PRAGMA user_version of the current schema:
+    # 1 = epoch-second timestamps + day column, 2 = heartbeat column
+    SCHEMA_VERSION = 2
+    # Rows copied per committed step when migrating an old database
+    MIGRATION_BATCH_SIZE = 5000
+    # Per-day rollup rows kept in memory; enough for the yearly view
+    DAY_CACHE_SIZE = 400
+    # Sessions moved to an archive per committed step
+    ARCHIVE_BATCH_SIZE = 5000
+    # How often every client (the app, headless.py, TimerEngine) calls
+    # heartbeat() for its open sessions; sessions that haven't reported in
+    # for two of these are taken to be orphans
+    HEARTBEAT_SECONDS = 30
+
+    # Columns moved by iter_sessions/import_sessions, in file order
+    EXPORT_COLUMNS = (
+        'session_id', 'start_time', 'end_time', 'duration',
+        'session_type', 'completed_status', 'day', 'heartbeat'
+    )
+
+    # start_time/end_time are epoch seconds; day is the local date of start_time,
+    # computed once at write time so aggregates never re-parse timestamps;
+    # heartbeat is the last time the running timer reported the session alive
+    SESSIONS_SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS {table} (
+            session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            start_time INTEGER,
+            end_time INTEGER,
+            duration INTEGER,
+            session_type TEXT,
+            completed_status BOOLEAN,
+            day TEXT,
+            heartbeat INTEGER
+        )
+    '''
+
+    # Completed sessions of one sessions table, totalled per day and type
+    ROLLUP_QUERY = '''
+        SELECT
+            day,
+            session_type,
+            COUNT(*),
+            COALESCE(SUM((end_time - start_time) / 60), 0)
+        FROM {table}
+        WHERE completed_status = 1
+        AND end_time IS NOT NULL
+        AND session_type IS NOT NULL
+        AND day IS NOT NULL
+        GROUP BY day, session_type
+    '''
+
+    def __init__(self, path=None, on_write=None, day_cache_size=DAY_CACHE_SIZE):
+        # path defaults to $POMO_DB_PATH, then pomodoro.db. Every thread that
+        # touches the database (the caller, the writer) gets its own connection.
+        self._connections = ThreadConnections(path)
+        self.path = self._connections.path
         self.create_tables()
 
+        # Writes are queued and committed by a dedicated thread so a slow fsync
+        # never blocks the caller (the Qt main thread). on_write is called from
+        # that thread after every group commit.
+        self.on_write = on_write
+        self._closed = False
+        # Bumped whenever the stats can change (a session ends, history is
+        # imported or rebuilt), so callers can cache stats until it moves
+        self.stats_version = 0
+
+        # LRU of daily_focus rows: (day, session_type) -> (completed_sessions, total_minutes).
+        # Sessions ended through this manager are applied to it directly
+        # (write-through), anything else clears it, including commits by other
+        # processes (see _check_data_version).
+        self.day_cache_size = day_cache_size
+        self._day_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # session_id -> (day, session_type, start_time) of sessions started here
+        self._open_sessions = {}
+        self._writes = queue.Queue()
+        # The writer's connection is also borrowed, under _writer_lock and
+        # between batches, by _reserve_session_ids and _check_data_version
+        self._writer_lock = threading.Lock()
+        self._writer_conn = None
+        self._data_version = None
+        writer_ready = threading.Event()
+        self._writer = threading.Thread(
+            target=self._run_writer, args=(writer_ready,), name='pomodoro-db-writer', daemon=True
+        )
+        self._writer.start()
+        writer_ready.wait()
+
+    @property
+    def conn(self):
+        return self._connections.get()
+
+    @property
+    def cursor(self):
+        return self._connections.cursor()
+
     def create_tables(self):
+        self.cursor.execute('PRAGMA user_version')
+        schema_version = self.cursor.fetchone()[0]
+
+        migrated = False
+        if not self._has_table('sessions'):
+            self.cursor.execute(self.SESSIONS_SCHEMA.format(table='sessions'))
+            self.cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+            self.conn.commit()
+        elif schema_version < 1:
+            self._migrate_to_epoch()
+            migrated = True
+        elif schema_version < 2:
+            self.cursor.execute('ALTER TABLE sessions ADD COLUMN heartbeat INTEGER')
+            self.cursor.execute('PRAGMA user_version = 2')
+            self.conn.commit()
+
+        # The stats read daily_focus now, so the partial index the raw-session
+        # stats queries used only slowed down writes
+        self.cursor.execute('DROP INDEX IF EXISTS idx_sessions_focus_completed')
+        # Every session by start time, for time-range lookups regardless of type/status
         self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sessions (
-                session_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                start_time TIMESTAMP,
-                end_time TIMESTAMP,
-                duration INTEGER,
-                session_type TEXT,
-                completed_status BOOLEAN
-            )
+            CREATE INDEX IF NOT EXISTS idx_sessions_start_time
+            ON sessions (start_time)
+        ''')
+        # Every session by local day, for per-day lookups and rollup rebuilds
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sessions_day
+            ON sessions (day)
+        ''')
+        # Only the (few) sessions that are still open, so end_session doesn't scan history
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sessions_open
+            ON sessions (session_id)
+            WHERE end_time IS NULL
+            AND completed_status IS NULL
+        ''')
+
+        # Per-day rollup of completed sessions, maintained by end_session so the
+        # stats readers touch one row per day instead of every session
+        has_rollup = self._has_table('daily_focus')
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS daily_focus (
+                day TEXT NOT NULL,
+                session_type TEXT NOT NULL,
+                completed_sessions INTEGER NOT NULL DEFAULT 0,
+                total_minutes INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, session_type)
+            ) WITHOUT ROWID
         ''')
+        # Which years have been moved to archive databases (see archive_sessions)
+        self.cursor.execute(archive.ARCHIVES_SCHEMA)
         self.conn.commit()
 
-    def start_session(self, session_type, duration):
+        # Databases created before the rollup existed (or just migrated) get it backfilled
+        if not has_rollup or migrated:
+            self._write_rebuild_daily_focus(self.cursor)
+            self.conn.commit()
+
+    def _has_table(self, name):
         self.cursor.execute('''
-            INSERT INTO sessions (start_time, session_type, duration)
-            VALUES (?, ?, ?)
-        ''', (datetime.now(), session_type, duration))
+            SELECT 1 FROM sqlite_master
+            WHERE type = 'table' AND name = ?
+        ''', (name,))
+        return self.cursor.fetchone() is not None
+
+    @staticmethod
+    def _to_epoch(value):
+        # Old rows hold naive local datetime text, e.g. '2024-03-01 09:15:02.123456'
+        if value is None or isinstance(value, int):
+            return value
+        try:
+            return int(datetime.fromisoformat(str(value)).timestamp())
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _local_day(value):
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return datetime.fromtimestamp(value).strftime('%Y-%m-%d')
+        return str(value)[:10]
+
+    def _migrate_to_epoch(self):
+        # Copies the datetime-text sessions table into the epoch format in committed
+        # batches. If the app is killed half way, the next start resumes after the
+        # last copied session_id; the final swap happens in a single transaction.
+        self.cursor.execute(self.SESSIONS_SCHEMA.format(table='sessions_epoch'))
         self.conn.commit()
+        self.cursor.execute('SELECT COALESCE(MAX(session_id), 0) FROM sessions_epoch')
+        last_id = self.cursor.fetchone()[0]
 
-    def get_today_stats(self):
-        today = datetime.now().date()
-        today_str = today.strftime('%Y-%m-%d')
-        
-        # First check if we have any sessions today
-        check_query = '''
-            SELECT COUNT(*) 
-            FROM sessions 
-            WHERE date(start_time) = ?
-        '''
-        self.cursor.execute(check_query, (today_str,))
-        has_sessions = self.cursor.fetchone()[0] > 0
+        while True:
+            self.cursor.execute('''
+                SELECT session_id, start_time, end_time, duration, session_type, completed_status
+                FROM sessions
+                WHERE session_id > ?
+                ORDER BY session_id
+                LIMIT ?
+            ''', (last_id, self.MIGRATION_BATCH_SIZE))
+            rows = self.cursor.fetchall()
+            if not rows:
+                break
+            self.cursor.executemany('''
+                INSERT INTO sessions_epoch
+                    (session_id, start_time, end_time, duration, session_type, completed_status, day)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (session_id, self._to_epoch(start_time), self._to_epoch(end_time),
+                 duration, session_type, completed_status, self._local_day(start_time))
+                for session_id, start_time, end_time, duration, session_type, completed_status in rows
+            ])
+            self.conn.commit()
+            last_id = rows[-1][0]
 
-        if not has_sessions:
-            return {
-                'completed_sessions': 0,
-                'total_minutes': 0
-            }
+        self.cursor.executescript(f'''
+            BEGIN;
+            DROP TABLE sessions;
+            ALTER TABLE sessions_epoch RENAME TO sessions;
+            PRAGMA user_version = {self.SCHEMA_VERSION};
+            COMMIT;
+        ''')
 
-        # If we have sessions, get the stats
-        query = '''
-            SELECT 
-                COUNT(*) as completed_sessions,
-                COALESCE(SUM(
-                    CAST(
-                        (strftime('%s', end_time) - strftime('%s', start_time))/60 
-                    AS INTEGER)
-                ), 0) as total_minutes
-            FROM sessions 
-            WHERE date(start_time) = ? 
-            AND completed_status = 1
-            AND session_type = 'focus'
-            AND end_time IS NOT NULL
-        '''
-        
-        self.cursor.execute(query, (today_str,))
-        result = self.cursor.fetchone()
-        
+    def _submit(self, write, *args):
+        if self._closed:
+            raise sqlite3.ProgrammingError("DatabaseManager is closed")
+        self._writes.put((write, args))
+
+    def flush(self):
+        # Blocks until every queued write has been committed
+        self._writes.join()
+
+    def close(self):
+        # Drains the write queue, stops the writer thread and closes every connection
+        if self._closed:
+            return
+        self._closed = True
+        self._writes.put(None)
+        self._writer.join()
+        self._connections.close_all()
+
+    def _run_writer(self, ready):
+        conn = self.conn
+        cursor = self.cursor
+        with self._writer_lock:
+            self._writer_conn = conn
+            self._data_version = conn.execute('PRAGMA data_version').fetchone()[0]
+        ready.set()
+        running = True
+        while running:
+            batch = [self._writes.get()]
+            # Group commit: whatever queued up behind the first write shares its transaction
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+
+            if None in batch:
+                running = False
+            writes = [write for write in batch if write is not None]
+            try:
+                with self._writer_lock:
+                    self._commit_batch(conn, cursor, writes)
+                    if not running:
+                        self._writer_conn = None
+            finally:
+                for _ in batch:
+                    self._writes.task_done()
+
+            if writes and self.on_write is not None:
+                self.on_write()
+
+    def _commit_batch(self, conn, cursor, writes):
+        try:
+            for write, args in writes:
+                write(cursor, *args)
+            conn.commit()
+            return
+        except sqlite3.Error as e:
+            conn.rollback()
+            if len(writes) == 1:
+                print(f"Database write failed: {e}")
+                return
+
+        # Retry one by one so a single bad write doesn't drop the whole batch
+        for write in writes:
+            self._commit_batch(conn, cursor, [write])
+
+    def _reserve_session_ids(self, count):
+        # Session ids are handed out here rather than by the queued insert, so
+        # start_session can return one straight away. They are taken from
+        # sqlite_sequence in one short write transaction (no fsync in WAL
+        # mode), so managers in other processes never hand out the same ids.
+        # It runs on the writer's connection between batches, so the commit
+        # isn't mistaken for another process's by _check_data_version.
+        with self._writer_lock:
+            if self._writer_conn is None:
+                raise sqlite3.ProgrammingError("DatabaseManager is closed")
+            return self._write_reserve_session_ids(self._writer_conn, count)
+
+    @staticmethod
+    def _write_reserve_session_ids(conn, count):
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute('''
+                INSERT INTO sqlite_sequence (name, seq)
+                SELECT 'sessions', 0
+                WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'sessions')
+            ''')
+            conn.execute('''
+                UPDATE sqlite_sequence
+                SET seq = MAX(seq, COALESCE((SELECT MAX(session_id) FROM sessions), 0)) + ?
+                WHERE name = 'sessions'
+            ''', (count,))
+            last_id = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'sessions'").fetchone()[0]
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        return range(last_id - count + 1, last_id + 1)
+
+    def start_session(self, session_type, duration):
+        session_id, = self._reserve_session_ids(1)
+        start_time = datetime.now()
+        start, day = int(start_time.timestamp()), start_time.strftime('%Y-%m-%d')
+        self._open_sessions[session_id] = (day, session_type, start)
+        self._submit(self._write_start_session, session_id, session_type, duration, start, day)
+        return session_id
+
+    @staticmethod
+    def _write_start_session(cursor, session_id, session_type, duration, start_time, day):
+        cursor.execute('''
+            INSERT INTO sessions (session_id, start_time, session_type, duration, day, heartbeat)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (session_id, start_time, session_type, duration, day, start_time))
+
+    def start_sessions(self, sessions):
+        # start_session for many timers in one queued write; sessions is a list
+        # of (session_type, duration). Returns the new ids in the same order.
+        if not sessions:
+            return []
+        start_time = datetime.now()
+        start, day = int(start_time.timestamp()), start_time.strftime('%Y-%m-%d')
+        rows = [
+            (session_id, session_type, duration, start, day, start)
+            for session_id, (session_type, duration)
+            in zip(self._reserve_session_ids(len(sessions)), sessions)
+        ]
+        for session_id, session_type, *_ in rows:
+            self._open_sessions[session_id] = (day, session_type, start)
+        self._submit(self._write_start_sessions, rows)
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _write_start_sessions(cursor, rows):
+        cursor.executemany('''
+            INSERT INTO sessions (session_id, session_type, duration, start_time, day, heartbeat)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', rows)
+
+    def heartbeat(self, session_id):
+        # Records that the session is still running; used to close it sensibly
+        # if the app dies before end_session
+        self._submit(self._write_heartbeat, session_id, int(datetime.now().timestamp()))
+
+    @staticmethod
+    def _write_heartbeat(cursor, session_id, now):
+        cursor.execute('''
+            UPDATE sessions SET heartbeat = ?
+            WHERE session_id = ? AND end_time IS NULL
+        ''', (now, session_id))
+
+    def heartbeat_sessions(self, session_ids):
+        # heartbeat for many running sessions in one queued write
+        if session_ids:
+            now = int(datetime.now().timestamp())
+            self._submit(self._write_heartbeats, [(now, session_id) for session_id in session_ids])
+
+    @staticmethod
+    def _write_heartbeats(cursor, rows):
+        cursor.executemany('''
+            UPDATE sessions SET heartbeat = ?
+            WHERE session_id = ? AND end_time IS NULL
+        ''', rows)
+
+    def get_today_stats(self):
+        result = self._get_rollup(datetime.now().date())
         return {
-            'completed_sessions': result[0] if result[0] else 0,
-            'total_minutes': int(result[1] if result[1] else 0)
+            'completed_sessions': result[0],
+            'total_minutes': int(result[1])
         }
 
     def get_historical_data(self, days=7):
         start_date = (datetime.now() - timedelta(days=days)).date()
+        today = datetime.now().date()
+        if self.day_cache_size and (today - start_date).days < self.day_cache_size:
+            return [
+                {'date': day, 'total_minutes': int(minutes)}
+                for day, (completed, minutes) in self._get_days(start_date, today).items()
+                if completed > 0
+            ]
+
+        self.flush()
         query = '''
-            SELECT 
-                date(start_time) as date,
-                COALESCE(SUM(
-                    CAST(
-                        (strftime('%s', end_time) - strftime('%s', start_time))/60 
-                    AS INTEGER)
-                ), 0) as total_minutes
-            FROM sessions
-            WHERE date(start_time) >= ?
-            AND completed_status = 1
+            SELECT day, total_minutes
+            FROM daily_focus
+            WHERE day >= ?
             AND session_type = 'focus'
-            AND end_time IS NOT NULL
-            GROUP BY date(start_time)
-            ORDER BY date(start_time)
+            AND completed_sessions > 0
+            ORDER BY day
         '''
         
         self.cursor.execute(query, (start_date.strftime('%Y-%m-%d'),))
@@ -97,34 +439,512 @@ class DatabaseManager:
             for row in self.cursor.fetchall()
         ]
 
-    def end_session(self, completed=False):
-        self.cursor.execute('''
+    def end_session(self, session_id, completed=False):
+        end_time = int(datetime.now().timestamp())
+        self._apply_ends([(session_id, completed)], end_time)
+        self._submit(self._write_ends, [(session_id, completed)], end_time)
+
+    @staticmethod
+    def _write_end_session(cursor, session_id, completed, end_time):
+        # Returns whether the session was still open
+        cursor.execute('''
             UPDATE sessions 
             SET end_time = ?, 
                 completed_status = ?
-            WHERE end_time IS NULL 
+            WHERE session_id = ?
+            AND end_time IS NULL
+        ''', (end_time, completed, session_id))
+        closed = cursor.rowcount > 0
+
+        # Fold the closed session into the rollup within the same transaction
+        if completed and closed:
+            cursor.execute('''
+                INSERT INTO daily_focus (day, session_type, completed_sessions, total_minutes)
+                SELECT
+                    day,
+                    session_type,
+                    COUNT(*),
+                    COALESCE(SUM((end_time - start_time) / 60), 0)
+                FROM sessions
+                WHERE session_id = ?
+                GROUP BY day, session_type
+                ON CONFLICT (day, session_type) DO UPDATE SET
+                    completed_sessions = completed_sessions + excluded.completed_sessions,
+                    total_minutes = total_minutes + excluded.total_minutes
+            ''', (session_id,))
+        return closed
+
+    def end_sessions(self, sessions):
+        # end_session for many sessions in one queued write (one transaction);
+        # sessions is a list of (session_id, completed)
+        if sessions:
+            end_time = int(datetime.now().timestamp())
+            self._apply_ends(sessions, end_time)
+            self._submit(self._write_ends, list(sessions), end_time)
+
+    def _write_ends(self, cursor, sessions, end_time):
+        # A session something else closed first (e.g. another process
+        # recovering it as an orphan) doesn't change the rollup, so the
+        # write-through delta _apply_ends made for it is dropped with the cache
+        stale = False
+        for session_id, completed in sessions:
+            if not self._write_end_session(cursor, session_id, completed, end_time) and completed:
+                stale = True
+        if stale:
+            self._stats_changed()
+
+    def recover_orphans(self):
+        # Closes sessions left open by a crash or kill. They end at their last
+        # heartbeat rather than "now", so a stray row can't add hours of focus.
+        # Sessions still heartbeating (e.g. headless.py running beside the app)
+        # are left alone.
+        stale_before = int(datetime.now().timestamp()) - 2 * self.HEARTBEAT_SECONDS
+        self._submit(self._write_recover_orphans, stale_before)
+        self._stats_changed()
+
+    @staticmethod
+    def _write_recover_orphans(cursor, stale_before):
+        cursor.execute('''
+            SELECT session_id, start_time, heartbeat
+            FROM sessions
+            WHERE end_time IS NULL
             AND completed_status IS NULL
-        ''', (datetime.now(), completed))
-        self.conn.commit()
+            AND COALESCE(heartbeat, start_time, 0) < ?
+        ''', (stale_before,))
+        for session_id, start_time, heartbeat in cursor.fetchall():
+            # Time that was actually observed counts as a saved session;
+            # rows that never reported in are closed as incomplete and empty
+            if heartbeat is not None and start_time is not None and heartbeat > start_time:
+                DatabaseManager._write_end_session(cursor, session_id, True, heartbeat)
+            else:
+                DatabaseManager._write_end_session(cursor, session_id, False, start_time)
 
     def get_stats_for_date(self, date):
-        query = """
-            SELECT 
-                COUNT(*) as completed_sessions,
-                COALESCE(SUM(
-                    CAST(
-                        (strftime('%s', end_time) - strftime('%s', start_time))/60 
-                    AS INTEGER)
-                ), 0) as total_minutes
-        FROM sessions 
-        WHERE DATE(start_time) = DATE(?)
-        AND completed_status = 1
-        AND session_type = 'focus'
-        AND end_time IS NOT NULL
-    """
-        self.cursor.execute(query, (date,))
-        result = self.cursor.fetchone()
+        result = self._get_rollup(date)
         return {
             'completed_sessions': result[0],
-            'total_minutes': result[1] or 0
-        }
\ No newline at end of file
+            'total_minutes': result[1]
+        }
+
+    def get_stats_range(self, start, end, granularity='day'):
+        # Dense, zero-filled series of focus stats for every day/week/month bucket
+        # between start and end (inclusive). Built from the day cache when the
+        # range fits in it, otherwise from a single grouped query.
+        start = self._as_date(start)
+        end = self._as_date(end)
+        buckets = list(self._iter_buckets(start, end, granularity))
+        if not self.day_cache_size or (end - start).days >= self.day_cache_size:
+            return self._query_stats_range(start, end, granularity, buckets)
+
+        totals = {bucket: [0, 0] for bucket in buckets}
+        days = self._get_days(start, end)
+        for offset in range((end - start).days + 1):
+            day = start + timedelta(days=offset)
+            completed, minutes = days[day.strftime('%Y-%m-%d')]
+            total = totals[self._bucket_start(day, granularity)]
+            total[0] += completed
+            total[1] += int(minutes)
+        return [
+            {'date': bucket, 'completed_sessions': completed, 'total_minutes': minutes}
+            for bucket, (completed, minutes) in totals.items()
+        ]
+
+    def _query_stats_range(self, start, end, granularity, buckets):
+        self.flush()
+        bucket_expr = self.BUCKET_EXPRESSIONS[granularity]
+        self.cursor.execute(f'''
+            SELECT
+                {bucket_expr} AS bucket,
+                SUM(completed_sessions),
+                SUM(total_minutes)
+            FROM daily_focus
+            WHERE day >= ? AND day <= ?
+            AND session_type = 'focus'
+            GROUP BY bucket
+        ''', (start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')))
+        totals = {row[0]: (row[1], int(row[2])) for row in self.cursor.fetchall()}
+
+        series = []
+        for bucket in buckets:
+            completed, minutes = totals.get(bucket.strftime('%Y-%m-%d'), (0, 0))
+            series.append({
+                'date': bucket,
+                'completed_sessions': completed,
+                'total_minutes': minutes
+            })
+        return series
+
+    @staticmethod
+    def _iter_buckets(start, end, granularity):
+        if granularity == 'day':
+            bucket = start
+        elif granularity == 'week':
+            bucket = start - timedelta(days=start.weekday())
+        elif granularity == 'month':
+            bucket = start.replace(day=1)
+        else:
+            raise ValueError(f"Unknown granularity: {granularity}")
+
+        # Stops on the last bucket rather than stepping past it, which would
+        # overflow when end is in date.max's week or month
+        last = DatabaseManager._bucket_start(end, granularity)
+        while bucket <= last:
+            yield bucket
+            if bucket == last:
+                break
+            if granularity == 'day':
+                bucket += timedelta(days=1)
+            elif granularity == 'week':
+                bucket += timedelta(days=7)
+            elif bucket.month == 12:
+                bucket = bucket.replace(year=bucket.year + 1, month=1)
+            else:
+                bucket = bucket.replace(month=bucket.month + 1)
+
+    @staticmethod
+    def _bucket_start(day, granularity):
+        if granularity == 'week':
+            return day - timedelta(days=day.weekday())
+        if granularity == 'month':
+            return day.replace(day=1)
+        return day
+
+    @staticmethod
+    def _as_date(day):
+        if isinstance(day, str):
+            return datetime.strptime(day[:10], '%Y-%m-%d').date()
+        if isinstance(day, datetime):
+            return day.date()
+        return day
+
+    def _get_rollup(self, day, session_type='focus'):
+        day = self._as_date(day)
+        return self._get_days(day, day, session_type)[day.strftime('%Y-%m-%d')]
+
+    def _get_days(self, start, end, session_type='focus'):
+        # (completed_sessions, total_minutes) for every day from start to end
+        # inclusive, keyed by 'YYYY-MM-DD'. Days missing from the cache are
+        # read with one query and cached.
+        keys = [
+            ((start + timedelta(days=offset)).strftime('%Y-%m-%d'), session_type)
+            for offset in range((end - start).days + 1)
+        ]
+        rows = self._cache_lookup(keys)
+        missing = [key for key in keys if key not in rows]
+        if missing:
+            version = self.stats_version
+            self.flush()
+            self.cursor.execute('''
+                SELECT day, completed_sessions, total_minutes
+                FROM daily_focus
+                WHERE day >= ? AND day <= ? AND session_type = ?
+            ''', (missing[0][0], missing[-1][0], session_type))
+            found = {row[0]: (row[1], row[2]) for row in self.cursor.fetchall()}
+            fetched = {key: found.get(key[0], (0, 0)) for key in missing}
+            self._cache_store(fetched, version)
+            rows.update(fetched)
+        return {day: rows[(day, session_type)] for day, _ in keys}
+
+    # Day cache
+
+    def _check_data_version(self):
+        # PRAGMA data_version on the writer's connection only moves when some
+        # other connection commits: another process (the app, headless.py, an
+        # import, database.archive) or this thread's archive_sessions. What
+        # such a commit changed isn't known here, so the cache is dropped.
+        with self._writer_lock:
+            if self._writer_conn is None:
+                return
+            version = self._writer_conn.execute('PRAGMA data_version').fetchone()[0]
+            changed = version != self._data_version
+            self._data_version = version
+        if changed:
+            self._stats_changed()
+
+    def _cache_lookup(self, keys):
+        # The cached rows among keys, counting hits and misses
+        found = {}
+        if not self.day_cache_size:
+            return found
+        self._check_data_version()
+        with self._cache_lock:
+            for key in keys:
+                row = self._day_cache.get(key)
+                if row is None:
+                    self.cache_misses += 1
+                else:
+                    self.cache_hits += 1
+                    self._day_cache.move_to_end(key)
+                    found[key] = row
+        return found
+
+    def _cache_store(self, rows, version):
+        # version is stats_version from before the rows were read; if stats
+        # changed since, the rows may predate that change and are not cached
+        if not self.day_cache_size:
+            return
+        with self._cache_lock:
+            if version != self.stats_version:
+                return
+            for key, row in rows.items():
+                self._day_cache[key] = row
+                self._day_cache.move_to_end(key)
+            while len(self._day_cache) > self.day_cache_size:
+                self._day_cache.popitem(last=False)
+
+    def _stats_changed(self, deltas=None):
+        # Records a change to the completed-session totals. deltas maps
+        # (day, session_type) -> (sessions, minutes) to add to cached rows;
+        # None means the change isn't known here and the cache is dropped.
+        with self._cache_lock:
+            self.stats_version += 1
+            if deltas is None:
+                self._day_cache.clear()
+                return
+            for key, (sessions, minutes) in deltas.items():
+                row = self._day_cache.get(key)
+                if row is not None:
+                    self._day_cache[key] = (row[0] + sessions, row[1] + minutes)
+
+    def _apply_ends(self, sessions, end_time):
+        # Write-through for end_session(s): runs before the write is queued, so
+        # a reader can't cache the day as it was before this session ended
+        deltas = {}
+        known = True
+        for session_id, completed in sessions:
+            started = self._open_sessions.pop(session_id, None)
+            if not completed:
+                continue
+            if started is None:
+                known = False  # Not started through this manager: day unknown
+                continue
+            day, session_type, start_time = started
+            sessions_done, minutes = deltas.get((day, session_type), (0, 0))
+            # Same truncating division as the rollup's (end_time - start_time) / 60
+            deltas[(day, session_type)] = (sessions_done + 1, minutes + int((end_time - start_time) / 60))
+        self._stats_changed(deltas if known else None)
+
+    def cache_info(self):
+        with self._cache_lock:
+            return {
+                'hits': self.cache_hits,
+                'misses': self.cache_misses,
+                'size': len(self._day_cache),
+                'maxsize': self.day_cache_size,
+            }
+
+    def iter_sessions(self, chunk_size=5000):
+        # Yields every session, archived ones first, chunk_size rows at a time in
+        # session_id order per file (keyset pagination, so memory stays flat
+        # however big it is)
+        self.flush()
+        cursor = self.conn.cursor()
+        for table in itertools.chain(self.archived_tables(), ['main.sessions']):
+            last_id = 0
+            while True:
+                cursor.execute(f'''
+                    SELECT {', '.join(self.EXPORT_COLUMNS)}
+                    FROM {table}
+                    WHERE session_id > ?
+                    ORDER BY session_id
+                    LIMIT ?
+                ''', (last_id, chunk_size))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                yield rows
+                last_id = rows[-1][0]
+
+    def import_sessions(self, chunks):
+        # Inserts chunks of EXPORT_COLUMNS rows, one transaction per chunk.
+        # Sessions already present (same start_time and session_type) are
+        # skipped, and imported rows get fresh ids. Returns the number inserted.
+        inserted = []
+        for rows in chunks:
+            self._submit(self._write_import_chunk, self._skip_archived(rows), inserted)
+            # One chunk in flight at a time keeps memory constant on huge files
+            self.flush()
+            self._stats_changed()
+        return sum(inserted)
+
+    def _skip_archived(self, rows):
+        # The writer's dedup only sees the current file, so sessions already
+        # moved to an archive are dropped here
+        days = [row[6] for row in rows if row[6] is not None]
+        starts = [row[1] for row in rows if row[1] is not None]
+        if not days or not starts:
+            return rows
+        archived = set()
+        for table in self.archived_tables(min(days), max(days)):
+            archived.update(self.conn.execute(f'''
+                SELECT start_time, session_type FROM {table}
+                WHERE start_time BETWEEN ? AND ?
+            ''', (min(starts), max(starts))).fetchall())
+        if not archived:
+            return rows
+        return [row for row in rows if (row[1], row[4]) not in archived]
+
+    @classmethod
+    def _write_import_chunk(cls, cursor, rows, inserted):
+        columns = ', '.join(cls.EXPORT_COLUMNS)
+        cursor.execute(f'CREATE TEMP TABLE IF NOT EXISTS import_staging ({columns})')
+        cursor.execute('DELETE FROM import_staging')
+        cursor.executemany(f'''
+            INSERT INTO import_staging VALUES ({', '.join('?' * len(cls.EXPORT_COLUMNS))})
+        ''', rows)
+
+        # Imported rows are given ids by SQLite, all above the largest one so far
+        cursor.execute('''
+            SELECT MAX(
+                COALESCE((SELECT MAX(session_id) FROM sessions), 0),
+                COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'sessions'), 0)
+            )
+        ''')
+        last_id = cursor.fetchone()[0]
+
+        # Dedup on the natural key, both against existing rows and within the chunk
+        new_columns = ', '.join(cls.EXPORT_COLUMNS[1:])
+        cursor.execute(f'''
+            INSERT INTO sessions ({new_columns})
+            SELECT {new_columns}
+            FROM import_staging AS staged
+            WHERE NOT EXISTS (
+                SELECT 1 FROM sessions
+                WHERE sessions.start_time = staged.start_time
+                AND sessions.session_type IS staged.session_type
+            )
+            GROUP BY start_time, session_type
+            ORDER BY start_time
+        ''')
+        inserted.append(cursor.rowcount)
+
+        # Fold the completed sessions just inserted (not the skipped duplicates) into the rollup
+        cursor.execute('''
+            INSERT INTO daily_focus (day, session_type, completed_sessions, total_minutes)
+            SELECT
+                day,
+                session_type,
+                COUNT(*),
+                COALESCE(SUM((end_time - start_time) / 60), 0)
+            FROM sessions
+            WHERE session_id > ?
+            AND completed_status = 1
+            AND end_time IS NOT NULL
+            AND session_type IS NOT NULL
+            AND day IS NOT NULL
+            GROUP BY day, session_type
+            ON CONFLICT (day, session_type) DO UPDATE SET
+                completed_sessions = completed_sessions + excluded.completed_sessions,
+                total_minutes = total_minutes + excluded.total_minutes
+        ''', (last_id,))
+
+    def rebuild_daily_focus(self):
+        # Regenerates the rollup from the raw sessions, e.g. after it drifted
+        # because rows were edited by hand. Archived sessions can't change, so
+        # their totals are read here and handed to the writer.
+        archived = []
+        for table in self.archived_tables():
+            archived += self.conn.execute(self.ROLLUP_QUERY.format(table=table)).fetchall()
+        self._submit(self._write_rebuild_daily_focus, archived)
+        self.flush()
+        self._stats_changed()
+        self.cursor.execute('SELECT COUNT(*) FROM daily_focus')
+        return self.cursor.fetchone()[0]
+
+    @classmethod
+    def _write_rebuild_daily_focus(cls, cursor, archived=()):
+        cursor.execute('DELETE FROM daily_focus')
+        cursor.execute(f'''
+            INSERT INTO daily_focus (day, session_type, completed_sessions, total_minutes)
+            {cls.ROLLUP_QUERY.format(table='sessions')}
+        ''')
+        cursor.executemany('''
+            INSERT INTO daily_focus (day, session_type, completed_sessions, total_minutes)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (day, session_type) DO UPDATE SET
+                completed_sessions = completed_sessions + excluded.completed_sessions,
+                total_minutes = total_minutes + excluded.total_minutes
+        ''', archived)
+
+    # Archives
+
+    def archive_sessions(self, days=None):
+        # Moves closed sessions from more than `days` (default
+        # archive.horizon_days()) before today into per-year archive files,
+        # in committed batches, and returns how many moved. It runs on this
+        # thread's connection because ATTACH can't happen inside the writer's
+        # transactions. Rows are copied with INSERT OR IGNORE before they are
+        # deleted here, so a run killed half way is finished by the next one.
+        cutoff = (datetime.now().date() - timedelta(days=archive.horizon_days(days))).isoformat()
+        self.flush()
+        conn = self.conn
+        columns = ', '.join(self.EXPORT_COLUMNS)
+        years = [year for year, in conn.execute('''
+            SELECT DISTINCT CAST(substr(day, 1, 4) AS INTEGER)
+            FROM sessions
+            WHERE day < ?
+            AND end_time IS NOT NULL
+        ''', (cutoff,))]
+
+        moved = 0
+        for year in years:
+            schema, = archive.attach(conn, self.path, [year], create=True)
+            conn.execute(self.SESSIONS_SCHEMA.format(table=f'{schema}.sessions'))
+            conn.execute(f'CREATE INDEX IF NOT EXISTS {schema}.idx_sessions_start_time ON sessions (start_time)')
+            conn.execute(f'CREATE INDEX IF NOT EXISTS {schema}.idx_sessions_day ON sessions (day)')
+            conn.commit()
+
+            first_day, end_day = f'{year:04d}-01-01', min(f'{year + 1:04d}-01-01', cutoff)
+            session_ids = [session_id for session_id, in conn.execute('''
+                SELECT session_id FROM sessions
+                WHERE day >= ? AND day < ?
+                AND end_time IS NOT NULL
+                ORDER BY session_id
+            ''', (first_day, end_day))]
+            selection = '''
+                session_id BETWEEN ? AND ?
+                AND day >= ? AND day < ?
+                AND end_time IS NOT NULL
+            '''
+            for offset in range(0, len(session_ids), self.ARCHIVE_BATCH_SIZE):
+                batch = session_ids[offset:offset + self.ARCHIVE_BATCH_SIZE]
+                params = (batch[0], batch[-1], first_day, end_day)
+                conn.execute(f'''
+                    INSERT OR IGNORE INTO {schema}.sessions ({columns})
+                    SELECT {columns} FROM main.sessions WHERE {selection}
+                ''', params)
+                conn.execute(f'''
+                    INSERT INTO archives (year, first_day, last_day)
+                    SELECT ?, MIN(day), MAX(day) FROM main.sessions WHERE {selection}
+                    ON CONFLICT (year) DO UPDATE SET
+                        first_day = min(first_day, excluded.first_day),
+                        last_day = max(last_day, excluded.last_day)
+                ''', (year, *params))
+                moved += conn.execute(f'DELETE FROM main.sessions WHERE {selection}', params).rowcount
+                conn.commit()
+
+            conn.execute(f'''
+                UPDATE archives SET sessions = (SELECT COUNT(*) FROM {schema}.sessions)
+                WHERE year = ?
+            ''', (year,))
+            conn.commit()
+        return moved
+
+    def archived_tables(self, start_day=None, end_day=None):
+        # Yields the sessions table of every archive holding sessions between
+        # start_day and end_day ('YYYY-MM-DD', inclusive), attaching each to
+        # this thread's connection just before it's yielded. Archive files
+        # that have been moved away are skipped.
+        for year in archive.archived_years(self.conn, start_day, end_day):
+            for schema in archive.attach(self.conn, self.path, [year]):
+                yield f'{schema}.sessions'
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['rebuild-rollups']:
+        db = DatabaseManager()
+        rows = db.rebuild_daily_focus()
+        db.close()
+        print(f"Rebuilt daily_focus: {rows} rows")
+    else:
+        print("usage: python -m database.db_manager rebuild-rollups")
+        sys.exit(1)
@@ -0,0 +1,250 @@
+# session_io.py
+# Chunked export/import of session history, for moving it between machines or
+# into analysis tools. Memory use is bounded by the chunk size, not the history.
+#
+#   python -m database.session_io export sessions.csv
+#   python -m database.session_io import sessions.pomo
+#
+# Formats (picked from the file extension, or --format):
+#   .csv            header row + one row per session
+#   .ndjson/.jsonl  one JSON object per session
+#   .pomo           compact columnar binary: zlib-compressed column blocks per chunk
+import argparse
+import csv
+import json
+import struct
+import sys
+import time
+import zlib
+from array import array
+from datetime import date
+from database.db_manager import DatabaseManager
+
+COLUMNS = DatabaseManager.EXPORT_COLUMNS
+CHUNK_SIZE = 5000
+
+BINARY_MAGIC = b'POMOCOL1'
+# Integer columns stored as little-endian int64 arrays; NULL becomes NULL_INT
+INT_COLUMNS = ('session_id', 'start_time', 'end_time', 'duration', 'heartbeat')
+NULL_INT = -2**63
+
+FORMATS = {'.csv': 'csv', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.pomo': 'binary'}
+
+
+def detect_format(path):
+    for extension, name in FORMATS.items():
+        if path.endswith(extension):
+            return name
+    raise ValueError(f"Can't tell the format of {path}; pass --format")
+
+
+# CSV
+
+def write_csv(chunks, stream):
+    writer = csv.writer(stream)
+    writer.writerow(COLUMNS)
+    for rows in chunks:
+        writer.writerows(['' if value is None else value for value in row] for row in rows)
+        yield len(rows)
+
+
+def read_csv(stream, chunk_size=CHUNK_SIZE):
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+    positions = [header.index(column) for column in COLUMNS]
+    chunk = []
+    for record in reader:
+        chunk.append(tuple(_from_text(column, record[index]) for column, index in zip(COLUMNS, positions)))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _from_text(column, value):
+    if value == '':
+        return None
+    if column in ('session_type', 'day'):
+        return value
+    if column == 'completed_status' and value in ('True', 'False'):
+        return int(value == 'True')
+    return int(value)
+
+
+# NDJSON
+
+def write_ndjson(chunks, stream):
+    for rows in chunks:
+        stream.write(''.join(json.dumps(dict(zip(COLUMNS, row))) + '\n' for row in rows))
+        yield len(rows)
+
+
+def read_ndjson(stream, chunk_size=CHUNK_SIZE):
+    chunk = []
+    for line in stream:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        chunk.append(tuple(record.get(column) for column in COLUMNS))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Columnar binary
+#
+# File: BINARY_MAGIC, then per chunk: <row count:u32><payload size:u32><zlib payload>.
+# Payload: the INT_COLUMNS as int64 arrays, completed_status as int8 (-1 = NULL),
+# day as int32 date ordinals (0 = NULL), then session_type dictionary-encoded:
+# <entries:u16>, each <len:u16><utf-8>, followed by a uint16 code per row (0 = NULL).
+
+def _little_endian(values):
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+
+def _encode_chunk(rows):
+    by_column = dict(zip(COLUMNS, zip(*rows)))
+    parts = []
+    for column in INT_COLUMNS:
+        parts.append(_little_endian(array('q', (
+            NULL_INT if value is None else int(value) for value in by_column[column]
+        ))))
+    parts.append(_little_endian(array('b', (
+        -1 if value is None else int(value) for value in by_column['completed_status']
+    ))))
+    parts.append(_little_endian(array('i', (
+        0 if value is None else date.fromisoformat(value).toordinal() for value in by_column['day']
+    ))))
+
+    types = sorted({value for value in by_column['session_type'] if value is not None})
+    codes = {value: index + 1 for index, value in enumerate(types)}
+    parts.append(struct.pack('<H', len(types)))
+    for value in types:
+        encoded = value.encode('utf-8')
+        parts.append(struct.pack('<H', len(encoded)) + encoded)
+    parts.append(_little_endian(array('H', (
+        codes.get(value, 0) for value in by_column['session_type']
+    ))))
+    return zlib.compress(b''.join(parts))
+
+
+def _decode_chunk(count, payload):
+    payload = zlib.decompress(payload)
+    offset = 0
+
+    def take(typecode):
+        nonlocal offset
+        values = array(typecode)
+        size = values.itemsize * count
+        values.frombytes(payload[offset:offset + size])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        offset += size
+        return values
+
+    columns = {}
+    for column in INT_COLUMNS:
+        columns[column] = [None if value == NULL_INT else value for value in take('q')]
+    columns['completed_status'] = [None if value == -1 else value for value in take('b')]
+    columns['day'] = [None if value == 0 else date.fromordinal(value).isoformat() for value in take('i')]
+
+    (entries,) = struct.unpack_from('<H', payload, offset)
+    offset += 2
+    types = [None]
+    for _ in range(entries):
+        (length,) = struct.unpack_from('<H', payload, offset)
+        offset += 2
+        types.append(payload[offset:offset + length].decode('utf-8'))
+        offset += length
+    columns['session_type'] = [types[code] for code in take('H')]
+
+    return list(zip(*(columns[column] for column in COLUMNS)))
+
+
+def write_binary(chunks, stream):
+    stream.write(BINARY_MAGIC)
+    for rows in chunks:
+        payload = _encode_chunk(rows)
+        stream.write(struct.pack('<II', len(rows), len(payload)))
+        stream.write(payload)
+        yield len(rows)
+
+
+def read_binary(stream, chunk_size=None):
+    # Chunks come back as they were written; chunk_size is fixed at export time
+    if stream.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise ValueError("Not a pomodoro session export")
+    while True:
+        header = stream.read(8)
+        if not header:
+            return
+        count, size = struct.unpack('<II', header)
+        yield _decode_chunk(count, stream.read(size))
+
+
+WRITERS = {'csv': write_csv, 'ndjson': write_ndjson, 'binary': write_binary}
+READERS = {'csv': read_csv, 'ndjson': read_ndjson, 'binary': read_binary}
+
+
+def _open(path, fmt, mode):
+    if fmt == 'binary':
+        return open(path, mode + 'b')
+    return open(path, mode, newline='' if fmt == 'csv' else None, encoding='utf-8')
+
+
+def export_sessions(db, path, fmt=None, chunk_size=CHUNK_SIZE):
+    # Returns the number of sessions written
+    fmt = fmt or detect_format(path)
+    with _open(path, fmt, 'w') as stream:
+        return sum(WRITERS[fmt](db.iter_sessions(chunk_size), stream))
+
+
+def import_sessions(db, path, fmt=None, chunk_size=CHUNK_SIZE):
+    # Returns (sessions read, sessions inserted); duplicates are skipped
+    fmt = fmt or detect_format(path)
+    read = 0
+
+    def counted(chunks):
+        nonlocal read
+        for rows in chunks:
+            read += len(rows)
+            yield rows
+
+    with _open(path, fmt, 'r') as stream:
+        inserted = db.import_sessions(counted(READERS[fmt](stream, chunk_size)))
+    return read, inserted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export or import pomodoro session history")
+    parser.add_argument('command', choices=['export', 'import'])
+    parser.add_argument('path')
+    parser.add_argument('--format', choices=sorted(WRITERS), help="default: from the file extension")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--db', help="database file (default: $POMO_DB_PATH or pomodoro.db)")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(args.db)
+    started = time.perf_counter()
+    try:
+        if args.command == 'export':
+            rows = export_sessions(db, args.path, args.format, args.chunk_size)
+            summary = f"Exported {rows} sessions"
+        else:
+            rows, inserted = import_sessions(db, args.path, args.format, args.chunk_size)
+            summary = f"Imported {inserted} of {rows} sessions ({rows - inserted} duplicates skipped)"
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - started
+    print(f"{summary} in {elapsed:.2f}s ({rows / elapsed if elapsed else 0:,.0f} rows/s)")
+
+
+if __name__ == '__main__':
+    main()
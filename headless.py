@@ -0,0 +1,170 @@
+# headless.py
+# Terminal pomodoro timer without Qt: the same session lifecycle as the GUI
+# (recover orphans, start, heartbeat, pause/resume, save or discard) on an
+# asyncio loop, writing to the same database.
+#
+#   python headless.py                      # one 25 minute focus session
+#   python headless.py --minutes 50 --cycles 4 --break-minutes 10
+#
+# Keys (when stdin is a terminal): p pause/resume, s stop and save,
+# d stop and discard, q quit (discarding the running session). Ctrl+C discards too.
+import argparse
+import asyncio
+import os
+import sqlite3
+import sys
+from database.db_manager import DatabaseManager
+from components.countdown import Countdown
+
+BAR_WIDTH = 30
+
+
+class HeadlessTimer:
+    def __init__(self, db, stream=sys.stdout):
+        self.db = db
+        self.stream = stream
+        self.countdown = Countdown()
+        self.session_id = None
+        self.session_type = "focus"
+        self.session_goal = ""
+        self.next_heartbeat = None  # Countdown clock value the next heartbeat is due at
+        self.result = None  # How the running session should end: 'save', 'discard' or 'quit'
+        self._wake = asyncio.Event()
+
+    async def run_session(self, session_type, minutes, goal=""):
+        # Runs one session to the end; returns 'completed', 'save', 'discard' or 'quit'
+        self.session_type = session_type
+        self.session_goal = goal
+        total_time = minutes * 60
+        self.countdown.start(total_time)
+        self.result = None
+        self.session_id = self.db.start_session(session_type, total_time)
+        self.next_heartbeat = self.countdown.clock() + DatabaseManager.HEARTBEAT_SECONDS
+
+        while self.result is None:
+            self.render()
+            if self.countdown.remaining() <= 0:
+                self.result = 'completed'
+                break
+            # Heartbeats go on while paused, so another process's orphan
+            # recovery doesn't close the session
+            now = self.countdown.clock()
+            if now >= self.next_heartbeat:
+                self.next_heartbeat = now + DatabaseManager.HEARTBEAT_SECONDS
+                self.db.heartbeat(self.session_id)
+            timeout = self.next_heartbeat - now
+            if self.countdown.is_running:
+                timeout = min(timeout, self.countdown.ms_until_next_tick() / 1000)
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        self.render()
+        self.stream.write('\n')
+        self.db.end_session(self.session_id, self.result in ('completed', 'save'))
+        self.session_id = None
+        if self.result == 'completed':
+            self.stream.write('\a')  # Terminal bell in place of the notification sound
+        self.stream.flush()
+        return self.result
+
+    def togglePause(self):
+        if self.countdown.is_running:
+            self.countdown.pause()
+        else:
+            self.countdown.resume()
+        self._wake.set()
+
+    def stop(self, result):
+        if self.session_id is not None:
+            self.result = result
+        self._wake.set()
+
+    def onKey(self, key):
+        actions = {
+            'p': self.togglePause,
+            's': lambda: self.stop('save'),
+            'd': lambda: self.stop('discard'),
+            'q': lambda: self.stop('quit'),
+        }
+        action = actions.get(key.lower())
+        if action:
+            action()
+
+    def render(self):
+        remaining = self.countdown.remaining_seconds()
+        filled = int(BAR_WIDTH * self.countdown.progress())
+        state = "" if self.countdown.is_running or self.result else "  (paused)"
+        goal = f"  {self.session_goal}" if self.session_goal else ""
+        self.stream.write(
+            f"\r\033[K{self.session_type:<5} {remaining // 60:02d}:{remaining % 60:02d} "
+            f"[{'#' * filled}{'-' * (BAR_WIDTH - filled)}]{state}{goal}"
+        )
+        self.stream.flush()
+
+
+def watch_keys(loop, timer):
+    # Feeds single key presses to the timer; returns a function restoring the
+    # terminal. Without a POSIX terminal there are no keys, only Ctrl+C.
+    if not sys.stdin.isatty() or os.name != 'posix':
+        return lambda: None
+    import termios
+    import tty
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    loop.add_reader(fd, lambda: timer.onKey(os.read(fd, 1).decode(errors='ignore')))
+
+    def restore():
+        loop.remove_reader(fd)
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    return restore
+
+
+async def run(db, args):
+    timer = HeadlessTimer(db)
+    restore = watch_keys(asyncio.get_running_loop(), timer)
+    try:
+        for cycle in range(args.cycles):
+            result = await timer.run_session("focus", args.minutes, args.goal)
+            if result == 'quit' or cycle == args.cycles - 1:
+                break
+            result = await timer.run_session("break", args.break_minutes)
+            if result == 'quit':
+                break
+    finally:
+        restore()
+        # Cancelled (Ctrl+C): the running session is recorded as incomplete
+        if timer.session_id is not None:
+            db.end_session(timer.session_id, False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pomodoro timer in the terminal")
+    parser.add_argument('--minutes', type=int, default=25, help="focus session length")
+    parser.add_argument('--break-minutes', type=int, default=5)
+    parser.add_argument('--cycles', type=int, default=1, help="focus sessions to run, with breaks between")
+    parser.add_argument('--goal', default="", help="shown next to the focus countdown")
+    parser.add_argument('--db', help="database file (default: $POMO_DB_PATH or pomodoro.db)")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(args.db)
+    # Close whatever a previous crash left open before anything new starts
+    db.recover_orphans()
+    try:
+        asyncio.run(run(db, args))
+    except KeyboardInterrupt:
+        print()
+    except sqlite3.OperationalError as e:
+        # Another process held the write lock past busy_timeout
+        print(f"\nThe session couldn't be recorded: {e}")
+    finally:
+        stats = db.get_today_stats()
+        db.close()
+    print(f"Today: {stats['completed_sessions']} completed, {stats['total_minutes']} minutes")
+
+
+if __name__ == '__main__':
+    main()
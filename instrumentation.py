@@ -0,0 +1,163 @@
+# instrumentation.py
+# Opt-in timing histograms for finding out where a stutter comes from: SQLite
+# statements, widget paints, stats refreshes and timer tick jitter.
+#
+#   POMO_PROFILE=1 python main.py                       # dumps pomodoro-profile.json on exit
+#   POMO_PROFILE=1 POMO_PROFILE_FILE=run.json python main.py
+#
+# While profiling, Ctrl+Shift+D in the timer window opens a live report.
+# With POMO_PROFILE unset every hook below is a no-op: decorators return the
+# function unchanged and the database uses plain sqlite3 connections.
+import atexit
+import json
+import os
+import re
+import sqlite3
+import time
+from functools import wraps
+
+ENABLED = os.environ.get('POMO_PROFILE', '') not in ('', '0')
+DUMP_PATH = os.environ.get('POMO_PROFILE_FILE', 'pomodoro-profile.json')
+
+# Samples are counted in power-of-two buckets of microseconds (1us .. ~35min),
+# so recording is O(1) and memory stays fixed however long the app runs
+BUCKETS = 32
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = 0.0
+
+    def record(self, ms):
+        # Not locked: a rare lost increment under thread contention is an
+        # acceptable price for keeping the hot path cheap
+        self.counts[min(BUCKETS - 1, max(0, int(ms * 1000)).bit_length())] += 1
+        self.count += 1
+        self.total_ms += ms
+        if self.min_ms is None or ms < self.min_ms:
+            self.min_ms = ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, fraction):
+        # Upper bound of the bucket holding the requested rank
+        rank = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(self.max_ms, (1 << bucket) / 1000)
+        return self.max_ms
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'min_ms': self.min_ms or 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': self.max_ms,
+        }
+
+
+_histograms = {}
+
+
+def record(name, ms):
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms.setdefault(name, Histogram())
+    histogram.record(ms)
+
+
+def timed(name):
+    # Decorator recording each call's duration under name
+    def decorate(function):
+        if not ENABLED:
+            return function
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, (time.perf_counter() - started) * 1000)
+        return wrapper
+    return decorate
+
+
+def snapshot():
+    return {name: _histograms[name].summary() for name in sorted(_histograms)}
+
+
+def report():
+    # Plain-text table of every histogram, slowest p95 first
+    rows = sorted(snapshot().items(), key=lambda item: item[1]['p95_ms'], reverse=True)
+    lines = [f"{'name':<48} {'count':>7} {'mean':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  (ms)"]
+    for name, stats in rows:
+        lines.append(
+            f"{name[:48]:<48} {stats['count']:>7} {stats['mean_ms']:>8.2f} {stats['p50_ms']:>8.2f} "
+            f"{stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f} {stats['max_ms']:>8.2f}"
+        )
+    return '\n'.join(lines)
+
+
+def dump(path=None):
+    with open(path or DUMP_PATH, 'w') as stream:
+        json.dump(snapshot(), stream, indent=2)
+
+
+# SQLite statement timing
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _statement_name(sql):
+    # Statements are fixed strings with ? parameters, so their normalized text
+    # is a small, stable set of histogram names
+    return 'sql: ' + _WHITESPACE.sub(' ', sql).strip()[:80]
+
+
+class TimedCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=()):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            record(_statement_name(sql), (time.perf_counter() - started) * 1000)
+
+    def executemany(self, sql, seq_of_parameters):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            record(_statement_name(sql), (time.perf_counter() - started) * 1000)
+
+
+class TimedConnection(sqlite3.Connection):
+    # Used by database.connection.connect when profiling is on
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self):
+        started = time.perf_counter()
+        try:
+            return super().commit()
+        finally:
+            record('sql: COMMIT', (time.perf_counter() - started) * 1000)
+
+
+if ENABLED:
+    atexit.register(dump)
@@ -1,15 +1,15 @@
+import time
+_process_started = time.perf_counter()
+
 import sys, os
+import logging
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QFontDatabase, QFont
+from PyQt6.QtGui import QFont
 from pomodoro_app import PomodoroTimer
+from startup import StartupPipeline, register_fonts
 import platform
 
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    
-    # Load fonts at application startup
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    
+def load_fonts(app):
     # Platform-specific font paths
     if platform.system() == 'Darwin':  # macOS
         system_font = "SF Pro Display"
@@ -21,32 +21,59 @@ if __name__ == '__main__':
         system_font = "Ubuntu"
         fallback_font = "DejaVu Sans"
 
-    # Try to load custom fonts if available
-    sf_font_path = os.path.join(current_dir, 'assets', 'font', 'SFCompactDisplay-Regular.otf')
-    ny_font_path = os.path.join(current_dir, 'assets', 'font', 'NewYorkMedium-Regular.otf')
-    
-    sf_font_id = QFontDatabase.addApplicationFont(sf_font_path)
-    ny_font_id = QFontDatabase.addApplicationFont(ny_font_path)
-    
-    # Use system fonts if custom fonts fail to load
-    if sf_font_id == -1:
+    # Custom fonts from assets/font, registered once; system fonts if they fail to load
+    fonts = register_fonts()
+    sf_families = fonts.get('SFCompactDisplay-Regular.otf')
+    ny_families = fonts.get('NewYorkMedium-Regular.otf')
+
+    if not sf_families:
         print(f"Using system font: {system_font}")
         font_family = system_font
     else:
-        families = QFontDatabase.applicationFontFamilies(sf_font_id)
-        font_family = families[0] if families else system_font
-    
-    if ny_font_id == -1:
+        font_family = sf_families[0]
+
+    if not ny_families:
         ny_font_family = fallback_font
     else:
-        ny_families = QFontDatabase.applicationFontFamilies(ny_font_id)
-        ny_font_family = ny_families[0] if ny_families else fallback_font
+        ny_font_family = ny_families[0]
         os.environ['POMO_NY_FONT_FAMILY'] = ny_font_family
-    
+
     # Set application-wide default font
     app.setFont(QFont(font_family, 10))
     os.environ['POMO_FONT_FAMILY'] = font_family
-    
+
+def show_window():
+    global timer
     timer = PomodoroTimer()
     timer.show()
-    sys.exit(app.exec())
\ No newline at end of file
+
+if __name__ == '__main__':
+    # `python main.py --startup-time` logs each startup phase and exits once all have run
+    startup_time = '--startup-time' in sys.argv
+    logging.basicConfig(format='startup %(message)s',
+                        level=logging.INFO if startup_time else logging.WARNING)
+
+    app = QApplication(sys.argv)
+
+    # The window is on screen after the first two phases; the rest run one
+    # per event-loop pass afterwards
+    startup = StartupPipeline()
+    startup.add('fonts', lambda: load_fonts(app))
+    startup.add('window', show_window)
+    startup.add('database', lambda: timer.ensureDatabase(), deferred=True)
+    startup.add('sound', lambda: timer.ensureSound(), deferred=True)
+    startup.add('tray', lambda: timer.ensureSystemTray(), deferred=True)
+    startup.add('stats', lambda: timer.ensureStatsPage(), deferred=True)
+
+    if startup_time:
+        def report_startup():
+            shown_ms = (startup.ready_at - _process_started) * 1000
+            deferred = {name for name, _, is_deferred in startup.phases if is_deferred}
+            deferred_ms = sum(ms for name, ms in startup.timings if name in deferred)
+            print(f"Timer window shown: {shown_ms:.0f} ms after process start")
+            print(f"Deferred phases (after the window was up): {deferred_ms:.0f} ms")
+            timer.quitApp()
+        startup.on_finished = report_startup
+
+    startup.run()
+    sys.exit(app.exec())
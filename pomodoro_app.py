@@ -1,48 +1,90 @@
 import sys
+import time
+import sqlite3
 from datetime import datetime
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QPushButton, QSlider, QLabel, QSystemTrayIcon, 
                             QMenu, QDialog, QStackedWidget, QInputDialog, QMessageBox)
-from PyQt6.QtCore import Qt, QTimer, QRect
-from PyQt6.QtGui import QPainter, QColor, QPen, QIcon, QFontDatabase, QFont
+from PyQt6.QtCore import Qt, QTimer, QRect, QObject, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QPen, QIcon, QKeySequence, QShortcut
 from components.circular_progress import CircularProgressBar
-from components.stats_widget import StatsWidget
+from components.countdown import Countdown
 from components.completion_dialog import CompletionDialog
+from components import theme
 from database.db_manager import DatabaseManager
-from PyQt6.QtMultimedia import QSoundEffect
+import instrumentation
 from PyQt6.QtCore import QUrl
 import os, platform
 
+class DatabaseSignals(QObject):
+    # Emitted from the database writer thread after each group commit;
+    # Qt queues it onto the main thread
+    written = pyqtSignal()
+
 class PomodoroTimer(QMainWindow):
     def __init__(self):
         super().__init__()
+        # Fonts are registered once by startup.register_fonts (see main.py)
         self.font_family = os.environ.get('POMO_FONT_FAMILY', 'Arial')  # Default to Arial
-        self.loadFonts()
-        self.db = DatabaseManager()
-        self.setupSounds()
-        self.initUI()
-        self.setupSystemTray()
         self.session_goal = ""
-        
-    def loadFonts(self):
-        font_dir = os.path.join(os.path.dirname(__file__), 'assets', 'font')
-        if os.path.exists(font_dir):
-            for font_file in os.listdir(font_dir):
-                if font_file.endswith(('.ttf', '.otf')):
-                    QFontDatabase.addApplicationFont(os.path.join(font_dir, font_file))
-
-    def setupSounds(self):
-        self.timer_sound = QSoundEffect()
-        sound_path = os.path.join(os.path.dirname(__file__), 'assets', 'notification.wav')
-        self.timer_sound.setSource(QUrl.fromLocalFile(sound_path))
-        self.timer_sound.setVolume(1.0)
+
+        # Only what the first frame needs is built here. The database, sound
+        # and tray come up in deferred startup phases (see main.py); each
+        # ensure* method also builds its part on first use if that's sooner.
+        self.db = None
+        self.stats_server = None
+        self.timer_sound = None
+        self.tray_icon = None
+        self.initUI()
+
+        # Hidden timing report, only when started with POMO_PROFILE=1
+        self.debug_panel = None
+        if instrumentation.ENABLED:
+            QShortcut(QKeySequence("Ctrl+Shift+D"), self, self.showDebugPanel)
+
+    def ensureDatabase(self):
+        if self.db is None:
+            self.db_signals = DatabaseSignals()
+            self.db = DatabaseManager(on_write=self.db_signals.written.emit)
+            # Close whatever a previous crash left open before anything new starts
+            self.db.recover_orphans()
+
+            # Optional JSON stats API for dashboards (see stats_server.py)
+            stats_port = os.environ.get('POMO_STATS_PORT')
+            if stats_port:
+                from stats_server import StatsServer
+                self.stats_server = StatsServer(self.db, port=int(stats_port))
+                self.stats_server.start_in_thread()
+                QApplication.instance().aboutToQuit.connect(self.stats_server.stop)
+
+            # Refresh stats once session writes land, and flush the queue on any quit path
+            self.db_signals.written.connect(self.refreshStats)
+            QApplication.instance().aboutToQuit.connect(self.db.close)
+        return self.db
+
+    def ensureSound(self):
+        # QtMultimedia is only imported here; without it the timer runs silently
+        if self.timer_sound is None:
+            try:
+                from PyQt6.QtMultimedia import QSoundEffect
+            except ImportError as e:
+                print(f"Sound unavailable: {e}")
+                self.timer_sound = False
+                return None
+            self.timer_sound = QSoundEffect()
+            sound_path = os.path.join(os.path.dirname(__file__), 'assets', 'notification.wav')
+            self.timer_sound.setSource(QUrl.fromLocalFile(sound_path))
+            self.timer_sound.setVolume(1.0)
+        return self.timer_sound or None
 
     def playTimerEndSound(self):
-        self.timer_sound.play()
+        sound = self.ensureSound()
+        if sound is not None:
+            sound.play()
 
     def initUI(self):
         self.setWindowTitle('Pomodoro Timer')
-        self.setStyleSheet(self.getStyleSheet())
+        theme.apply()
 
         # Main widget and layout
         central_widget = QWidget()
@@ -57,11 +99,14 @@ class PomodoroTimer(QMainWindow):
         self.timer_layout = QVBoxLayout(self.timer_widget)
         self.setupTimerPage()
         
-        # Stats Page
-        self.stats_widget = StatsWidget(self.db)
+        # Stats Page: built (and matplotlib imported) on the first visit,
+        # a placeholder holds its slot until then
+        self.stats_widget = None
+        self.stats_placeholder = QLabel("Loading stats...")
+        self.stats_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.stacked_widget.addWidget(self.timer_widget)
-        self.stacked_widget.addWidget(self.stats_widget)
+        self.stacked_widget.addWidget(self.stats_placeholder)
         self.main_layout.addWidget(self.stacked_widget)
 
         # Navigation buttons
@@ -74,21 +119,36 @@ class PomodoroTimer(QMainWindow):
 
         # Connect navigation signals
         self.timer_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(0))
-        self.stats_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(1))
+        self.stats_btn.clicked.connect(self.showStatsPage)
 
         self.resize(347, 749)
 
+    def showStatsPage(self):
+        self.ensureStatsPage()
+        self.stacked_widget.setCurrentIndex(1)
+
+    def ensureStatsPage(self):
+        if self.stats_widget is None:
+            from components.stats_widget import StatsWidget
+            self.stats_widget = StatsWidget(self.ensureDatabase())
+            self.stacked_widget.removeWidget(self.stats_placeholder)
+            self.stats_placeholder.deleteLater()
+            self.stats_placeholder = None
+            self.stacked_widget.insertWidget(1, self.stats_widget)
+        return self.stats_widget
+
+    def refreshStats(self):
+        # Nothing to refresh until the Stats page has been opened
+        if self.stats_widget is not None:
+            self.stats_widget.updateStats()
+
     def setupTimerPage(self):
         # Progress bar
         self.progress_bar = CircularProgressBar()
         self.timer_layout.addWidget(self.progress_bar)
 
-        # Create font for all buttons
-        button_font = QFont(self.font_family, 10, QFont.Weight.Medium)
-
         # Add goal button
         self.goal_button = QPushButton("Set Goal")
-        self.goal_button.setFont(button_font)
         self.goal_button.setObjectName("controlButton")
         self.goal_button.clicked.connect(self.setSessionGoal)
         self.timer_layout.addWidget(self.goal_button)
@@ -97,8 +157,6 @@ class PomodoroTimer(QMainWindow):
         presets_layout = QHBoxLayout()
         self.btn_25 = QPushButton("25 minutes")
         self.btn_50 = QPushButton("50 minutes")
-        self.btn_25.setFont(button_font)
-        self.btn_50.setFont(button_font)
         self.btn_25.setObjectName("presetButton")
         self.btn_50.setObjectName("presetButton")
         presets_layout.addWidget(self.btn_25)
@@ -139,15 +197,27 @@ class PomodoroTimer(QMainWindow):
         self.btn_25.clicked.connect(lambda: self.setPresetDuration(25))
         self.btn_50.clicked.connect(lambda: self.setPresetDuration(50))
 
-        # Timer setup
+        # Timer setup: the countdown owns the deadline, the QTimer only wakes us
+        # up at the next second boundary
+        self.countdown = Countdown()
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self.updateTimer)
-        self.remaining_time = 0
-        self.total_time = 0
+        # When the armed tick should fire, for measuring jitter while profiling
+        self.tick_due = None
+        # Reports the open session alive, paused or not, so another process's
+        # orphan recovery leaves it alone
+        self.heartbeat_timer = QTimer()
+        self.heartbeat_timer.setInterval(DatabaseManager.HEARTBEAT_SECONDS * 1000)
+        self.heartbeat_timer.timeout.connect(self.sendHeartbeat)
         self.is_active = False
         self.session_type = "focus"
+        self.session_id = None  # Open database session, kept across pause/resume
 
-    def setupSystemTray(self):
+    def ensureSystemTray(self):
+        if self.tray_icon is not None:
+            return
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_icon.setIcon(QIcon("assets/icon.png"))  # I will do this later
         
@@ -156,11 +226,26 @@ class PomodoroTimer(QMainWindow):
         quit_action = tray_menu.addAction("Quit")
         
         show_action.triggered.connect(self.show)
-        quit_action.triggered.connect(self.close)
+        quit_action.triggered.connect(self.quitApp)
         
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.show()
 
+    def showDebugPanel(self):
+        if self.debug_panel is None:
+            from components.debug_panel import DebugPanel
+            self.debug_panel = DebugPanel(self)
+        self.debug_panel.show()
+        self.debug_panel.raise_()
+
+    def quitApp(self):
+        # Let queued session writes commit before the event loop goes away
+        if self.stats_server is not None:
+            self.stats_server.stop()
+        if self.db is not None:
+            self.db.close()
+        QApplication.instance().quit()
+
     def updateDurationLabel(self, value):
         self.duration_label.setText(f"{value} minutes")
 
@@ -168,19 +253,34 @@ class PomodoroTimer(QMainWindow):
         self.duration_slider.setValue(minutes)
 
     def startTimer(self):
-        if not self.is_active:
-            self.total_time = self.duration_slider.value() * 60
-            self.remaining_time = self.total_time
-            self.db.start_session(self.session_type, self.total_time)
-        self.timer.start(1000)
+        # A paused session resumes; only a fresh start opens a new database row
+        if self.session_id is None:
+            total_time = self.duration_slider.value() * 60
+            try:
+                # Reserving the session id is a short write transaction on this
+                # thread. Without an fsync it takes well under a millisecond,
+                # and it only waits while another process is committing. If
+                # that process holds the lock past busy_timeout, say so instead
+                # of starting a session that can't be recorded.
+                self.session_id = self.ensureDatabase().start_session(self.session_type, total_time)
+            except sqlite3.OperationalError as e:
+                QMessageBox.warning(self, "Database Busy", f"The session couldn't be started: {e}")
+                return
+            self.countdown.start(total_time)
+            self.heartbeat_timer.start()
+        else:
+            self.countdown.resume()
         self.is_active = True
+        self.updateTimer()
 
     def pauseTimer(self):
         self.timer.stop()
+        self.tick_due = None
+        self.countdown.pause()
         self.is_active = False
 
     def stopTimer(self):
-        if self.is_active:
+        if self.session_id is not None:
             response = QMessageBox.question(
                 self,
                 "End Session",
@@ -192,35 +292,53 @@ class PomodoroTimer(QMainWindow):
             )
             
             if response == QMessageBox.StandardButton.Save:
-                self.db.end_session(True)  # Save as completed
+                self.db.end_session(self.session_id, True)  # Save as completed
                 self._resetTimer()
             elif response == QMessageBox.StandardButton.Discard:
-                self.db.end_session(False)  # Save as incomplete
+                self.db.end_session(self.session_id, False)  # Save as incomplete
                 self._resetTimer()
         else:
             self._resetTimer()
 
+    def sendHeartbeat(self):
+        if self.session_id is not None:
+            self.db.heartbeat(self.session_id)
+
     def _resetTimer(self):
         self.timer.stop()
+        self.heartbeat_timer.stop()
+        self.tick_due = None
         self.is_active = False
-        self.remaining_time = 0
+        self.session_id = None
+        self.countdown.reset()
         self.progress_bar.setProgress(0)
         self.progress_bar.setTimerText("00:00")
         self.progress_bar.setGoalText("")
         self.session_goal = ""
 
     def updateTimer(self):
-        if self.remaining_time > 0:
-            self.remaining_time -= 1
-            minutes = self.remaining_time // 60
-            seconds = self.remaining_time % 60
-            self.progress_bar.setTimerText(f"{minutes:02d}:{seconds:02d}")
-            progress = 1 - (self.remaining_time / self.total_time)
-            self.progress_bar.setProgress(progress)
+        # Everything is derived from the deadline, so a late or skipped tick
+        # (heavy load, waking from sleep) just catches up on the next one
+        if self.tick_due is not None:
+            instrumentation.record('tick jitter', (time.perf_counter() - self.tick_due) * 1000)
+            self.tick_due = None
+        remaining = self.countdown.remaining_seconds()
+        minutes = remaining // 60
+        seconds = remaining % 60
+        self.progress_bar.setTimerText(f"{minutes:02d}:{seconds:02d}")
+        self.progress_bar.setProgress(self.countdown.progress())
+
+        if remaining > 0:
+            delay = self.countdown.ms_until_next_tick()
+            self.timer.start(delay)
+            if instrumentation.ENABLED:
+                self.tick_due = time.perf_counter() + delay / 1000
         else:
             self.timer.stop()
+            self.heartbeat_timer.stop()
             self.is_active = False
-            self.db.end_session(True)
+            self.db.end_session(self.session_id, True)
+            self.session_id = None
             self.playTimerEndSound()
             self.forceToFront()
             self.showCompletionDialog()
@@ -276,115 +394,3 @@ class PomodoroTimer(QMainWindow):
         if ok and goal:
             self.session_goal = goal
             self.progress_bar.setGoalText(goal)
-
-    @staticmethod
-    def getStyleSheet():
-        return """
-            * {
-                font-family: 'SF Compact Display Regular';
-            }
-            QMainWindow {
-                background-color: #000000;
-            }
-            QWidget {
-                background-color: #000000;
-                color: #E0E0E0;
-            }
-            QPushButton {
-                font-family: 'SF Compact Display Light';
-                background-color: #1E1E1E;
-                border: 1px solid #E0E0E0;
-                padding: 5px;
-                min-width: 70px;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #2E2E2E;
-            }
-            QPushButton#presetButton {
-                font-family: 'SF Pro Display', Arial;
-                background-color: #2E2E2E;
-                border: 2px solid #4CAF50;
-                border-radius: 15px;
-                padding: 10px;
-                min-width: 100px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton#controlButton {
-                border-radius: 15px;
-                padding: 8px;
-                min-width: 80px;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            QPushButton#controlButton[buttonType="start"] {
-                background-color: #2E2E2E;
-                border: 2px solid #4CAF50;
-                color: #4CAF50;
-            }
-            QPushButton#controlButton[buttonType="start"]:hover {
-                background-color: #4CAF50;
-                color: white;
-            }
-            
-            QPushButton#controlButton[buttonType="pause"] {
-                background-color: #2E2E2E;
-                border: 2px solid #FFA500;
-                color: #FFA500;
-            }
-            QPushButton#controlButton[buttonType="pause"]:hover {
-                background-color: #FFA500;
-                color: white;
-            }
-            
-            QPushButton#controlButton[buttonType="stop"] {
-                background-color: #2E2E2E;
-                border: 2px solid #FF4444;
-                color: #FF4444;
-            }
-            QPushButton#controlButton[buttonType="stop"]:hover {
-                background-color: #FF4444;
-                color: white;
-            }
-            
-            QPushButton#controlButton:pressed {
-                padding: 10px;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #4CAF50;
-                background: #2E2E2E;
-                height: 10px;
-                border-radius: 5px;
-                margin: 2px 0;
-            }
-
-            QSlider::handle:horizontal {
-                background: #4CAF50;
-                border: none;
-                width: 18px;
-                height: 18px;
-                margin: -6px 0;
-                border-radius: 9px;
-            }
-
-            QSlider::handle:horizontal:hover {
-                background: #45a049;
-            }
-
-            QSlider::sub-page:horizontal {
-                background: #4CAF50;
-                border-radius: 5px;
-            }
-
-            QSlider::add-page:horizontal {
-                background: #2E2E2E;
-                border-radius: 5px;
-            }
-
-            QLabel {
-                color: #E0E0E0;
-                font-size: 13px;
-                padding: 0 5px;
-            }
-        """
\ No newline at end of file
@@ -0,0 +1,69 @@
+# startup.py
+# Phased application startup. The phases needed to put the timer window on
+# screen run straight away; the rest (database, sound, tray, stats page) run
+# one per event-loop pass after it is shown, so the window paints and accepts
+# input in between. Each phase's duration is logged to the 'pomodoro.startup'
+# logger and recorded in the instrumentation histograms.
+import logging
+import os
+import time
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QFontDatabase
+import instrumentation
+
+log = logging.getLogger('pomodoro.startup')
+
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'font')
+
+# Font file name -> families, for every font already registered with Qt
+_registered_fonts = {}
+
+
+def register_fonts():
+    # Registers every font in assets/font with Qt, once per process however
+    # often it's called. Returns {file name: [families]} ([] if it failed to load).
+    if not _registered_fonts and os.path.isdir(FONT_DIR):
+        for font_file in sorted(os.listdir(FONT_DIR)):
+            if font_file.endswith(('.ttf', '.otf')):
+                font_id = QFontDatabase.addApplicationFont(os.path.join(FONT_DIR, font_file))
+                _registered_fonts[font_file] = (
+                    QFontDatabase.applicationFontFamilies(font_id) if font_id != -1 else []
+                )
+    return _registered_fonts
+
+
+class StartupPipeline:
+    def __init__(self):
+        self.phases = []   # (name, function, deferred)
+        self.timings = []  # (name, milliseconds), in the order phases ran
+        self.on_finished = None
+        self.ready_at = None  # perf_counter() once the immediate phases are done
+        self._deferred = []
+
+    def add(self, name, function, deferred=False):
+        self.phases.append((name, function, deferred))
+
+    def run(self):
+        # Runs the immediate phases now and schedules the deferred ones
+        for name, function, deferred in self.phases:
+            if deferred:
+                self._deferred.append((name, function))
+            else:
+                self._runPhase(name, function)
+        self.ready_at = time.perf_counter()
+        QTimer.singleShot(0, self._runNextDeferred)
+
+    def _runNextDeferred(self):
+        if self._deferred:
+            self._runPhase(*self._deferred.pop(0))
+            QTimer.singleShot(0, self._runNextDeferred)
+        elif self.on_finished is not None:
+            self.on_finished()
+
+    def _runPhase(self, name, function):
+        started = time.perf_counter()
+        function()
+        elapsed = (time.perf_counter() - started) * 1000
+        self.timings.append((name, elapsed))
+        instrumentation.record(f'startup: {name}', elapsed)
+        log.info("%s: %.1f ms", name, elapsed)
@@ -0,0 +1,286 @@
+# stats_server.py
+# Small JSON stats API for dashboards, so they don't have to open pomodoro.db
+# themselves. Runs inside the app (POMO_STATS_PORT=8765 python main.py) or
+# on its own:
+#
+#   python stats_server.py --port 8765
+#
+#   GET /today                                          get_today_stats()
+#   GET /history?days=7                                 get_historical_data(days)
+#   GET /date?day=2024-03-01                            get_stats_for_date(day)
+#   GET /range?start=2024-01-01&end=2024-03-31&granularity=week
+#                                                       get_stats_range(...)
+#
+# Responses are cached until a session ends (DatabaseManager.stats_version) or
+# something else commits to the database, e.g. the app running in another
+# process (PRAGMA data_version). They carry an ETag, so a polling client that
+# sends If-None-Match mostly gets a bodyless 304.
+import argparse
+import asyncio
+import hashlib
+import json
+import threading
+from datetime import date
+from urllib.parse import urlsplit, parse_qs
+from database.db_manager import DatabaseManager
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+# The cache is dropped wholesale beyond this many distinct URLs
+CACHE_LIMIT = 256
+# Keep-alive connections idle for longer than this are closed
+IDLE_TIMEOUT = 30
+# Longest history or range a request may ask for, in days
+MAX_DAYS = 10 * 366
+
+REASONS = {
+    200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+    405: 'Method Not Allowed', 500: 'Internal Server Error',
+}
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _param(query, name, default=None):
+    values = query.get(name)
+    if not values:
+        if default is None:
+            raise BadRequest(f"missing parameter: {name}")
+        return default
+    return values[0]
+
+
+def _day(query, name):
+    try:
+        return date.fromisoformat(_param(query, name))
+    except ValueError:
+        raise BadRequest(f"{name} must be YYYY-MM-DD")
+
+
+class StatsServer:
+    def __init__(self, db, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.db = db
+        self.host = host
+        self.port = port
+        self.routes = {
+            '/today': self.today,
+            '/history': self.history,
+            '/date': self.for_date,
+            '/range': self.range,
+        }
+        self._cache = {}  # target -> (body, etag)
+        self._cache_version = None
+        self._server = None
+        self._loop = None
+        self._thread = None
+        self._writers = set()  # Open client connections
+        # Counters for checking the cache works
+        self.hits = 0
+        self.misses = 0
+
+    # Endpoints
+
+    def today(self, query):
+        return self.db.get_today_stats()
+
+    def history(self, query):
+        try:
+            days = int(_param(query, 'days', '7'))
+        except ValueError:
+            raise BadRequest("days must be an integer")
+        if not 0 <= days <= MAX_DAYS:
+            raise BadRequest(f"days must be between 0 and {MAX_DAYS}")
+        return self.db.get_historical_data(days)
+
+    def for_date(self, query):
+        return self.db.get_stats_for_date(_day(query, 'day'))
+
+    def range(self, query):
+        granularity = _param(query, 'granularity', 'day')
+        if granularity not in DatabaseManager.BUCKET_EXPRESSIONS:
+            raise BadRequest("granularity must be day, week or month")
+        start, end = _day(query, 'start'), _day(query, 'end')
+        if not 0 <= (end - start).days <= MAX_DAYS:
+            raise BadRequest(f"end must be 0 to {MAX_DAYS} days after start")
+        series = self.db.get_stats_range(start, end, granularity)
+        return [dict(bucket, date=bucket['date'].isoformat()) for bucket in series]
+
+    # Cache
+
+    def _version(self):
+        # Today's date is part of it so /today moves on at midnight
+        data_version = self.db.conn.execute('PRAGMA data_version').fetchone()[0]
+        return (self.db.stats_version, data_version, date.today())
+
+    def respond(self, target):
+        # Returns (status, body, etag) for a GET of target
+        version = self._version()
+        if version != self._cache_version or len(self._cache) >= CACHE_LIMIT:
+            self._cache.clear()
+            self._cache_version = version
+
+        cached = self._cache.get(target)
+        if cached is not None:
+            self.hits += 1
+            return (200, *cached)
+        self.misses += 1
+
+        url = urlsplit(target)
+        handler = self.routes.get(url.path)
+        if handler is None:
+            return 404, json.dumps({'error': f"unknown path: {url.path}"}).encode(), None
+        try:
+            payload = handler(parse_qs(url.query))
+        except BadRequest as e:
+            return 400, json.dumps({'error': str(e)}).encode(), None
+
+        body = json.dumps(payload).encode()
+        etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        self._cache[target] = (body, etag)
+        return 200, body, etag
+
+    # HTTP
+
+    async def handle(self, reader, writer):
+        # Minimal HTTP/1.1: GET only, keep-alive, no request bodies
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode('latin-1').split()
+                if len(parts) != 3:
+                    self._write(writer, 400, json.dumps({'error': "malformed request"}).encode())
+                    break
+                method, target, version = parts
+                if method != 'GET':
+                    status, body, etag = 405, json.dumps({'error': "only GET is supported"}).encode(), None
+                else:
+                    try:
+                        status, body, etag = self.respond(target)
+                    except Exception as e:
+                        # A bug behind one URL shouldn't leave the client without an answer
+                        print(f"Stats request {target} failed: {e!r}")
+                        status, body, etag = 500, json.dumps({'error': "internal error"}).encode(), None
+                if status == 200 and etag is not None and headers.get('if-none-match') == etag:
+                    status, body = 304, b''
+
+                keep_alive = (
+                    version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                ) or headers.get('connection', '').lower() == 'keep-alive'
+                self._write(writer, status, body, etag, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    def _write(writer, status, body, etag=None, keep_alive=False):
+        head = [
+            f"HTTP/1.1 {status} {REASONS[status]}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            "Cache-Control: no-cache",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if etag is not None:
+            head.append(f"ETag: {etag}")
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+
+    async def serve(self):
+        # Runs on the current asyncio loop until cancelled
+        self._server = await asyncio.start_server(self.handle, self.host, self.port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_in_thread(self):
+        # For the Qt app: runs the server on its own loop in a daemon thread.
+        # Raises OSError here if the port can't be bound.
+        started = threading.Event()
+        errors = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._server = self._loop.run_until_complete(
+                    asyncio.start_server(self.handle, self.host, self.port)
+                )
+            except OSError as e:
+                errors.append(e)
+                self._loop.close()
+                return
+            else:
+                # The port actually bound, in case port 0 asked for any free one
+                self.port = self._server.sockets[0].getsockname()[1]
+            finally:
+                started.set()
+            try:
+                self._loop.run_until_complete(self._server.serve_forever())
+            except asyncio.CancelledError:
+                pass
+            finally:
+                # Close idle keep-alive connections and let their handlers return
+                for writer in list(self._writers):
+                    writer.close()
+                pending = asyncio.all_tasks(self._loop)
+                if pending:
+                    self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                self._loop.close()
+
+        self._thread = threading.Thread(target=run, name='pomodoro-stats-server', daemon=True)
+        self._thread.start()
+        started.wait()
+        if errors:
+            self._thread = None
+            raise errors[0]
+
+    def stop(self):
+        # Stops a server started with start_in_thread
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._server.close)
+        self._thread.join(timeout=5)
+        self._thread = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve pomodoro stats as JSON over HTTP")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--db', help="database file (default: $POMO_DB_PATH or pomodoro.db)")
+    args = parser.parse_args(argv)
+
+    # The app writes the database from another process; the day cache and the
+    # response cache both notice its commits through PRAGMA data_version
+    db = DatabaseManager(args.db)
+    server = StatsServer(db, args.host, args.port)
+    print(f"Serving stats on http://{args.host}:{args.port}/today")
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
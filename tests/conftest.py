@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+# The modules live at the repository root, next to main.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    # A fresh database with the day cache off, so every read reaches SQLite
+    manager = DatabaseManager(str(tmp_path / 'pomodoro.db'), day_cache_size=0)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    # One offscreen QApplication for every widget test
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    widgets = pytest.importorskip('PyQt6.QtWidgets')
+    return widgets.QApplication.instance() or widgets.QApplication([])
@@ -0,0 +1,70 @@
+# The Insights metrics agree with the daily_focus rollup they summarize
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+analytics = pytest.importorskip('database.analytics')
+
+TODAY = date.today()
+# Days ago with focus: a 3-day current streak, a 5-day longest one and a stray day
+FOCUS_DAYS = [0, 1, 2, 10, 11, 12, 13, 14, 20, 45]
+
+
+def session(day, hour, minutes, session_type='focus', completed=1):
+    start = int(datetime.combine(day, time(hour)).timestamp())
+    return (None, start, start + minutes * 60, minutes * 60, session_type, completed,
+            day.isoformat(), start + minutes * 60)
+
+
+@pytest.fixture
+def arrays(db):
+    rows = []
+    for days_ago in FOCUS_DAYS:
+        day = TODAY - timedelta(days=days_ago)
+        rows += [session(day, 8 + days_ago % 5, 25 + days_ago), session(day, 14, 50),
+                 session(day, 15, 5, 'break'), session(day, 16, 30, completed=0)]
+    rows.append(session(TODAY - timedelta(days=5), 9, 10, 'break'))  # Breaks don't make a streak
+    db.import_sessions([rows])
+    return analytics.SessionArrays.load(db)
+
+
+@pytest.fixture
+def rollup(db, arrays):
+    # Focus minutes per day, as the stats views see them
+    return {date.fromisoformat(day): minutes for day, minutes in db.conn.execute('''
+        SELECT day, total_minutes FROM daily_focus
+        WHERE session_type = 'focus' AND completed_sessions > 0
+    ''')}
+
+
+def test_streaks(arrays, rollup):
+    active = {(TODAY - day).days for day in rollup}
+    assert active == set(FOCUS_DAYS)
+    assert analytics.streaks(arrays, TODAY) == {
+        'current': 3, 'longest': 5, 'longest_end': TODAY - timedelta(days=10),
+    }
+    # Nothing yet today still continues yesterday's streak
+    assert analytics.streaks(arrays, TODAY + timedelta(days=1))['current'] == 3
+    assert analytics.streaks(arrays, TODAY + timedelta(days=2))['current'] == 0
+
+
+def test_heatmap(arrays, rollup):
+    cells = analytics.heatmap(arrays)
+    assert cells.shape == (7, 24)
+    by_weekday = [0] * 7
+    for day, minutes in rollup.items():
+        by_weekday[day.weekday()] += minutes
+    assert cells.sum(axis=1).tolist() == by_weekday
+    assert cells[:, 14].sum() == 50 * len(FOCUS_DAYS)
+    assert cells[:, 15:].sum() == 0  # Breaks and abandoned sessions
+
+
+def test_rolling_averages(arrays, rollup):
+    rolling = analytics.rolling_averages(arrays, days=30, today=TODAY)
+    assert rolling['days'] == [TODAY - timedelta(days=29 - offset) for offset in range(30)]
+    for window in analytics.ROLLING_WINDOWS:
+        expected = [
+            sum(rollup.get(day - timedelta(days=back), 0) for back in range(window)) / window
+            for day in rolling['days']
+        ]
+        assert rolling[window].tolist() == pytest.approx(expected)
@@ -0,0 +1,79 @@
+# Archived sessions stay readable through every path that reads raw sessions
+import os
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from database import archive
+from database.db_manager import DatabaseManager
+
+TODAY = date.today()
+# Days in two different archive years, and one that stays in pomodoro.db
+DAYS = [TODAY - timedelta(days=800), TODAY - timedelta(days=400), TODAY - timedelta(days=1)]
+
+
+def session(day, hour, minutes, session_type='focus', completed=1):
+    start = int(datetime.combine(day, time(hour)).timestamp())
+    return (None, start, start + minutes * 60, minutes * 60, session_type, completed,
+            day.isoformat(), start + minutes * 60)
+
+
+def history():
+    rows = []
+    for day in DAYS:
+        rows += [session(day, 9, 25), session(day, 10, 25), session(day, 11, 5, 'break'),
+                 session(day, 12, 10, completed=0)]
+    return rows
+
+
+def rollup(db):
+    return db.conn.execute('''
+        SELECT day, session_type, completed_sessions, total_minutes
+        FROM daily_focus ORDER BY day, session_type
+    ''').fetchall()
+
+
+def session_count(db):
+    return sum(len(rows) for rows in db.iter_sessions(chunk_size=3))
+
+
+@pytest.fixture
+def archived(db):
+    db.import_sessions([history()])
+    before = rollup(db)
+    assert db.archive_sessions(days=30) == 8
+    return before
+
+
+def test_archived_sessions_are_still_read(db, archived):
+    assert archive.archived_years(db.conn) == [DAYS[0].year, DAYS[1].year]
+    assert db.conn.execute('SELECT COUNT(*) FROM main.sessions').fetchone()[0] == 4
+    assert session_count(db) == 12
+
+    assert db.rebuild_daily_focus() == len(archived)
+    assert rollup(db) == archived
+
+
+def test_archived_sessions_reach_the_insights(db, archived):
+    analytics = pytest.importorskip('database.analytics')
+    arrays = analytics.SessionArrays.load(db)
+    assert len(arrays) == 12
+
+    first, last = analytics.day_number(DAYS[0]), analytics.day_number(TODAY)
+    daily = analytics.daily_focus(arrays, first, last)
+    expected = {analytics.day_number(date.fromisoformat(day)) - first: minutes
+                for day, session_type, _, minutes in archived if session_type == 'focus'}
+    assert {offset: minutes for offset, minutes in enumerate(daily) if minutes} == expected
+
+
+def test_missing_archive_is_skipped(db, archived):
+    os.remove(archive.archive_path(db.path, DAYS[0].year))
+    reopened = DatabaseManager(db.path, day_cache_size=0)
+    try:
+        assert session_count(reopened) == 8
+        analytics = pytest.importorskip('database.analytics')
+        assert len(analytics.SessionArrays.load(reopened)) == 8
+        # The stats don't need the archives at all
+        assert reopened.get_stats_range(DAYS[0], DAYS[0])[0]['total_minutes'] == 50
+    finally:
+        reopened.close()
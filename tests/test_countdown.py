@@ -0,0 +1,118 @@
+import pytest
+
+from components.countdown import Countdown
+
+
+class FakeClock:
+    # Stands in for the monotonic clock; time only moves when advance() is called
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def countdown(clock):
+    return Countdown(clock)
+
+
+def test_remaining_seconds_rounds_up(countdown, clock):
+    countdown.start(25 * 60)
+    assert countdown.remaining_seconds() == 1500  # 25:00 shown at the start
+
+    clock.advance(0.25)
+    assert countdown.remaining_seconds() == 1500  # Still 25:00 until a full second has passed
+    clock.advance(0.75)
+    assert countdown.remaining_seconds() == 1499
+
+    clock.advance(1498.5)
+    assert countdown.remaining_seconds() == 1  # 00:00 only at the very end
+    clock.advance(0.5)
+    assert countdown.remaining_seconds() == 0
+    assert countdown.is_finished()
+
+
+def test_pause_stops_the_clock_and_resume_continues(countdown, clock):
+    countdown.start(60)
+    clock.advance(10.5)
+    countdown.pause()
+    assert not countdown.is_running
+    assert countdown.deadline is None
+
+    clock.advance(300)  # Paused time doesn't count
+    assert countdown.remaining() == 49.5
+    assert countdown.elapsed() == 10.5
+
+    countdown.resume()
+    assert countdown.deadline == clock.now + 49.5
+    clock.advance(9.5)
+    assert countdown.remaining_seconds() == 40
+
+    # Pausing or resuming twice changes nothing
+    countdown.resume()
+    assert countdown.remaining() == 40
+    countdown.pause()
+    countdown.pause()
+    assert countdown.remaining() == 40
+
+
+def test_jump_past_the_deadline_finishes(countdown, clock):
+    countdown.start(25 * 60)
+    clock.advance(5)
+    clock.advance(3 * 3600)  # The machine slept through the rest of the session
+
+    assert countdown.remaining() == 0
+    assert countdown.remaining_seconds() == 0
+    assert countdown.progress() == 1
+    assert countdown.elapsed() == 25 * 60
+    assert countdown.is_finished()
+
+
+def test_ticks_align_to_second_boundaries(countdown, clock):
+    slack = Countdown.TICK_SLACK_MS
+    countdown.start(10)
+    assert countdown.ms_until_next_tick() == 1000 + slack  # Exactly on a boundary: one full second
+
+    clock.advance(0.25)
+    assert countdown.ms_until_next_tick() == 750 + slack
+
+    # A tick that fired late still wakes up at the next boundary, not a second after it
+    clock.advance(1.5)
+    assert countdown.ms_until_next_tick() == 250 + slack
+    clock.advance(0.25)
+    assert countdown.remaining_seconds() == 8
+    assert countdown.ms_until_next_tick() == 1000 + slack
+
+
+def test_start_after_a_finished_run(countdown, clock):
+    countdown.start(5)
+    clock.advance(8)
+    assert countdown.is_finished()
+
+    countdown.start(30)
+    assert countdown.is_running
+    assert not countdown.is_finished()
+    assert countdown.total_time == 30
+    assert countdown.remaining() == 30
+    assert countdown.progress() == 0
+    clock.advance(1)
+    assert countdown.remaining_seconds() == 29
+
+
+def test_reset_clears_the_run(countdown, clock):
+    countdown.start(30)
+    clock.advance(1)
+    countdown.reset()
+    assert not countdown.is_running
+    assert countdown.remaining() == 0
+    assert countdown.progress() == 0
+    assert not countdown.is_finished()
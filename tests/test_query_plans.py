@@ -0,0 +1,80 @@
+# The stats and session lookups must search an index (or a primary key),
+# never scan a table, whatever the size of the history.
+from datetime import date
+
+import pytest
+
+from database.db_manager import DatabaseManager
+
+STATEMENTS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE')
+
+
+def query_plans(db, action):
+    # EXPLAIN QUERY PLAN of every statement action runs on the caller's connection
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        action()
+    finally:
+        db.conn.set_trace_callback(None)
+    return {
+        statement: [row[3] for row in db.conn.execute(f'EXPLAIN QUERY PLAN {statement}')]
+        for statement in statements
+        if statement.split()[0].upper() in STATEMENTS
+    }
+
+
+def assert_searches(plans):
+    assert plans
+    for statement, details in plans.items():
+        for detail in details:
+            if detail.startswith('USE TEMP B-TREE'):
+                continue  # Grouping the few rows the search found
+            assert detail.startswith('SEARCH') and ' USING ' in detail, (statement, details)
+
+
+@pytest.mark.parametrize('read', [
+    lambda db: db.get_today_stats(),
+    lambda db: db.get_stats_for_date(date(2026, 1, 1)),
+    lambda db: db.get_historical_data(30),
+    lambda db: db.get_stats_range(date(2025, 1, 1), date(2025, 12, 31), 'day'),
+    lambda db: db.get_stats_range(date(2025, 1, 1), date(2025, 12, 31), 'week'),
+    lambda db: db.get_stats_range(date(2025, 1, 1), date(2025, 12, 31), 'month'),
+], ids=['today', 'date', 'history', 'range-day', 'range-week', 'range-month'])
+def test_stats_queries_search_the_rollup(db, read):
+    plans = query_plans(db, lambda: read(db))
+    assert_searches(plans)
+    assert all('daily_focus USING PRIMARY KEY' in ' '.join(details) for details in plans.values())
+
+
+def test_end_session_searches_by_primary_key(db):
+    session_id = db.start_session('focus', 25 * 60)
+    db.flush()
+    cursor = db.conn.cursor()
+    plans = query_plans(db, lambda: DatabaseManager._write_end_session(cursor, session_id, True, 10 ** 10))
+    db.conn.rollback()
+    assert len(plans) == 2  # The update and the rollup fold
+    assert_searches(plans)
+
+
+def test_heartbeat_searches_by_primary_key(db):
+    cursor = db.conn.cursor()
+    plans = query_plans(db, lambda: DatabaseManager._write_heartbeat(cursor, 1, 10 ** 10))
+    db.conn.rollback()
+    assert_searches(plans)
+
+
+def test_orphan_recovery_reads_only_open_sessions(db):
+    cursor = db.conn.cursor()
+    plans = query_plans(db, lambda: DatabaseManager._write_recover_orphans(cursor, 10 ** 10))
+    db.conn.rollback()
+    for details in plans.values():
+        assert 'USING INDEX idx_sessions_open' in ' '.join(details)
+
+
+def test_view_db_filters_search_start_time(db):
+    view_db = pytest.importorskip('view_db')
+    args = view_db.parse_args(['--since', '2025-01-01', '--until', '2025-01-31', '--type', 'focus'])
+    where, params = view_db.build_filters(args)
+    details = [row[3] for row in db.conn.execute(f'EXPLAIN QUERY PLAN SELECT * FROM sessions {where}', params)]
+    assert any(detail.startswith('SEARCH sessions USING INDEX idx_sessions_start_time') for detail in details)
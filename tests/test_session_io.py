@@ -0,0 +1,55 @@
+# Exports round-trip, and importing one twice adds nothing the second time
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from database import session_io
+from database.db_manager import DatabaseManager
+
+
+def rollup(db):
+    return db.conn.execute('''
+        SELECT day, session_type, completed_sessions, total_minutes
+        FROM daily_focus ORDER BY day, session_type
+    ''').fetchall()
+
+
+def session_count(db):
+    return db.conn.execute('SELECT COUNT(*) FROM sessions').fetchone()[0]
+
+
+@pytest.fixture
+def history(db):
+    # Three days of focus and break sessions, one abandoned and one still open
+    for offset in range(3):
+        day = date.today() - timedelta(days=offset)
+        for hour, session_type, completed in ((9, 'focus', True), (10, 'break', True), (11, 'focus', False)):
+            session_id = db.start_session(session_type, 25 * 60)
+            db.flush()
+            start = int(datetime.combine(day, time(hour)).timestamp())
+            db.conn.execute('UPDATE sessions SET start_time = ?, day = ? WHERE session_id = ?',
+                            (start, day.isoformat(), session_id))
+            db.conn.commit()
+            db.end_session(session_id, completed)
+    db.start_session('focus', 25 * 60)
+    db.rebuild_daily_focus()
+    return db
+
+
+@pytest.mark.parametrize('extension', ['csv', 'ndjson', 'pomo'])
+def test_importing_an_export_twice(history, tmp_path, extension):
+    path = str(tmp_path / f'sessions.{extension}')
+    assert session_io.export_sessions(history, path, chunk_size=4) == 10
+
+    target = DatabaseManager(str(tmp_path / 'target.db'), day_cache_size=0)
+    try:
+        assert session_io.import_sessions(target, path, chunk_size=4) == (10, 10)
+        sessions, daily_focus = session_count(target), rollup(target)
+        assert sessions == 10
+        assert daily_focus == rollup(history)
+
+        assert session_io.import_sessions(target, path, chunk_size=4) == (10, 0)
+        assert session_count(target) == sessions
+        assert rollup(target) == daily_focus
+    finally:
+        target.close()
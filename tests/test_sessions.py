@@ -0,0 +1,123 @@
+# Two managers on one file, as when headless.py or an import runs beside the app
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'pomodoro.db')
+
+
+@pytest.fixture
+def managers(path):
+    opened = []
+
+    def open_manager(**options):
+        manager = DatabaseManager(path, **options)
+        opened.append(manager)
+        return manager
+    yield open_manager
+    for manager in opened:
+        manager.close()
+
+
+def set_times(db, session_id, start_time, heartbeat):
+    db.conn.execute('UPDATE sessions SET start_time = ?, heartbeat = ? WHERE session_id = ?',
+                    (start_time, heartbeat, session_id))
+    db.conn.commit()
+
+
+def session_row(db, session_id):
+    return db.conn.execute(
+        'SELECT end_time, completed_status FROM sessions WHERE session_id = ?', (session_id,)
+    ).fetchone()
+
+
+def test_managers_hand_out_distinct_ids(managers):
+    app, headless = managers(), managers()
+    ids = [app.start_session('focus', 60), headless.start_session('focus', 60),
+           *app.start_sessions([('focus', 60), ('break', 60)]), headless.start_session('break', 60)]
+    assert len(set(ids)) == len(ids)
+
+
+def test_recovery_leaves_sessions_that_still_heartbeat(managers):
+    owner = managers()
+    session_id = owner.start_session('focus', 25 * 60)
+    owner.flush()
+    # Running for ten minutes, paused, and still reporting in
+    now = int(time.time())
+    set_times(owner, session_id, now - 600, now - DatabaseManager.HEARTBEAT_SECONDS)
+
+    other = managers()
+    other.recover_orphans()
+    other.flush()
+    assert session_row(other, session_id) == (None, None)
+
+    owner.end_session(session_id, False)  # Discard still works
+    owner.flush()
+    assert session_row(other, session_id)[1] == 0
+
+
+def test_recovery_closes_silent_sessions_at_their_heartbeat(managers):
+    owner = managers()
+    session_id = owner.start_session('focus', 25 * 60)
+    owner.flush()
+    now = int(time.time())
+    set_times(owner, session_id, now - 900, now - 300)
+
+    other = managers()
+    other.recover_orphans()
+    other.flush()
+    assert session_row(other, session_id) == (now - 300, 1)
+    assert other.get_today_stats() == {'completed_sessions': 1, 'total_minutes': 10}
+
+
+def test_ending_a_recovered_session_changes_no_stats(managers):
+    owner = managers()
+    session_id = owner.start_session('focus', 25 * 60)
+    owner.flush()
+    now = int(time.time())
+    set_times(owner, session_id, now - 900, now - 300)
+    other = managers()
+    other.recover_orphans()
+    other.flush()
+
+    assert owner.get_today_stats() == {'completed_sessions': 1, 'total_minutes': 10}
+    # The owner saves it after all; the row was already closed, so the day
+    # cache must not count it a second time
+    owner.end_session(session_id, True)
+    owner.flush()
+    assert owner.get_today_stats() == {'completed_sessions': 1, 'total_minutes': 10}
+    assert session_row(owner, session_id) == (now - 300, 1)
+
+
+def test_day_cache_sees_other_managers_commits(managers):
+    app = managers()
+    today = date.today()
+    assert app.get_today_stats()['completed_sessions'] == 0
+    assert app.get_stats_range(today - timedelta(days=6), today)[-1]['completed_sessions'] == 0
+
+    other = managers(day_cache_size=0)
+    session_id = other.start_session('focus', 60)
+    other.end_session(session_id, True)
+    other.flush()
+
+    assert app.get_today_stats()['completed_sessions'] == 1
+    assert app.get_stats_range(today - timedelta(days=6), today)[-1]['completed_sessions'] == 1
+
+
+def test_own_writes_keep_the_day_cache(managers):
+    app = managers()
+    app.get_historical_data(30)
+    cached = app.cache_info()['size']
+    session_id = app.start_session('focus', 60)
+    app.heartbeat(session_id)
+    app.end_session(session_id, True)
+    app.flush()
+
+    assert app.get_today_stats()['completed_sessions'] == 1
+    assert app.cache_info()['size'] == cached
@@ -0,0 +1,79 @@
+# The range dialog and its chart are reused across opens rather than piling up
+import gc
+import threading
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from benchmarks.chart_backends import _rss_mb
+
+OPENS = 30
+MAX_GROWTH_MB = 10.0
+
+
+def add_session(db, day, minutes):
+    start = int(datetime.combine(day, time(9)).timestamp()) + minutes
+    db.import_sessions([[(None, start, start + minutes * 60, minutes * 60, 'focus', 1,
+                          day.isoformat(), start + minutes * 60)]])
+
+
+@pytest.mark.parametrize('backend', ['native', 'matplotlib'])
+def test_range_dialog_is_reused(qapp, db, monkeypatch, backend):
+    if backend == 'matplotlib':
+        pytest.importorskip('matplotlib')
+        from matplotlib import _pylab_helpers
+    monkeypatch.setenv('POMO_CHART_BACKEND', backend)
+    from components.stats_widget import StatsWidget
+    stats = StatsWidget(db)
+    views = [stats.show_weekly_stats, stats.show_monthly_stats, stats.show_yearly_stats]
+    monkeypatch.setattr(stats, 'show_range_stats', stats.updateRangeDialog)
+    opened = []
+
+    def open_views(count):
+        for index in range(count):
+            # Different data every time, so the bars change between opens
+            add_session(db, date.today() - timedelta(days=index * 7 % 360), 5 + index % 50)
+            views[index % len(views)]()
+            dialog = stats.range_dialog
+            dialog.show()
+            qapp.processEvents()
+            dialog.hide()
+            qapp.processEvents()
+            opened.append(dialog)
+
+    open_views(len(views) * 3)  # Warm up fonts, caches and each view's artists
+    gc.collect()
+    baseline = _rss_mb()
+    open_views(OPENS)
+    gc.collect()
+
+    assert all(dialog is opened[0] for dialog in opened)
+    if backend == 'matplotlib':
+        assert not _pylab_helpers.Gcf.get_all_fig_managers()
+    assert _rss_mb() - baseline < MAX_GROWTH_MB
+
+
+def test_insights_load_off_the_gui_thread(qapp, db, monkeypatch):
+    analytics = pytest.importorskip('database.analytics')
+    from components.stats_widget import StatsWidget
+    add_session(db, date.today(), 25)
+    loaded_on = []
+    load = analytics.SessionArrays.load
+
+    def recording_load(manager):
+        loaded_on.append(threading.current_thread())
+        return load(manager)
+    monkeypatch.setattr(analytics.SessionArrays, 'load', recording_load)
+
+    stats = StatsWidget(db)
+    dialog = stats.updateInsightsDialog()
+    assert stats.insights_label.text() == "Reading session history…"
+    # Whether this lands before or after the loader reads, the refresh on arrival sees it
+    add_session(db, date.today() - timedelta(days=1), 25)
+    stats.session_loader.wait()
+    qapp.processEvents()
+
+    assert loaded_on and loaded_on[0] is not threading.main_thread()
+    assert stats.insights_label.text().startswith("🔥 Streak: 2 days")
+    assert stats.updateInsightsDialog() is dialog
+    assert len(loaded_on) == 1  # Later opens refresh on the GUI thread
@@ -0,0 +1,133 @@
+import http.client
+import json
+
+import pytest
+
+from database.db_manager import DatabaseManager
+from stats_server import MAX_DAYS, StatsServer
+
+
+@pytest.fixture
+def server(db):
+    server = StatsServer(db, port=0)
+    server.start_in_thread()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(server):
+    connection = http.client.HTTPConnection(server.host, server.port, timeout=5)
+    yield connection
+    connection.close()
+
+
+def get(client, target, etag=None):
+    # (status, headers, parsed body) over the kept-alive connection
+    client.request('GET', target, headers={'If-None-Match': etag} if etag else {})
+    response = client.getresponse()
+    body = response.read()
+    return response.status, response, json.loads(body) if body else None
+
+
+def test_etag_revalidation(client, server):
+    status, response, body = get(client, '/today')
+    assert status == 200
+    assert body == {'completed_sessions': 0, 'total_minutes': 0}
+    etag = response.getheader('ETag')
+    assert etag
+
+    status, response, body = get(client, '/today', etag)
+    assert status == 304
+    assert body is None
+    assert response.getheader('ETag') == etag
+    assert server.hits == 1
+
+
+def test_cache_invalidated_when_a_session_ends(client, db):
+    _, response, _ = get(client, '/today')
+    etag = response.getheader('ETag')
+
+    session_id = db.start_session('focus', 25 * 60)
+    db.end_session(session_id, True)
+
+    status, response, body = get(client, '/today', etag)
+    assert status == 200
+    assert body['completed_sessions'] == 1
+    assert response.getheader('ETag') != etag
+
+
+@pytest.mark.parametrize('target', [
+    '/history?days=abc',
+    '/history?days=-1',
+    f'/history?days={MAX_DAYS + 1}',
+    '/history?days=99999999',
+    '/date',
+    '/date?day=2024-13-01',
+    '/range?start=2024-01-01',
+    '/range?start=2024-01-01&end=2024-02-01&granularity=year',
+    '/range?start=2026-01-01&end=9999-12-31&granularity=month',
+    '/range?start=0001-01-01&end=9999-12-31',
+    '/range?start=2024-02-01&end=2024-01-01',
+])
+def test_bad_requests(client, target):
+    status, _, body = get(client, target)
+    assert status == 400
+    assert 'error' in body
+
+
+def test_unknown_path(client):
+    status, _, body = get(client, '/tomorrow')
+    assert status == 404
+    assert 'error' in body
+
+
+def test_range(client):
+    status, _, body = get(client, '/range?start=2024-01-01&end=2024-03-31&granularity=month')
+    assert status == 200
+    assert [bucket['date'] for bucket in body] == ['2024-01-01', '2024-02-01', '2024-03-01']
+
+
+@pytest.mark.parametrize('target, buckets', [
+    ('/range?start=9999-12-01&end=9999-12-31&granularity=month', ['9999-12-01']),
+    ('/range?start=9999-12-25&end=9999-12-31&granularity=week', ['9999-12-20', '9999-12-27']),
+    ('/range?start=9999-12-31&end=9999-12-31', ['9999-12-31']),
+    ('/range?start=0001-01-01&end=0001-01-08&granularity=week', ['0001-01-01', '0001-01-08']),
+])
+def test_range_at_the_ends_of_the_calendar(client, target, buckets):
+    status, _, body = get(client, target)
+    assert status == 200
+    assert [bucket['date'] for bucket in body] == buckets
+
+
+def test_handler_error_is_a_500_and_the_connection_survives(client, db, monkeypatch):
+    def broken():
+        raise RuntimeError("boom")
+    monkeypatch.setattr(db, 'get_today_stats', broken)
+
+    status, _, body = get(client, '/today')
+    assert status == 500
+    assert 'error' in body
+
+    status, _, _ = get(client, '/history?days=7')
+    assert status == 200
+
+
+def test_today_follows_commits_from_another_process(tmp_path):
+    # The app's manager keeps its day cache; the session is ended by another one
+    path = str(tmp_path / 'shared.db')
+    app, other = DatabaseManager(path), DatabaseManager(path, day_cache_size=0)
+    server = StatsServer(app, port=0)
+    server.start_in_thread()
+    client = http.client.HTTPConnection(server.host, server.port, timeout=5)
+    try:
+        assert get(client, '/today')[2]['completed_sessions'] == 0
+        session_id = other.start_session('focus', 60)
+        other.end_session(session_id, True)
+        other.flush()
+        assert get(client, '/today')[2]['completed_sessions'] == 1
+    finally:
+        client.close()
+        server.stop()
+        other.close()
+        app.close()
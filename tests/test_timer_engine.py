@@ -0,0 +1,51 @@
+from components.timer_engine import TimerEngine
+from database.db_manager import DatabaseManager
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingDatabase:
+    # The DatabaseManager calls TimerEngine makes, recorded instead of written
+    def __init__(self):
+        self.next_id = 1
+        self.heartbeats = []
+        self.ends = []
+
+    def start_sessions(self, sessions):
+        ids = list(range(self.next_id, self.next_id + len(sessions)))
+        self.next_id += len(sessions)
+        return ids
+
+    def heartbeat_sessions(self, session_ids):
+        self.heartbeats.append(sorted(session_ids))
+
+    def end_sessions(self, sessions):
+        self.ends.extend(sessions)
+
+
+def test_paused_timers_keep_heartbeating():
+    clock = FakeClock()
+    db = RecordingDatabase()
+    engine = TimerEngine(db, clock)
+    engine.start('alice', 25 * 60)
+    engine.start('bob', 25 * 60)
+    engine.poll()
+    engine.pause('bob')
+
+    clock.now += DatabaseManager.HEARTBEAT_SECONDS
+    assert engine.next_wakeup() == clock.now
+    engine.poll()
+    assert db.heartbeats == [[1, 2]]
+
+    engine.pause('alice')
+    clock.now += DatabaseManager.HEARTBEAT_SECONDS
+    assert engine.next_wakeup() == clock.now  # Still wakes with every timer paused
+    engine.poll()
+    assert db.heartbeats == [[1, 2], [1, 2]]
+    assert db.ends == []
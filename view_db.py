@@ -1,26 +1,80 @@
 # view_db.py
-import sqlite3
+import os
+import sys
+import argparse
 from tabulate import tabulate
-from datetime import datetime
+from datetime import datetime, timedelta
+from database.connection import connect, database_path
+from database import archive
 
-def view_sessions():
-    conn = sqlite3.connect('pomodoro.db')
-    cursor = conn.cursor()
-    
+# Rows pulled from SQLite per fetchmany() call while streaming
+PAGE_SIZE = 500
+
+# Fixed column widths so rows can be printed as they stream in, without first
+# loading the whole result to size the table
+COLUMNS = [
+    ('session_id', 10),
+    ('start_time', 19),
+    ('end_time', 19),
+    ('duration_minutes', 16),
+    ('session_type', 12),
+    ('completed_status', 16),
+]
+# What view_sessions reads from the sessions table and its archives
+SESSION_COLUMNS = ['session_id', 'start_time', 'end_time', 'duration', 'session_type', 'completed_status']
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Show pomodoro session history")
+    parser.add_argument('--db', help="database file (default: $POMO_DB_PATH or pomodoro.db)")
+    parser.add_argument('--since', help="first day to include (YYYY-MM-DD)")
+    parser.add_argument('--until', help="last day to include (YYYY-MM-DD)")
+    parser.add_argument('--type', dest='session_type', help="only this session type, e.g. focus or break")
+    parser.add_argument('--limit', type=int, help="show at most this many sessions")
+    parser.add_argument('--offset', type=int, default=0, help="skip this many sessions first")
+    parser.add_argument('--summary', action='store_true',
+                        help="per-month totals from the daily rollup instead of raw sessions")
+    return parser.parse_args(argv)
+
+def day_start_epoch(day):
+    return int(datetime.strptime(day, '%Y-%m-%d').timestamp())
+
+def build_filters(args):
+    # Filters are pushed into SQL; start_time bounds use the start_time index
+    clauses, params = [], []
+    if args.since:
+        clauses.append('start_time >= ?')
+        params.append(day_start_epoch(args.since))
+    if args.until:
+        until = datetime.strptime(args.until, '%Y-%m-%d') + timedelta(days=1)
+        clauses.append('start_time < ?')
+        params.append(int(until.timestamp()))
+    if args.session_type:
+        clauses.append('session_type = ?')
+        params.append(args.session_type)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    return where, params
+
+def format_row(row):
+    return ' | '.join(
+        ('' if value is None else str(value)).ljust(width)
+        for value, (_, width) in zip(row, COLUMNS)
+    )
+
+def view_today(cursor):
     print("\n=== Today's sessions check ===")
     today = datetime.now().date().strftime('%Y-%m-%d')
     cursor.execute('''
-        SELECT 
+        SELECT
             session_id,
-            start_time,
-            end_time,
+            datetime(start_time, 'unixepoch', 'localtime'),
+            datetime(end_time, 'unixepoch', 'localtime'),
             duration/60 as duration_minutes,
             session_type,
             completed_status
         FROM sessions
-        WHERE date(start_time) = ?
+        WHERE day = ?
     ''', (today,))
-    
+
     today_rows = cursor.fetchall()
     if today_rows:
         print(f"Found {len(today_rows)} sessions for today ({today})")
@@ -28,26 +82,102 @@ def view_sessions():
             print(f"Session {row[0]}: Start={row[1]}, End={row[2]}, Duration={row[3]}min, Type={row[4]}, Completed={row[5]}")
     else:
         print(f"No sessions found for today ({today})")
-    
+
+def view_sessions(cursor, args):
     print("\n=== All sessions ===")
-    cursor.execute('''
-        SELECT 
+    where, params = build_filters(args)
+    # Archives overlapping --since/--until are attached (read-only) and read too
+    try:
+        source = archive.sessions_source(cursor.connection, database_path(args.db), SESSION_COLUMNS,
+                                         args.since, args.until, read_only=True)
+    except ValueError as error:
+        sys.exit(f"{error}; narrow it with --since/--until")
+    cursor.execute(f'''
+        SELECT
             session_id,
-            datetime(start_time) as start_time,
-            datetime(end_time) as end_time,
+            datetime(start_time, 'unixepoch', 'localtime') as start_time,
+            datetime(end_time, 'unixepoch', 'localtime') as end_time,
             duration/60 as duration_minutes,
             session_type,
             completed_status
-        FROM sessions
-        ORDER BY start_time DESC
-    ''')
-    
-    columns = [description[0] for description in cursor.description]
+        FROM {source}
+        {where}
+        ORDER BY sessions.start_time DESC
+        LIMIT ? OFFSET ?
+    ''', (*params, args.limit if args.limit is not None else -1, args.offset))
+
+    header = format_row([name for name, _ in COLUMNS])
+    print(header)
+    print('-' * len(header))
+
+    # Stream the result a page at a time instead of fetchall()
+    shown = 0
+    while True:
+        rows = cursor.fetchmany(PAGE_SIZE)
+        if not rows:
+            break
+        print('\n'.join(format_row(row) for row in rows))
+        sys.stdout.flush()
+        shown += len(rows)
+    print(f"({shown} sessions)")
+
+def view_summary(cursor, args):
+    # Reads the daily_focus rollup (one row per day and type), never the raw sessions
+    print("\n=== Summary (completed sessions) ===")
+    clauses, params = [], []
+    if args.since:
+        clauses.append('day >= ?')
+        params.append(args.since)
+    if args.until:
+        clauses.append('day <= ?')
+        params.append(args.until)
+    if args.session_type:
+        clauses.append('session_type = ?')
+        params.append(args.session_type)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    cursor.execute(f'''
+        SELECT
+            strftime('%Y-%m', day) as month,
+            session_type,
+            SUM(completed_sessions) as sessions,
+            SUM(total_minutes) as minutes
+        FROM daily_focus
+        {where}
+        GROUP BY month, session_type
+        ORDER BY month DESC, session_type
+    ''', params)
     rows = cursor.fetchall()
-    
+    columns = [description[0] for description in cursor.description]
     print(tabulate(rows, headers=columns, tablefmt='grid'))
-    
+
+    totals = {}
+    for _, session_type, sessions, minutes in rows:
+        count, total = totals.get(session_type, (0, 0))
+        totals[session_type] = (count + sessions, total + minutes)
+    for session_type, (sessions, minutes) in sorted(totals.items()):
+        print(f"Total {session_type}: {sessions} sessions, {minutes // 60}h{minutes % 60:02d}m")
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not os.path.exists(database_path(args.db)):
+        sys.exit(f"No database at {database_path(args.db)}")
+    # Read-only, so viewing history never blocks (or is blocked by) the running app
+    conn = connect(args.db, read_only=True)
+    cursor = conn.cursor()
+
+    if args.summary:
+        view_summary(cursor, args)
+    else:
+        # The today check only makes sense for the plain, unfiltered listing
+        if not (args.since or args.until or args.session_type or args.limit or args.offset):
+            view_today(cursor)
+        view_sessions(cursor, args)
+
     conn.close()
 
 if __name__ == '__main__':
-    view_sessions()
\ No newline at end of file
+    try:
+        main()
+    except BrokenPipeError:
+        # Output was piped into something like `head` that stopped reading early
+        sys.stdout = None